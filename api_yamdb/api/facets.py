@@ -0,0 +1,44 @@
+from django.db.models import Count, F
+
+from reviews.constants import YEAR_BUCKET_SIZE
+from reviews.models import Category, Genre, Title
+
+
+def build_title_facets(titles):
+    """
+    Считает количество произведений в каждом жанре, категории
+    и десятилетии для переданной выборки произведений.
+    На каждый фасет выполняется один сгруппированный запрос.
+    """
+    title_ids = titles.order_by().values('pk')
+    genres = (
+        Genre.objects.filter(title__in=title_ids)
+        .values('slug', 'name')
+        .annotate(count=Count('title', distinct=True))
+        .order_by('name')
+    )
+    categories = (
+        Category.objects.filter(titles__in=title_ids)
+        .values('slug', 'name')
+        .annotate(count=Count('titles', distinct=True))
+        .order_by('name')
+    )
+    years = (
+        Title.objects.filter(pk__in=title_ids)
+        .annotate(year_from=F('year') / YEAR_BUCKET_SIZE * YEAR_BUCKET_SIZE)
+        .values('year_from')
+        .annotate(count=Count('pk'))
+        .order_by('year_from')
+    )
+    return {
+        'genre': list(genres),
+        'category': list(categories),
+        'year': [
+            {
+                'year_from': bucket['year_from'],
+                'year_to': bucket['year_from'] + YEAR_BUCKET_SIZE - 1,
+                'count': bucket['count'],
+            }
+            for bucket in years
+        ],
+    }
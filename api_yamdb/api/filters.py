@@ -1,12 +1,66 @@
+from django.db.models import Case, IntegerField, Q, When
 from django_filters.rest_framework import CharFilter, FilterSet
+from rest_framework.filters import BaseFilterBackend, SearchFilter
 
+from reviews.autocomplete import MAX_CHAR
+from reviews.fuzzy import fuzzy_search
 from reviews.models import Title
+from users.fields import fold
 
 
 class FilterTitle(FilterSet):
     genre = CharFilter(field_name='genre__slug', lookup_expr='icontains')
-    category = CharFilter(field_name='category__slug', lookup_expr='icontains')
+    category = CharFilter(method='filter_category')
 
     class Meta:
         model = Title
         fields = ('category', 'genre', 'name', 'year')
+
+    def filter_category(self, queryset, name, value):
+        # Произведения удалённой категории отвязываются фоновой задачей.
+        return queryset.filter(
+            category__slug__icontains=value, category__is_deleted=False
+        )
+
+
+class FoldedPrefixSearchFilter(SearchFilter):
+    """
+    Поиск по началу значения без учёта регистра и буквы «ё».
+    В `search_fields` указываются теневые колонки `FoldedCharField`;
+    запрос сворачивается так же, как они, и сравнивается диапазоном,
+    поэтому поиск использует индекс колонки.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        prefix = fold(request.query_params.get(self.search_param, ''))
+        if not search_fields or not prefix:
+            return queryset
+        condition = Q()
+        for field in search_fields:
+            condition |= Q(**{
+                f'{field}__gte': prefix,
+                f'{field}__lt': prefix + MAX_CHAR,
+            })
+        return queryset.filter(condition)
+
+
+class TrigramSearchFilter(BaseFilterBackend):
+    """
+    Нечёткий поиск произведений по названию: `?fuzzy=<запрос>`.
+    Находит названия с опечатками по общим триграммам и сортирует
+    выдачу по убыванию сходства.
+    """
+    search_param = 'fuzzy'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        if not query.strip():
+            return queryset
+        ranked = fuzzy_search(query)
+        if not ranked:
+            return queryset.none()
+        return queryset.filter(pk__in=ranked).order_by(Case(
+            *(When(pk=pk, then=rank) for rank, pk in enumerate(ranked)),
+            output_field=IntegerField()
+        ))
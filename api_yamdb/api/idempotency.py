@@ -0,0 +1,140 @@
+import hashlib
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from reviews.constants import MAX_IDEMPOTENCY_KEY_LENGTH
+from reviews.models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+class RequestInProgress(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = (
+        'Запрос с этим ключом идемпотентности ещё выполняется, '
+        'повторите его позже.'
+    )
+    default_code = 'idempotency_in_progress'
+
+
+class KeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = (
+        'Ключ идемпотентности уже использован для другого запроса.'
+    )
+    default_code = 'idempotency_key_reused'
+
+
+class Replay(Exception):
+    """Прерывает обработку запроса сохранённым ответом."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+def request_fingerprint(request):
+    digest = hashlib.sha256()
+    for part in (request.method, request.get_full_path()):
+        digest.update(part.encode())
+        digest.update(b'\0')
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def claim(user_id, key, fingerprint):
+    """
+    Занимает ключ за текущим запросом. Возвращает запись ключа
+    и признак того, что она создана этим запросом, или None,
+    если запись исчезла между проверками.
+    """
+    IdempotencyKey.objects.filter(
+        user_id=user_id, key=key, expires__lte=timezone.now()
+    ).delete()
+    record = IdempotencyKey.objects.filter(user_id=user_id, key=key).first()
+    if record is None:
+        try:
+            with transaction.atomic():
+                return IdempotencyKey.objects.create(
+                    user_id=user_id,
+                    key=key,
+                    fingerprint=fingerprint,
+                    expires=timezone.now() + timedelta(
+                        seconds=settings.IDEMPOTENCY_KEY_TTL
+                    ),
+                ), True
+        except IntegrityError:
+            return None, False
+    if record.fingerprint != fingerprint:
+        raise KeyReused
+    return record, False
+
+
+def begin(request, key):
+    """
+    Начинает обработку запроса с ключом идемпотентности.
+    Возвращает запись, занятую этим запросом, или выбрасывает
+    `Replay` с сохранённым ответом. Если запрос с тем же ключом
+    ещё выполняется, ждёт его завершения.
+    """
+    if len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+        raise ValidationError({IDEMPOTENCY_HEADER: [
+            f'Ключ не может быть длиннее {MAX_IDEMPOTENCY_KEY_LENGTH} '
+            f'символов.'
+        ]})
+    user_id = request.user.pk if request.user.is_authenticated else 0
+    fingerprint = request_fingerprint(request)
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+    while True:
+        record, created = claim(user_id, key, fingerprint)
+        if created:
+            return record
+        if record is not None and record.status_code is not None:
+            raise Replay(replay(record))
+        if time.monotonic() >= deadline:
+            raise RequestInProgress
+        time.sleep(settings.IDEMPOTENCY_POLL_INTERVAL)
+
+
+def complete(record, response):
+    """
+    Сохраняет ответ для повторов. Ответ с ошибкой сервера
+    не сохраняется: ключ освобождается, и повтор выполнится заново.
+    """
+    if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+        release(record)
+        return
+    record.status_code = response.status_code
+    record.content = response.content
+    record.content_type = response.get('Content-Type', '')
+    record.save(update_fields=['status_code', 'content', 'content_type'])
+
+
+def release(record):
+    IdempotencyKey.objects.filter(pk=record.pk).delete()
+
+
+def replay(record):
+    response = HttpResponse(
+        bytes(record.content),
+        status=record.status_code,
+        content_type=record.content_type or None
+    )
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def clear_expired_keys():
+    """Удаляет ключи с истёкшим сроком хранения."""
+    deleted, _ = IdempotencyKey.objects.filter(
+        expires__lte=timezone.now()
+    ).delete()
+    return deleted
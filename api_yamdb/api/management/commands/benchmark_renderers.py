@@ -0,0 +1,126 @@
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import FastJSONParser, MessagePackParser
+from api.renderers import (FastJSONRenderer, MessagePackRenderer, msgpack,
+                           orjson)
+from api.serializers import ReviewSerializer, TitleReadSerializer
+from reviews.models import Category, Genre, Review, Title
+from users.models import UserProfile
+
+FORMATS = (
+    ('json', JSONRenderer, JSONParser),
+    ('orjson' if orjson else 'json (fallback)',
+     FastJSONRenderer, FastJSONParser),
+)
+if msgpack is not None:
+    FORMATS += (('msgpack', MessagePackRenderer, MessagePackParser),)
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнение скорости кодирования и разбора ответов API '
+        'для страниц произведений и отзывов.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--items', type=int, default=1000,
+            help='Сколько объектов в одной странице ответа.'
+        )
+        parser.add_argument(
+            '--genres', type=int, default=3,
+            help='Сколько жанров у каждого произведения.'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20,
+            help='Сколько раз повторять замер (берётся лучший).'
+        )
+
+    def build_payloads(self, items, genres_per_title):
+        """
+        Создаёт синтетические данные во временной транзакции
+        и сериализует их так же, как это делают представления.
+        """
+        with transaction.atomic():
+            category = Category.objects.create(
+                name='Бенчмарк', slug='benchmark-category'
+            )
+            Genre.objects.bulk_create(
+                Genre(name=f'Жанр {i}', slug=f'benchmark-genre-{i}')
+                for i in range(genres_per_title)
+            )
+            genres = list(Genre.objects.filter(slug__startswith='benchmark'))
+            author = UserProfile.objects.create(
+                username='benchmark', email='benchmark@example.com'
+            )
+            Title.objects.bulk_create(
+                Title(
+                    name=f'Произведение №{i}',
+                    year=2000,
+                    description='Описание произведения ' * 5,
+                    category=category,
+                )
+                for i in range(items)
+            )
+            titles = list(Title.objects.filter(category=category))
+            Title.genre.through.objects.bulk_create(
+                Title.genre.through(title_id=title.pk, genre_id=genre.pk)
+                for title in titles
+                for genre in genres
+            )
+            Review.objects.bulk_create(
+                Review(
+                    title=title, author=author, score=7,
+                    text='Текст отзыва ' * 10,
+                )
+                for title in titles
+            )
+            payloads = {
+                'titles': TitleReadSerializer(
+                    Title.objects.filter(category=category)
+                    .select_related('category')
+                    .prefetch_related('genre'),
+                    many=True
+                ).data,
+                'reviews': ReviewSerializer(
+                    Review.objects.filter(author=author)
+                    .select_related('title', 'author'),
+                    many=True
+                ).data,
+            }
+            transaction.set_rollback(True)
+        return payloads
+
+    def best_of(self, repeat, func, *args):
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func(*args)
+            best = min(best, time.perf_counter() - started)
+        return best, result
+
+    def handle(self, *args, **options):
+        payloads = self.build_payloads(options['items'], options['genres'])
+        repeat = options['repeat']
+        self.stdout.write(
+            f'{"страница":<10}{"формат":<18}{"байт":>10}'
+            f'{"кодирование, мс":>18}{"разбор, мс":>14}'
+        )
+        for name, data in payloads.items():
+            for label, renderer_class, parser_class in FORMATS:
+                renderer = renderer_class()
+                parser = parser_class()
+                encode, body = self.best_of(repeat, renderer.render, data)
+                decode, _ = self.best_of(
+                    repeat, lambda: parser.parse(BytesIO(body))
+                )
+                self.stdout.write(
+                    f'{name:<10}{label:<18}{len(body):>10}'
+                    f'{encode * 1000:>18.2f}{decode * 1000:>14.2f}'
+                )
@@ -0,0 +1,138 @@
+import threading
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection
+from django.test.utils import override_settings
+
+from reviews.models import Comment, Review, Title
+from reviews.writequeue import queued_write, write_queue
+from users.models import UserProfile
+
+PREFIX = 'benchmark-writes'
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнение числа записей отзывов и комментариев в секунду '
+        'при параллельной записи напрямую и через поток записи. '
+        'Замер идёт во временной базе, рабочая база не затрагивается.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int, default=8,
+            help='Сколько потоков пишут одновременно.'
+        )
+        parser.add_argument(
+            '--writes', type=int, default=100,
+            help='Сколько записей делает каждый поток.'
+        )
+
+    def prepare(self, threads, writes):
+        UserProfile.objects.bulk_create(
+            UserProfile(
+                username=f'{PREFIX}-{number}',
+                email=f'{PREFIX}-{number}@example.com'
+            )
+            for number in range(threads)
+        )
+        authors = list(
+            UserProfile.objects.filter(username__startswith=PREFIX)
+            .order_by('pk')
+        )
+        Title.objects.bulk_create(
+            Title(name=f'{PREFIX} {number}', year=2000)
+            for number in range(2 * threads * writes + 1)
+        )
+        titles = list(
+            Title.objects.filter(name__startswith=PREFIX).order_by('pk')
+        )
+        review = Review.objects.create(
+            title=titles.pop(), author=authors[0], text='text', score=5
+        )
+        return authors, titles, review
+
+    def run_threads(self, threads, writes, write):
+        errors = []
+        barrier = threading.Barrier(threads + 1)
+
+        def worker(number):
+            barrier.wait()
+            for index in range(writes):
+                try:
+                    queued_write(write, number, index)
+                except DatabaseError as error:
+                    errors.append(error)
+            connection.close()
+
+        workers = [
+            threading.Thread(target=worker, args=(number,))
+            for number in range(threads)
+        ]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        return time.perf_counter() - started, len(errors)
+
+    def benchmark(self, threads, writes):
+        authors, titles, review = self.prepare(threads, writes)
+        free_titles = iter(titles)
+        for queued in (False, True):
+            batches = write_queue.batches
+            for kind in ('reviews', 'comments'):
+                if kind == 'reviews':
+                    targets = [
+                        [next(free_titles) for _ in range(writes)]
+                        for _ in range(threads)
+                    ]
+
+                    def write(number, index):
+                        return Review.objects.create(
+                            title=targets[number][index],
+                            author=authors[number],
+                            text='text', score=5
+                        )
+                else:
+                    def write(number, index):
+                        return Comment.objects.create(
+                            review=review, author=authors[number],
+                            text='text'
+                        )
+                with override_settings(WRITE_QUEUE_ENABLED=queued):
+                    elapsed, errors = self.run_threads(
+                        threads, writes, write
+                    )
+                self.stdout.write(
+                    f'{"очередь" if queued else "напрямую":>9} '
+                    f'{kind:>9}: '
+                    f'{threads * writes / elapsed:8.0f} записей/с, '
+                    f'ошибок: {errors}'
+                )
+            if queued:
+                self.stdout.write(
+                    f'Групп в очереди: {write_queue.batches - batches}.'
+                )
+
+    def handle(self, *args, **options):
+        # Синтетические записи в рабочей базе попали бы в ленту изменений
+        # и сбросили бы кеши, поэтому замер идёт во временной базе-файле:
+        # в отличие от базы в памяти, она блокируется как рабочая.
+        if connection.vendor != 'sqlite':
+            raise CommandError('Замер рассчитан только на SQLite.')
+        with TemporaryDirectory() as directory:
+            connection.settings_dict['TEST']['NAME'] = str(
+                Path(directory) / 'benchmark.sqlite3'
+            )
+            old_name = connection.creation.create_test_db(
+                verbosity=0, autoclobber=True, serialize=False
+            )
+            try:
+                self.benchmark(options['threads'], options['writes'])
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
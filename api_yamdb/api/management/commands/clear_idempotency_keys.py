@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from api.idempotency import clear_expired_keys
+
+
+class Command(BaseCommand):
+    help = 'Удаляет сохранённые ответы с истёкшим ключом идемпотентности.'
+
+    def handle(self, *args, **options):
+        deleted = clear_expired_keys()
+        self.stdout.write(f'Удалено ключей: {deleted}.')
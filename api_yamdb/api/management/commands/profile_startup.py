@@ -0,0 +1,99 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Холодный старт рабочего процесса: загрузка WSGI-приложения
+# и разбор первого запроса, на котором подгружаются URLConf и представления.
+BOOT_SCRIPT = (
+    'import os\n'
+    'os.environ["DJANGO_SETTINGS_MODULE"] = {settings_module!r}\n'
+    'import api_yamdb.wsgi\n'
+    'from django.urls import resolve\n'
+    'resolve("/api/v1/titles/")\n'
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Замер времени запуска рабочего процесса `api_yamdb.wsgi` '
+        'и стоимости импорта модулей.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--settings-module',
+            default=os.environ.get('DJANGO_SETTINGS_MODULE'),
+            help='Профиль настроек, с которым запускается процесс.'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Сколько раз запускать процесс для замера (берётся медиана).'
+        )
+        parser.add_argument(
+            '--top', type=int, default=20,
+            help='Сколько самых дорогих модулей и пакетов показать.'
+        )
+        parser.add_argument(
+            '--target', type=float, default=settings.STARTUP_TIME_TARGET,
+            help='Целевое время запуска в секундах.'
+        )
+
+    def run_boot(self, settings_module, *flags):
+        return subprocess.run(
+            [sys.executable, *flags, '-c',
+             BOOT_SCRIPT.format(settings_module=settings_module)],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True
+        )
+
+    def measure(self, settings_module, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            self.run_boot(settings_module)
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+
+    def import_costs(self, settings_module):
+        """
+        Возвращает собственное и накопленное время импорта модулей
+        в микросекундах по выводу `python -X importtime`.
+        """
+        stderr = self.run_boot(settings_module, '-X', 'importtime').stderr
+        modules = []
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or '[us]' in line:
+                continue
+            own, cumulative, name = line[len('import time:'):].split('|')
+            modules.append((name.strip(), int(own), int(cumulative)))
+        return modules
+
+    def handle(self, *args, **options):
+        settings_module = options['settings_module']
+        top = options['top']
+        modules = self.import_costs(settings_module)
+        packages = Counter()
+        for name, own, _ in modules:
+            packages[name.split('.')[0]] += own
+        self.stdout.write('Пакеты по собственному времени импорта, мс:')
+        for package, own in packages.most_common(top):
+            self.stdout.write(f'  {package:<40}{own / 1000:>8.1f}')
+        self.stdout.write('Модули по накопленному времени импорта, мс:')
+        for name, _, cumulative in sorted(
+            modules, key=lambda module: -module[2]
+        )[:top]:
+            self.stdout.write(f'  {name:<40}{cumulative / 1000:>8.1f}')
+
+        boot = self.measure(settings_module, options['repeat'])
+        self.stdout.write(
+            f'Запуск с {settings_module}: {boot:.2f} с '
+            f'(цель {options["target"]:.2f} с, '
+            f'импортов {sum(packages.values()) / 1e6:.2f} с)'
+        )
+        if boot > options['target']:
+            raise CommandError('Время запуска превышает целевое.')
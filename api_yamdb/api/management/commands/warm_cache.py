@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+
+from api.warmup import popular_title_urls, top_logged_urls, warm_up
+
+
+class Command(BaseCommand):
+    help = (
+        'Прогрев кешей после деплоя: прогоняет запросы к популярным '
+        'адресам API через приложение в текущем процессе.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url', action='append', dest='urls', default=[],
+            help='Адрес для прогрева (можно указать несколько раз).'
+        )
+        parser.add_argument(
+            '--access-log',
+            help='Взять самые частые адреса из журнала доступа.'
+        )
+        parser.add_argument(
+            '--top', type=int, default=20,
+            help='Сколько адресов брать из журнала доступа.'
+        )
+        parser.add_argument(
+            '--popular-titles', type=int,
+            default=settings.WARMUP_POPULAR_TITLES,
+            help='Сколько самых обсуждаемых произведений прогреть.'
+        )
+
+    def handle(self, *args, **options):
+        urls = options['urls']
+        if options['access_log']:
+            urls += top_logged_urls(options['access_log'], options['top'])
+        if not urls:
+            urls = list(settings.WARMUP_URLS)
+        urls += popular_title_urls(options['popular_titles'])
+        results = warm_up(get_wsgi_application(), dict.fromkeys(urls))
+        failed = 0
+        for url, status, seconds in results:
+            self.stdout.write(f'{status} {seconds * 1000:8.1f} мс  {url}')
+            failed += status >= 500
+        if failed:
+            raise CommandError(f'Запросов с ошибкой сервера: {failed}.')
+        self.stdout.write(self.style.SUCCESS(
+            f'Прогрето адресов: {len(results)}.'
+        ))
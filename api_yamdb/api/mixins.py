@@ -1,8 +1,91 @@
+from django.conf import settings
+from rest_framework import status
 from rest_framework.mixins import (CreateModelMixin, DestroyModelMixin,
                                    ListModelMixin)
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from api.idempotency import (IDEMPOTENCY_HEADER, Replay, begin, complete,
+                             release)
+from reviews.constants import CATALOG_MODELS
+from reviews.jobs import tombstone
+from reviews.readcache import catalog_cache_key, coalesced
+
 
 class ModelMixinSet(CreateModelMixin, ListModelMixin,
                     DestroyModelMixin, GenericViewSet):
     pass
+
+
+class TombstoneDestroyMixin:
+    """
+    Вместо каскадного удаления помечает объект удалённым
+    и ставит в очередь фоновую очистку связанных данных.
+    Идентификатор задачи возвращается в заголовке `X-Job-Id`.
+    """
+    purge_job_kind = None
+
+    def destroy(self, request, *args, **kwargs):
+        job = tombstone(self.get_object(), self.purge_job_kind)
+        return Response(
+            status=status.HTTP_204_NO_CONTENT,
+            headers={'X-Job-Id': job.pk}
+        )
+
+
+class IdempotentCreateMixin:
+    """
+    Поддержка заголовка `Idempotency-Key` для POST-запросов.
+    Первый ответ сохраняется по пользователю и ключу и возвращается
+    на повторы, а параллельный повтор ждёт завершения первого запроса.
+    """
+    idempotency_record = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if request.method == 'POST' and key is not None:
+            self.idempotency_record = begin(request, key)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Replay):
+            return exc.response
+        try:
+            return super().handle_exception(exc)
+        except Exception:
+            if self.idempotency_record is not None:
+                release(self.idempotency_record)
+            raise
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        if self.idempotency_record is not None:
+            complete(self.idempotency_record, response.render())
+        return response
+
+
+class CoalescedReadMixin:
+    """
+    Кеширует данные ответа на чтение списка по адресу запроса.
+    Промах кеша пересчитывается одним запросом, остальные ждут
+    его результата; устаревший ответ отдаётся во время фонового
+    пересчёта. Кеш сбрасывается при изменении моделей `cache_models`.
+    """
+    cache_models = CATALOG_MODELS
+
+    def coalesced_response(self, handler, request, *args, **kwargs):
+        data = coalesced(
+            catalog_cache_key(
+                request.build_absolute_uri(), self.cache_models
+            ),
+            lambda: handler(request, *args, **kwargs).data,
+            settings.READ_CACHE_TIMEOUT
+        )
+        return Response(data)
+
+    def list(self, request, *args, **kwargs):
+        return self.coalesced_response(
+            super().list, request, *args, **kwargs
+        )
@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from django.conf import settings
 
 
@@ -8,3 +8,13 @@ class CustomPageNumberPagination(PageNumberPagination):
     Размер страницы устанавливается из настроек.
     """
     page_size = settings.CUSTOM_PAGE_SIZE
+
+
+class AuthorHistoryPagination(CursorPagination):
+    """
+    Курсорная пагинация для истории отзывов и комментариев автора.
+    Не считает общее количество записей и не использует OFFSET,
+    поэтому время ответа не зависит от числа записей автора.
+    """
+    page_size = settings.CUSTOM_PAGE_SIZE
+    ordering = '-pub_date'
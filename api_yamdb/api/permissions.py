@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from api.tracing import traced
+
 MESSAGE_NO_PERMISSION = "У вас нет прав для выполнения этого действия."
 
 
@@ -11,6 +13,7 @@ class IsAuthenticatedAdminOrStaff(permissions.BasePermission):
     """
     message = MESSAGE_NO_PERMISSION
 
+    @traced('permission')
     def has_permission(self, request, view):
         return request.user.is_authenticated and request.user.is_admin
 
@@ -22,6 +25,7 @@ class IsAuthenticatedAdminOrReadOnly(permissions.BasePermission):
     """
     message = MESSAGE_NO_PERMISSION
 
+    @traced('permission')
     def has_permission(self, request, view):
         return (request.method in permissions.SAFE_METHODS
                 or (request.user.is_authenticated and request.user.is_admin))
@@ -34,10 +38,12 @@ class IsAuthAdminModeratorAuthorOrReadOnly(permissions.BasePermission):
     """
     message = MESSAGE_NO_PERMISSION
 
+    @traced('permission')
     def has_permission(self, request, view):
         return (request.method in permissions.SAFE_METHODS
                 or request.user.is_authenticated)
 
+    @traced('permission')
     def has_object_permission(self, request, view, obj):
         return (
             request.user.is_admin
@@ -53,8 +59,10 @@ class IsAuthOwner(permissions.BasePermission):
     """
     message = MESSAGE_NO_PERMISSION
 
+    @traced('permission')
     def has_permission(self, request, view):
         return request.user.is_authenticated
 
+    @traced('permission')
     def has_object_permission(self, request, view, obj):
         return obj.username == request.user.username
@@ -0,0 +1,61 @@
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+if orjson is not None:
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'),
+                       (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON-рендерер, который кодирует ответ сразу в байты через `orjson`,
+    если библиотека установлена, и через стандартный `json` иначе.
+    Даты и типы, которые `orjson` не знает (ленивые строки, Decimal),
+    передаются кодировщику DRF, поэтому вывод совпадает с `JSONRenderer`.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(
+            accepted_media_type, renderer_context or {}
+        ):
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+        if data is None:
+            return b''
+        ret = orjson.dumps(
+            data, default=JSONEncoder().default, option=ORJSON_OPTIONS
+        )
+        # Как и JSONRenderer, экранируем разделители строк для JavaScript.
+        for separator, escaped in LINE_SEPARATORS:
+            ret = ret.replace(separator, escaped)
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Рендерер компактного двоичного формата MessagePack.
+    Выбирается заголовком `Accept: application/msgpack`. Значения,
+    которых нет в MessagePack, кодируются так же, как в JSON,
+    поэтому клиенты получают ту же модель данных.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=JSONEncoder().default)
@@ -1,10 +1,18 @@
 from django.core.validators import EmailValidator
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+from rest_framework.validators import UniqueValidator
 from django.shortcuts import get_object_or_404
 from django.db import IntegrityError
 from django.contrib.auth.validators import UnicodeUsernameValidator
 
-from reviews.models import Category, Comment, Genre, Review, Title
+from api.tracing import TracedSerializerMixin
+from reviews.constants import (MAX_NAME_LENGTH, MAX_SCORE, MAX_SLUG_LENGTH,
+                               MIN_SCORE)
+from reviews.models import (BackgroundJob, Category, ChangeLogEntry, Comment,
+                            Genre, Review, Title)
+from reviews.ratings import SCORES, unpack_histogram
+from reviews.slugs import resolve_slugs
 from reviews.validators import validate_title_year
 from users.models import UserProfile, User, validate_username
 from users.constants import MAX_EMAIL_LENGTH, MAX_USERNAME_LENGTH
@@ -68,21 +76,27 @@ class AuthTokenSerializer(serializers.Serializer):
         return data
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Genre
         fields = ('name', 'slug')
         lookup_field = 'slug'
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TracedSerializerMixin, serializers.ModelSerializer):
+    # Слаг удалённой категории занят, пока фоновая задача её не очистит.
+    slug = serializers.SlugField(
+        max_length=MAX_SLUG_LENGTH,
+        validators=[UniqueValidator(queryset=Category.all_objects.all())]
+    )
+
     class Meta:
         model = Category
         fields = ('name', 'slug')
         lookup_field = 'slug'
 
 
-class TitleReadSerializer(serializers.ModelSerializer):
+class TitleReadSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     genre = GenreSerializer(
         read_only=True,
@@ -91,30 +105,103 @@ class TitleReadSerializer(serializers.ModelSerializer):
     rating = serializers.IntegerField(read_only=True)
 
     class Meta:
-        fields = '__all__'
+        exclude = ('is_deleted', 'name_folded', 'score_histogram')
         model = Title
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Удалённая категория не показывается, пока фоновая задача
+        # не отвязала от неё произведения.
+        if instance.category is not None and instance.category.is_deleted:
+            data['category'] = None
+        return data
+
+
+class TitleDetailSerializer(TitleReadSerializer):
+    """
+    Произведение вместе с распределением оценок:
+    количеством отзывов с каждой оценкой.
+    """
+    score_histogram = serializers.SerializerMethodField()
+
+    class Meta(TitleReadSerializer.Meta):
+        exclude = ('is_deleted', 'name_folded')
+
+    def get_score_histogram(self, obj):
+        return {
+            str(score): count
+            for score, count in zip(
+                SCORES, unpack_histogram(obj.score_histogram)
+            )
+        }
+
+
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    Поле связи по слагу, которое ищет объект в словаре слагов
+    процесса, а не отдельным запросом к базе на каждое значение.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return CachedSlugManyRelatedField(**list_kwargs)
 
-class TitleWriteSerializer(serializers.ModelSerializer):
-    category = serializers.SlugRelatedField(
+    def to_internal_values(self, data):
+        """Сопоставляет все слаги списка за одно обращение к словарю."""
+        queryset = self.get_queryset()
+        if not all(isinstance(item, str) for item in data):
+            self.fail('invalid')
+        pks = resolve_slugs(queryset.model, data)
+        objs = []
+        for item in data:
+            if item not in pks:
+                self.fail(
+                    'does_not_exist', slug_name=self.slug_field, value=item
+                )
+            objs.append(queryset.model.from_db(
+                queryset.db, ('id', self.slug_field), (pks[item], item)
+            ))
+        return objs
+
+    def to_internal_value(self, data):
+        return self.to_internal_values((data,))[0]
+
+
+class CachedSlugManyRelatedField(serializers.ManyRelatedField):
+    """Список связей по слагам, сопоставляемый одним обращением."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+        return self.child_relation.to_internal_values(list(data))
+
+
+class TitleWriteSerializer(TracedSerializerMixin, serializers.ModelSerializer):
+    category = CachedSlugRelatedField(
         queryset=Category.objects.all(),
         slug_field='slug'
     )
-    genre = serializers.SlugRelatedField(
+    genre = CachedSlugRelatedField(
         queryset=Genre.objects.all(),
         slug_field='slug',
         many=True
     )
 
     class Meta:
-        fields = '__all__'
+        exclude = ('is_deleted', 'name_folded', 'score_histogram')
         model = Title
 
     def validate_year(self, value):
         return validate_title_year(value)
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     title = serializers.SlugRelatedField(
         read_only=True,
         slug_field="name"
@@ -128,10 +215,16 @@ class ReviewSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         title_id = self.context['view'].kwargs.get('title_id')
         if request.method == 'POST':
-            if Review.objects.filter(
+            review = Review.all_objects.filter(
                 author=request.user,
                 title_id=title_id
-            ).exists():
+            ).only('is_deleted').first()
+            if review is not None and review.is_deleted:
+                raise serializers.ValidationError(
+                    'Удалённый отзыв на это произведение ещё не очищен, '
+                    'повторите позже'
+                )
+            if review is not None:
                 raise serializers.ValidationError(
                     'Вы уже оставили отзыв на это произведение'
                 )
@@ -142,7 +235,7 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ("id", "title", "text", "author", "score", "pub_date")
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
         slug_field="username"
@@ -153,10 +246,93 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = ("id", "text", "author", "pub_date")
 
 
-class UserSerializer(serializers.ModelSerializer):
+class BulkReviewSerializer(serializers.Serializer):
+    """Отзыв в запросе массовой загрузки."""
+    title = serializers.IntegerField()
+    author = serializers.CharField(max_length=MAX_USERNAME_LENGTH)
+    text = serializers.CharField()
+    score = serializers.IntegerField(min_value=MIN_SCORE, max_value=MAX_SCORE)
+
+
+class BulkCommentSerializer(serializers.Serializer):
+    """Комментарий в запросе массовой загрузки."""
+    review = serializers.IntegerField()
+    author = serializers.CharField(max_length=MAX_USERNAME_LENGTH)
+    text = serializers.CharField()
+
+
+class BulkInfoSerializer(serializers.Serializer):
+    """Категория или жанр в запросе импорта каталога."""
+    name = serializers.CharField(max_length=MAX_NAME_LENGTH)
+    slug = serializers.SlugField(max_length=MAX_SLUG_LENGTH)
+
+
+class BulkTitleSerializer(serializers.Serializer):
+    """
+    Произведение в запросе импорта каталога.
+    Если передан `id`, существующее произведение обновляется.
+    """
+    id = serializers.IntegerField(required=False)
+    name = serializers.CharField(max_length=MAX_NAME_LENGTH)
+    year = serializers.IntegerField(validators=[validate_title_year])
+    description = serializers.CharField(
+        required=False, allow_blank=True, allow_null=True
+    )
+    category = serializers.SlugField(required=False, allow_null=True)
+    genre = serializers.ListField(child=serializers.SlugField())
+
+
+class AuthorCommentSerializer(CommentSerializer):
+    """
+    Сериализатор комментария в истории автора.
+    Дополнительно содержит отзыв и название произведения.
+    """
+    title = serializers.CharField(source="review.title.name", read_only=True)
+
+    class Meta(CommentSerializer.Meta):
+        fields = ("id", "review", "title", "text", "author", "pub_date")
+        read_only_fields = ("review",)
+
+
+class BackgroundJobSerializer(serializers.ModelSerializer):
+    """Состояние фоновой задачи."""
+    class Meta:
+        model = BackgroundJob
+        fields = (
+            "id", "kind", "object_id", "status", "total",
+            "processed", "error", "created", "updated"
+        )
+
+
+class ChangeLogEntrySerializer(serializers.ModelSerializer):
+    """Запись ленты изменений."""
+    cursor = serializers.IntegerField(source="id", read_only=True)
+
+    class Meta:
+        model = ChangeLogEntry
+        fields = (
+            "cursor", "model", "object_id", "action",
+            "slug", "title_id", "review_id", "created"
+        )
+
+
+class UserSerializer(TracedSerializerMixin, serializers.ModelSerializer):
     """
     Сериализатор для представления и валидации данных пользователя.
     """
+    # Имя и почта удалённого пользователя заняты до фоновой очистки.
+    username = serializers.CharField(
+        max_length=MAX_USERNAME_LENGTH,
+        validators=[
+            UnicodeUsernameValidator(), validate_username,
+            UniqueValidator(queryset=UserProfile.all_objects.all())
+        ]
+    )
+    email = serializers.EmailField(
+        max_length=MAX_EMAIL_LENGTH,
+        validators=[UniqueValidator(queryset=UserProfile.all_objects.all())]
+    )
+
     class Meta:
         model = User
         fields = (
@@ -0,0 +1,164 @@
+import logging
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from api.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 24 * 60 * 60}
+
+CREATE_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS bucket (
+        key TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        updated REAL NOT NULL,
+        allowed INTEGER NOT NULL
+    ) WITHOUT ROWID
+'''
+# Одно выражение и пополняет корзину с учётом прошедшего времени,
+# и забирает жетон, поэтому процессы не мешают друг другу.
+CONSUME_SQL = '''
+    INSERT INTO bucket (key, tokens, updated, allowed)
+    VALUES (:key, :capacity - 1, :now, 1)
+    ON CONFLICT (key) DO UPDATE SET
+        allowed = min(:capacity, tokens + (:now - updated) * :rate) >= 1,
+        tokens = min(:capacity, tokens + (:now - updated) * :rate)
+            - (min(:capacity, tokens + (:now - updated) * :rate) >= 1),
+        updated = :now
+    RETURNING allowed, tokens
+'''
+
+
+def parse_rate(rate):
+    """Разбирает ставку вида `10/min` в ёмкость и жетоны в секунду."""
+    num, period = rate.split('/')
+    capacity = int(num)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+class TokenBucketStore:
+    """
+    Корзины жетонов в файле SQLite, общем для всех рабочих
+    процессов на машине. У каждого потока своё соединение;
+    запись идёт без fsync, потеря корзин при сбое не страшна.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.local = threading.local()
+        self.purged = time.time()
+
+    def connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=1, isolation_level=None,
+                check_same_thread=False
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute(CREATE_TABLE_SQL)
+            self.local.conn = conn
+        return conn
+
+    def consume(self, key, capacity, rate):
+        """
+        Забирает жетон из корзины. Возвращает признак успеха
+        и число оставшихся жетонов.
+        """
+        now = time.time()
+        conn = self.connection()
+        if now - self.purged > settings.THROTTLE_PURGE_INTERVAL:
+            self.purged = now
+            conn.execute(
+                'DELETE FROM bucket WHERE updated < ?',
+                (now - settings.THROTTLE_PURGE_INTERVAL,)
+            )
+        allowed, tokens = conn.execute(CONSUME_SQL, {
+            'key': key, 'capacity': capacity, 'rate': rate, 'now': now,
+        }).fetchone()
+        return bool(allowed), tokens
+
+    def clear(self):
+        self.connection().execute('DELETE FROM bucket')
+
+
+_store = None
+
+
+def get_store():
+    global _store
+    if _store is None or _store.path != str(settings.THROTTLE_STORE_PATH):
+        _store = TokenBucketStore(settings.THROTTLE_STORE_PATH)
+    return _store
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Ограничение частоты запросов по алгоритму корзины жетонов.
+    Ставка `scope` из `DEFAULT_THROTTLE_RATES` задаёт ёмкость корзины
+    и скорость её пополнения: `10/min` — не больше 10 запросов подряд
+    и один новый жетон каждые 6 секунд.
+    """
+    scope = None
+
+    def get_bucket_key(self, request, view):
+        """Ключ корзины или None, если ограничение не применяется."""
+        raise NotImplementedError
+
+    @traced('throttle')
+    def allow_request(self, request, view):
+        key = self.get_bucket_key(request, view)
+        if key is None:
+            return True
+        self.capacity, self.rate = parse_rate(
+            api_settings.DEFAULT_THROTTLE_RATES[self.scope]
+        )
+        try:
+            allowed, self.tokens = get_store().consume(
+                f'{self.scope}:{key}', self.capacity, self.rate
+            )
+        except sqlite3.Error:
+            # Недоступное хранилище корзин не должно ронять API:
+            # запрос пропускается без ограничения.
+            logger.exception('Хранилище ограничений частоты недоступно.')
+            return True
+        return allowed
+
+    def wait(self):
+        return (1 - self.tokens) / self.rate
+
+
+class AuthThrottle(TokenBucketThrottle):
+    """Регистрация и получение токена: по IP-адресу клиента."""
+    scope = 'auth'
+
+    def get_bucket_key(self, request, view):
+        return self.get_ident(request)
+
+
+class AnonReadThrottle(TokenBucketThrottle):
+    """Чтение без авторизации: по IP-адресу клиента."""
+    scope = 'anon_read'
+
+    def get_bucket_key(self, request, view):
+        if request.user.is_authenticated or request.method not in SAFE_METHODS:
+            return None
+        return self.get_ident(request)
+
+
+class UserThrottle(TokenBucketThrottle):
+    """Запросы авторизованного пользователя: по его идентификатору."""
+    scope = 'user'
+
+    def get_bucket_key(self, request, view):
+        if not request.user.is_authenticated:
+            return None
+        return request.user.pk
@@ -0,0 +1,230 @@
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+
+TRACE_ID_HEADER = 'X-Trace-Id'
+TRACE_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+_local = threading.local()
+
+
+class Trace:
+    """
+    Спаны одного запроса. Время хранится по `perf_counter`
+    и переводится в микросекунды эпохи только при выгрузке.
+    """
+
+    def __init__(self, trace_id):
+        self.trace_id = trace_id
+        self.origin = time.perf_counter()
+        self.epoch = time.time()
+        self.spans = []
+        self.marks = {}
+
+    def add(self, name, category, start, end, **args):
+        self.spans.append(
+            (name, category, start, end, threading.get_ident(), args)
+        )
+
+    def mark(self, name):
+        self.marks[name] = time.perf_counter()
+
+    @contextmanager
+    def span(self, name, category, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, time.perf_counter(), **args)
+
+    def add_phases(self, end):
+        """
+        Спаны этапов запроса по отметкам middleware: до вызова
+        представления, само представление, отрисовка ответа
+        и обратный проход по middleware.
+        """
+        view_start = self.marks.get('view_start')
+        if view_start is None:
+            return
+        self.add('middleware', 'middleware', self.origin, view_start)
+        view_end = self.marks.get('view_end', end)
+        self.add('view', 'view', view_start, view_end)
+        if 'view_end' not in self.marks:
+            return
+        render_end = self.marks.get('render_end', view_end)
+        if render_end > view_end:
+            self.add('render', 'render', view_end, render_end)
+        self.add('middleware', 'middleware', render_end, end)
+
+    def events(self):
+        """События в формате Chrome Trace Event (полные спаны, `ph: X`)."""
+        pid = os.getpid()
+        for name, category, start, end, tid, args in self.spans:
+            yield {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': round(
+                    (self.epoch + start - self.origin) * 1_000_000, 3
+                ),
+                'dur': round((end - start) * 1_000_000, 3),
+                'pid': pid,
+                'tid': tid,
+                'args': dict(args, trace_id=self.trace_id),
+            }
+
+
+def current_trace():
+    return getattr(_local, 'trace', None)
+
+
+def traced(category):
+    """
+    Декоратор метода: вызов записывается спаном `Класс.метод`,
+    если текущий запрос трассируется.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            trace = current_trace()
+            if trace is None:
+                return method(self, *args, **kwargs)
+            with trace.span(
+                f'{type(self).__name__}.{method.__name__}', category
+            ):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TracedSerializerMixin:
+    """Спаны проверки данных и представления объектов сериализатора."""
+
+    @traced('serializer')
+    def is_valid(self, *args, **kwargs):
+        return super().is_valid(*args, **kwargs)
+
+    @traced('serializer')
+    def to_representation(self, instance):
+        return super().to_representation(instance)
+
+
+def sql_span(execute, sql, params, many, context):
+    """
+    Обёртка выполнения SQL: спан на каждый запрос. В спан попадает
+    только текст запроса с плейсхолдерами, параметры не пишутся.
+    """
+    trace = current_trace()
+    if trace is None:
+        return execute(sql, params, many, context)
+    with trace.span(sql.split(None, 1)[0].upper(), 'sql', sql=sql, many=many):
+        return execute(sql, params, many, context)
+
+
+def sample(request):
+    """
+    Трассировка запроса или None. При `TRACING_ACCEPT_TRACE_ID`
+    запрос с корректным заголовком `X-Trace-Id` трассируется всегда
+    под этим идентификатором, остальные — с вероятностью
+    `TRACING_SAMPLE_RATE`.
+    """
+    if not settings.TRACING_ENABLED:
+        return None
+    trace_id = request.headers.get(TRACE_ID_HEADER, '').lower()
+    if settings.TRACING_ACCEPT_TRACE_ID and TRACE_ID_RE.fullmatch(trace_id):
+        return Trace(trace_id)
+    if random.random() < settings.TRACING_SAMPLE_RATE:
+        return Trace(uuid.uuid4().hex)
+    return None
+
+
+class TraceFileExporter:
+    """
+    Дописывает события трассировок в файл JSON-массива формата
+    Chrome Trace Event. Закрывающая скобка массива в этом формате
+    необязательна, поэтому файл можно дописывать из нескольких
+    процессов и открывать в Perfetto или chrome://tracing как есть.
+    Файл больше `TRACING_MAX_FILE_SIZE` заменяет прежнюю копию `.1`,
+    так что на диске не больше двух файлов.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def export(self, trace):
+        chunk = ''.join(
+            json.dumps(event, ensure_ascii=False) + ',\n'
+            for event in trace.events()
+        )
+        path = str(settings.TRACING_OUTPUT_PATH)
+        with self.lock:
+            try:
+                if os.path.getsize(path) >= settings.TRACING_MAX_FILE_SIZE:
+                    os.replace(path, f'{path}.1')
+            except FileNotFoundError:
+                pass
+            with open(path, 'a', encoding='utf-8') as file:
+                if file.tell() == 0:
+                    file.write('[\n')
+                file.write(chunk)
+
+
+exporter = TraceFileExporter()
+
+
+class TracingMiddleware:
+    """
+    Трассировка выборки запросов. Должна стоять первой в `MIDDLEWARE`:
+    её отметки делят запрос на проход по middleware, представление
+    и отрисовку ответа. Внутри представления пишутся спаны проверок
+    прав, сериализаторов и каждого SQL-запроса. Идентификатор
+    трассировки возвращается в заголовке `X-Trace-Id`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        trace = sample(request)
+        if trace is None:
+            return self.get_response(request)
+        _local.trace = trace
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(sql_span))
+                response = self.get_response(request)
+        finally:
+            _local.trace = None
+        end = time.perf_counter()
+        trace.add_phases(end)
+        trace.add(
+            f'{request.method} {request.path}', 'request', trace.origin, end,
+            status=response.status_code
+        )
+        exporter.export(trace)
+        response[TRACE_ID_HEADER] = trace.trace_id
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        trace = current_trace()
+        if trace is not None:
+            trace.mark('view_start')
+
+    def process_template_response(self, request, response):
+        trace = current_trace()
+        if trace is not None:
+            trace.mark('view_end')
+            response.add_post_render_callback(
+                lambda response: trace.mark('render_end')
+            )
+        return response
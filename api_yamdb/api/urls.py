@@ -3,7 +3,12 @@ from rest_framework.routers import DefaultRouter
 
 from api.views import (
     AuthTokenView,
+    BackgroundJobViewSet,
+    BulkCommentView,
+    BulkReviewView,
+    CatalogImportView,
     CategoryViewSet,
+    ChangeFeedView,
     CommentsViewSet,
     GenreViewSet,
     ReviewViewSet,
@@ -11,6 +16,7 @@ from api.views import (
     TitleViewSet,
     UsersViewSet,
 )
+from api.throttles import AuthThrottle
 from api_yamdb.settings import API_VERSION
 
 
@@ -19,6 +25,7 @@ router_v1.register("categories", CategoryViewSet, basename="categories")
 router_v1.register("genres", GenreViewSet, basename="genres")
 router_v1.register("titles", TitleViewSet, basename="titles")
 router_v1.register(r"users", UsersViewSet)
+router_v1.register("jobs", BackgroundJobViewSet, basename="jobs")
 router_v1.register(r"titles/(?P<title_id>\d+)/reviews",
                    ReviewViewSet,
                    basename="reviews")
@@ -29,10 +36,28 @@ router_v1.register(
 )
 
 
+# Регистрация и выдача токенов ограничены отдельно по IP-адресу,
+# остальные адреса — общими ограничениями из настроек.
+AUTH_THROTTLES = (AuthThrottle,)
+
 urlpatterns = [
-    path(f'{API_VERSION}/auth/signup/', SignUpView.as_view(), name="signup"),
+    path(f'{API_VERSION}/auth/signup/',
+         SignUpView.as_view(throttle_classes=AUTH_THROTTLES),
+         name="signup"),
     path(f'{API_VERSION}/auth/token/',
-         AuthTokenView.as_view(),
+         AuthTokenView.as_view(throttle_classes=AUTH_THROTTLES),
          name="token_obtain_pair"),
+    path(f'{API_VERSION}/bulk/reviews/',
+         BulkReviewView.as_view(),
+         name="bulk_reviews"),
+    path(f'{API_VERSION}/bulk/comments/',
+         BulkCommentView.as_view(),
+         name="bulk_comments"),
+    path(f'{API_VERSION}/bulk/catalog/',
+         CatalogImportView.as_view(),
+         name="bulk_catalog"),
+    path(f'{API_VERSION}/changes/',
+         ChangeFeedView.as_view(),
+         name="changes"),
     path(f'{API_VERSION}/', include(router_v1.urls)),
 ]
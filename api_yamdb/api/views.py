@@ -1,35 +1,59 @@
-from rest_framework import viewsets, status, filters
+from rest_framework import serializers, status, viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.db.models import Avg
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.views import APIView
 from rest_framework.decorators import action
-from rest_framework.filters import SearchFilter
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db import IntegrityError, connection, transaction
+from django.db.transaction import TransactionManagementError
 
-from api.filters import FilterTitle
-from api.mixins import ModelMixinSet
+from api.facets import build_title_facets
+from api.filters import (FilterTitle, FoldedPrefixSearchFilter,
+                         TrigramSearchFilter)
+from api.mixins import (CoalescedReadMixin, IdempotentCreateMixin,
+                        ModelMixinSet, TombstoneDestroyMixin)
 from api.permissions import (IsAuthenticatedAdminOrReadOnly,
                              IsAuthenticatedAdminOrStaff,
                              IsAuthAdminModeratorAuthorOrReadOnly,
                              IsAuthOwner)
-from api.serializers import (AuthTokenSerializer, CategorySerializer,
-                             CommentSerializer, GenreSerializer,
-                             ReviewSerializer, SignUpSerializer,
+from api.serializers import (AuthorCommentSerializer, AuthTokenSerializer,
+                             BackgroundJobSerializer,
+                             BulkCommentSerializer, BulkInfoSerializer,
+                             BulkReviewSerializer, BulkTitleSerializer,
+                             CategorySerializer, ChangeLogEntrySerializer,
+                             CommentSerializer,
+                             GenreSerializer, ReviewSerializer,
+                             SignUpSerializer, TitleDetailSerializer,
                              TitleReadSerializer, TitleWriteSerializer,
                              UserSerializer)
 
-from reviews.models import Category, Genre, Review, Title
-from .pagination import CustomPageNumberPagination
+from reviews.autocomplete import autocomplete
+from reviews.changes import record_changes
+from reviews.constants import (AUTOCOMPLETE_LIMIT, AUTOCOMPLETE_MAX_LIMIT,
+                               CHANGE_CREATE, CHANGE_UPDATE,
+                               FACETS_CACHE_KEY, PURGE_CATEGORY,
+                               PURGE_REVIEW, PURGE_TITLE, PURGE_USER,
+                               RATED_CATALOG_MODELS)
+from reviews.fuzzy import index_titles
+from reviews.models import (BackgroundJob, Category, ChangeLogEntry, Comment,
+                            Genre, Review, Title)
+from reviews.ratings import apply_score_changes
+from reviews.readcache import (catalog_cache_key, coalesced,
+                               invalidate_catalog_cache)
+from reviews.slugs import invalidate_slug_map
+from reviews.trending import record_review_activity
+from reviews.writequeue import queued_write
+from .pagination import AuthorHistoryPagination, CustomPageNumberPagination
 from .serializers import SignUpSerializer, AuthTokenSerializer
+from users.fields import fill_folded_fields
 from users.models import UserProfile
 
 
-class SignUpView(APIView):
+class SignUpView(IdempotentCreateMixin, APIView):
     """
     Представление для регистрации нового пользователя.
     Доступно для всех пользователей.
@@ -82,52 +106,132 @@ class AuthTokenView(APIView):
         )
 
 
-class CategoryViewSet(ModelMixinSet):
+class CategoryViewSet(IdempotentCreateMixin, CoalescedReadMixin,
+                      TombstoneDestroyMixin, ModelMixinSet):
     queryset = Category.objects.all()
+    purge_job_kind = PURGE_CATEGORY
     serializer_class = CategorySerializer
     permission_classes = (IsAuthenticatedAdminOrReadOnly,)
-    filter_backends = (filters.SearchFilter,)
-    search_fields = ('name',)
+    filter_backends = (FoldedPrefixSearchFilter,)
+    search_fields = ('name_folded',)
     lookup_field = 'slug'
 
 
-class GenreViewSet(ModelMixinSet):
+class GenreViewSet(IdempotentCreateMixin, CoalescedReadMixin,
+                   ModelMixinSet):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
     permission_classes = (IsAuthenticatedAdminOrReadOnly,)
-    filter_backends = (filters.SearchFilter,)
-    search_fields = ('name',)
+    filter_backends = (FoldedPrefixSearchFilter,)
+    search_fields = ('name_folded',)
     lookup_field = 'slug'
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(
-        rating=Avg('reviews__score')
-    ).order_by('id')
+class TitleViewSet(IdempotentCreateMixin, CoalescedReadMixin,
+                   TombstoneDestroyMixin, viewsets.ModelViewSet):
+    queryset = Title.objects.order_by('id')
+    purge_job_kind = PURGE_TITLE
+    cache_models = RATED_CATALOG_MODELS
     permission_classes = (IsAuthenticatedAdminOrReadOnly,)
-    filter_backends = (DjangoFilterBackend,)
+    filter_backends = (DjangoFilterBackend, TrigramSearchFilter)
     filterset_class = FilterTitle
     http_method_names = ['get', 'post', 'patch', 'delete', ]
 
     def get_serializer_class(self):
+        if self.action == 'retrieve' and 'score_histogram' in (
+            self.request.query_params.get('include', '').split(',')
+        ):
+            return TitleDetailSerializer
         if self.action in ('list', 'retrieve'):
             return TitleReadSerializer
         return TitleWriteSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        return self.coalesced_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        Возвращает количество произведений по жанрам, категориям
+        и десятилетиям с учётом фильтров `FilterTitle` и нечёткого
+        поиска. Результат без фильтров кешируется.
+        """
+        filter_names = (
+            *self.filterset_class.base_filters,
+            TrigramSearchFilter.search_param,
+        )
+        if not any(name in request.query_params for name in filter_names):
+            return Response(coalesced(
+                catalog_cache_key(FACETS_CACHE_KEY),
+                lambda: build_title_facets(Title.objects.all()),
+                settings.FACETS_CACHE_TIMEOUT
+            ))
+        titles = self.filter_queryset(Title.objects.all())
+        return Response(build_title_facets(titles))
+
+    @action(detail=False, methods=['get'])
+    def autocomplete(self, request):
+        """
+        Подсказки названий произведений по началу названия
+        или слова в нём: `?q=<строка>&limit=<число>`.
+        Самые популярные произведения идут первыми.
+        """
+        try:
+            limit = int(request.query_params.get('limit', AUTOCOMPLETE_LIMIT))
+        except ValueError:
+            limit = AUTOCOMPLETE_LIMIT
+        limit = min(max(limit, 1), AUTOCOMPLETE_MAX_LIMIT)
+        return Response(
+            autocomplete.suggest(request.query_params.get('q', ''), limit)
+        )
 
-class UsersViewSet(viewsets.ModelViewSet):
+    @action(detail=True, methods=['get'])
+    def similar(self, request, pk=None):
+        """
+        Возвращает похожие произведения из списка,
+        предрассчитанного командой `compute_similar_titles`.
+        """
+        title = self.get_object()
+        titles = self.get_queryset().filter(
+            similar_to__title=title
+        ).select_related('category').prefetch_related(
+            'genre'
+        ).order_by('similar_to__rank')
+        serializer = TitleReadSerializer(titles, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def trending(self, request):
+        """
+        Возвращает популярные за неделю произведения из рейтинга,
+        предрассчитанного командой `refresh_trending`.
+        """
+        titles = self.get_queryset().filter(
+            trending__isnull=False
+        ).select_related('category').prefetch_related(
+            'genre'
+        ).order_by('trending__rank')
+        serializer = TitleReadSerializer(titles, many=True)
+        return Response(serializer.data)
+
+
+class UsersViewSet(IdempotentCreateMixin, TombstoneDestroyMixin,
+                   viewsets.ModelViewSet):
     """
     Представление для работы с пользователями.
     Доступно для администраторов и для аутентифицированных пользователей.
     """
     queryset = UserProfile.objects.all()
     lookup_field = 'username'
-    filter_backends = (SearchFilter,)
-    search_fields = ('username',)
+    filter_backends = (FoldedPrefixSearchFilter,)
+    search_fields = ('username_folded',)
     pagination_class = CustomPageNumberPagination
     http_method_names = ('get', 'post', 'patch', 'delete')
     permission_classes = (IsAuthenticatedAdminOrStaff,)
     serializer_class = UserSerializer
+    purge_job_kind = PURGE_USER
 
     @action(detail=False,
             methods=['get', 'patch', ],
@@ -151,9 +255,60 @@ class UsersViewSet(viewsets.ModelViewSet):
             serializer.save()
             return Response(serializer.data)
 
+    @action(detail=True,
+            methods=['get', ],
+            serializer_class=ReviewSerializer,
+            pagination_class=AuthorHistoryPagination)
+    def reviews(self, request, username=None):
+        """
+        Возвращает отзывы пользователя, начиная с самых новых.
+        Доступно только администраторам.
+        """
+        reviews = Review.objects.filter(
+            author=self.get_object()
+        ).select_related('title', 'author')
+        page = self.paginate_queryset(reviews)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True,
+            methods=['get', ],
+            serializer_class=AuthorCommentSerializer,
+            pagination_class=AuthorHistoryPagination)
+    def comments(self, request, username=None):
+        """
+        Возвращает комментарии пользователя, начиная с самых новых.
+        Доступно только администраторам.
+        """
+        comments = Comment.objects.filter(
+            author=self.get_object()
+        ).select_related('review__title', 'author')
+        page = self.paginate_queryset(comments)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False,
+            methods=['get', ],
+            url_path='me/recommendations',
+            permission_classes=(IsAuthOwner,))
+    def recommendations(self, request):
+        """
+        Возвращает персональные рекомендации произведений,
+        предрассчитанные командой `compute_recommendations`.
+        """
+        titles = Title.objects.filter(
+            recommended_to__user=request.user
+        ).select_related('category').prefetch_related(
+            'genre'
+        ).order_by('recommended_to__rank')
+        serializer = TitleReadSerializer(titles, many=True)
+        return Response(serializer.data)
+
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(IdempotentCreateMixin, TombstoneDestroyMixin,
+                    viewsets.ModelViewSet):
     serializer_class = ReviewSerializer
+    purge_job_kind = PURGE_REVIEW
     permission_classes = (IsAuthAdminModeratorAuthorOrReadOnly,)
     http_method_names = ["get", "post", "patch", "delete", ]
 
@@ -168,10 +323,10 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         title = get_object_or_404(Title, id=self.kwargs.get("title_id"))
-        serializer.save(author=self.request.user, title=title)
+        queued_write(serializer.save, author=self.request.user, title=title)
 
 
-class CommentsViewSet(viewsets.ModelViewSet):
+class CommentsViewSet(IdempotentCreateMixin, viewsets.ModelViewSet):
     serializer_class = CommentSerializer
     permission_classes = (IsAuthAdminModeratorAuthorOrReadOnly, )
     http_method_names = ["get", "post", "patch", "delete", ]
@@ -187,7 +342,9 @@ class CommentsViewSet(viewsets.ModelViewSet):
             id=self.kwargs.get("review_id"),
             title__id=self.kwargs.get("title_id")
         )
-        serializer.save(author=self.request.user, review=review)
+        queued_write(
+            serializer.save, author=self.request.user, review=review
+        )
 
     def get_queryset(self):
         review = get_object_or_404(
@@ -195,4 +352,478 @@ class CommentsViewSet(viewsets.ModelViewSet):
             id=self.kwargs.get("review_id"),
             title__id=self.kwargs.get("title_id")
         )
-        return review.comments.all()
+        # Комментарии удалённых пользователей скрыты до фоновой очистки.
+        return review.comments.filter(author__is_deleted=False)
+
+
+def in_batches(values, size=None):
+    """Разбивает список на пачки, чтобы не упираться в лимиты запроса."""
+    size = size or settings.BULK_BATCH_SIZE
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def resolve_ids(queryset, field, values):
+    """Сопоставляет значения поля первичным ключам, по запросу на пачку."""
+    result = {}
+    for batch in in_batches(set(values)):
+        result.update(
+            queryset.filter(**{f'{field}__in': batch}).values_list(field, 'pk')
+        )
+    return result
+
+
+def validate_rows(serializer_class, rows):
+    """
+    Проверяет строки одним экземпляром сериализатора,
+    чтобы не копировать поля для каждой строки.
+    Возвращает проверенные данные и ошибки вместе с номерами строк.
+    """
+    serializer = serializer_class()
+    items, errors = [], []
+    for index, row in enumerate(rows):
+        try:
+            items.append((index, serializer.run_validation(row)))
+        except serializers.ValidationError as error:
+            errors.append((index, error.detail))
+    return items, errors
+
+
+def bulk_create_with_ids(model, objs):
+    """
+    Создаёт объекты через `bulk_create` и заполняет их первичные ключи.
+    Если СУБД не возвращает ключи вставленных строк (SQLite в Django 3.2),
+    ключи восстанавливаются по последнему: внутри транзакции SQLite
+    не пускает других писателей, а AUTOINCREMENT выдаёт ключи подряд.
+    Если ключи не сходятся с числом вставленных строк, бросает
+    `IntegrityError`, который массовые загрузки превращают в 409.
+    """
+    model._base_manager.bulk_create(
+        objs, batch_size=settings.BULK_BATCH_SIZE
+    )
+    if not objs or connection.features.can_return_rows_from_bulk_insert:
+        return objs
+    if not connection.in_atomic_block:
+        raise TransactionManagementError(
+            'bulk_create_with_ids должен вызываться внутри транзакции.'
+        )
+    last_id = model._base_manager.order_by('-pk').values_list(
+        'pk', flat=True
+    ).first()
+    first_id = last_id - len(objs) + 1
+    if model._base_manager.filter(pk__gte=first_id).count() != len(objs):
+        raise IntegrityError(
+            'Не удалось восстановить первичные ключи вставленных строк.'
+        )
+    for pk, obj in enumerate(objs, first_id):
+        obj.pk = pk
+    return objs
+
+
+class BulkCreateView(IdempotentCreateMixin, APIView):
+    """
+    Базовое представление для массовой загрузки объектов.
+    Проверяет все элементы, создаёт корректные через `bulk_create`
+    и возвращает отчёт об ошибках по каждому элементу.
+    Доступно только администраторам.
+    """
+    permission_classes = (IsAuthenticatedAdminOrStaff,)
+    item_serializer_class = None
+    model = None
+
+    def build_objects(self, items):
+        """
+        Возвращает список объектов для создания, ошибки
+        и конфликты для проверенных сериализатором элементов.
+        """
+        raise NotImplementedError
+
+    def after_create(self, objs):
+        record_changes(self.model, objs, CHANGE_CREATE)
+
+    def post(self, request):
+        if not isinstance(request.data, list) or not request.data:
+            return Response(
+                {'detail': 'Ожидается непустой список объектов.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(request.data) > settings.BULK_MAX_ITEMS:
+            return Response(
+                {'detail': (
+                    f'За один запрос можно загрузить не более '
+                    f'{settings.BULK_MAX_ITEMS} объектов.'
+                )},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        items, invalid = validate_rows(
+            self.item_serializer_class, request.data
+        )
+        errors = [
+            {'index': index, 'errors': detail} for index, detail in invalid
+        ]
+        objs, rejected, conflicts = self.build_objects(items)
+        errors.extend(rejected)
+        try:
+            with transaction.atomic():
+                bulk_create_with_ids(self.model, objs)
+                self.after_create(objs)
+        except IntegrityError:
+            return Response(
+                {'detail': (
+                    'Данные изменились во время загрузки, повторите запрос.'
+                )},
+                status=status.HTTP_409_CONFLICT
+            )
+        if not errors and not conflicts:
+            response_status = status.HTTP_201_CREATED
+        elif objs:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {
+                'created': len(objs),
+                'errors': sorted(errors, key=lambda error: error['index']),
+                'conflicts': conflicts,
+            },
+            status=response_status
+        )
+
+
+class BulkReviewView(BulkCreateView):
+    """Массовая загрузка отзывов с однократным пересчётом рейтингов."""
+    item_serializer_class = BulkReviewSerializer
+    model = Review
+
+    def build_objects(self, items):
+        authors = resolve_ids(
+            UserProfile.objects, 'username',
+            (item['author'] for _, item in items)
+        )
+        titles = resolve_ids(
+            Title.objects, 'pk', (item['title'] for _, item in items)
+        )
+        reviewed = set()
+        for batch in in_batches(authors.values()):
+            reviewed.update(
+                Review.all_objects.filter(author_id__in=batch)
+                .values_list('author_id', 'title_id')
+            )
+        objs, errors, conflicts = [], [], []
+        for index, item in items:
+            author_id = authors.get(item['author'])
+            title_id = titles.get(item['title'])
+            item_errors = {}
+            if author_id is None:
+                item_errors['author'] = ['Пользователь не найден.']
+            if title_id is None:
+                item_errors['title'] = ['Произведение не найдено.']
+            if item_errors:
+                errors.append({'index': index, 'errors': item_errors})
+            elif (author_id, title_id) in reviewed:
+                conflicts.append({
+                    'index': index,
+                    'title': title_id,
+                    'author': item['author'],
+                    'constraint': 'unique_review',
+                })
+            else:
+                reviewed.add((author_id, title_id))
+                objs.append(Review(
+                    title_id=title_id,
+                    author_id=author_id,
+                    text=item['text'],
+                    score=item['score']
+                ))
+        return objs, errors, conflicts
+
+    def after_create(self, objs):
+        super().after_create(objs)
+        apply_score_changes((obj.title_id, obj.score, 1) for obj in objs)
+        record_review_activity(
+            (obj.title_id, obj.pub_date, 1, obj.score) for obj in objs
+        )
+
+
+class BulkCommentView(BulkCreateView):
+    """Массовая загрузка комментариев к отзывам."""
+    item_serializer_class = BulkCommentSerializer
+    model = Comment
+
+    def build_objects(self, items):
+        authors = resolve_ids(
+            UserProfile.objects, 'username',
+            (item['author'] for _, item in items)
+        )
+        reviews = resolve_ids(
+            Review.objects, 'pk', (item['review'] for _, item in items)
+        )
+        objs, errors = [], []
+        for index, item in items:
+            author_id = authors.get(item['author'])
+            review_id = reviews.get(item['review'])
+            item_errors = {}
+            if author_id is None:
+                item_errors['author'] = ['Пользователь не найден.']
+            if review_id is None:
+                item_errors['review'] = ['Отзыв не найден.']
+            if item_errors:
+                errors.append({'index': index, 'errors': item_errors})
+            else:
+                objs.append(Comment(
+                    review_id=review_id,
+                    author_id=author_id,
+                    text=item['text']
+                ))
+        return objs, errors, []
+
+
+class CatalogImportView(IdempotentCreateMixin, APIView):
+    """
+    Импорт каталога: категорий, жанров и произведений вместе
+    со связями с жанрами. Категории и жанры сопоставляются по `slug`,
+    произведения — по `id`. Строки обрабатываются пачками в одной
+    транзакции, в ответе возвращается результат по каждой строке.
+    Доступно только администраторам.
+    """
+    permission_classes = (IsAuthenticatedAdminOrStaff,)
+    sections = (
+        ('categories', BulkInfoSerializer),
+        ('genres', BulkInfoSerializer),
+        ('titles', BulkTitleSerializer),
+    )
+
+    def upsert_info(self, model, items, report):
+        seen = set()
+        for batch in in_batches(items):
+            # Удалённые объекты тоже ищутся: их слаг занят до очистки.
+            existing = model._base_manager.in_bulk(
+                [item['slug'] for _, item in batch], field_name='slug'
+            )
+            created, updated = [], []
+            for index, item in batch:
+                slug = item['slug']
+                if slug in seen:
+                    report.append({
+                        'index': index,
+                        'status': 'error',
+                        'errors': {'slug': ['Повторяющийся slug в запросе.']},
+                    })
+                    continue
+                seen.add(slug)
+                obj = existing.get(slug)
+                if getattr(obj, 'is_deleted', False):
+                    report.append({
+                        'index': index,
+                        'status': 'error',
+                        'errors': {'slug': [
+                            'Slug занят объектом, ожидающим удаления.'
+                        ]},
+                    })
+                    continue
+                if obj is None:
+                    created.append(model(**item))
+                    row_status = 'created'
+                elif obj.name != item['name']:
+                    obj.name = item['name']
+                    updated.append(obj)
+                    row_status = 'updated'
+                else:
+                    row_status = 'unchanged'
+                report.append(
+                    {'index': index, 'slug': slug, 'status': row_status}
+                )
+            bulk_create_with_ids(model, created)
+            fill_folded_fields(updated)
+            model.objects.bulk_update(updated, ['name', 'name_folded'])
+            record_changes(model, created, CHANGE_CREATE)
+            record_changes(model, updated, CHANGE_UPDATE)
+            if created:
+                invalidate_slug_map(model)
+
+    def title_errors(self, item, title, categories, genres):
+        errors = {}
+        if item.get('id') and title is None:
+            errors['id'] = ['Произведение не найдено.']
+        if item.get('category') and item['category'] not in categories:
+            errors['category'] = ['Категория не найдена.']
+        missing = [slug for slug in item['genre'] if slug not in genres]
+        if missing:
+            errors['genre'] = [f'Жанры не найдены: {", ".join(missing)}.']
+        return errors
+
+    def import_titles(self, items, report):
+        through = Title.genre.through
+        seen = set()
+        for batch in in_batches(items):
+            categories = resolve_ids(
+                Category.objects, 'slug',
+                (item['category'] for _, item in batch if item.get('category'))
+            )
+            genres = resolve_ids(
+                Genre.objects, 'slug',
+                (slug for _, item in batch for slug in item['genre'])
+            )
+            existing = Title.objects.in_bulk(
+                [item['id'] for _, item in batch if item.get('id')]
+            )
+            created, updated, rows = [], [], []
+            for index, item in batch:
+                title = existing.get(item.get('id'))
+                errors = self.title_errors(item, title, categories, genres)
+                if title is not None and title.pk in seen:
+                    errors['id'] = ['Повторяющийся id в запросе.']
+                if errors:
+                    report.append(
+                        {'index': index, 'status': 'error', 'errors': errors}
+                    )
+                    continue
+                if title is None:
+                    title = Title()
+                    created.append(title)
+                else:
+                    seen.add(title.pk)
+                    updated.append(title)
+                title.name = item['name']
+                title.year = item['year']
+                title.description = item.get('description')
+                title.category_id = categories.get(item.get('category'))
+                rows.append((index, title, {genres[s] for s in item['genre']}))
+            bulk_create_with_ids(Title, created)
+            fill_folded_fields(updated)
+            Title.objects.bulk_update(
+                updated,
+                ['name', 'name_folded', 'year', 'description', 'category']
+            )
+            through.objects.filter(
+                title_id__in=[title.pk for title in updated]
+            ).delete()
+            through.objects.bulk_create(
+                [
+                    through(title_id=title.pk, genre_id=genre_id)
+                    for _, title, genre_ids in rows
+                    for genre_id in genre_ids
+                ],
+                batch_size=settings.BULK_BATCH_SIZE
+            )
+            index_titles(created + updated)
+            record_changes(Title, created, CHANGE_CREATE)
+            record_changes(Title, updated, CHANGE_UPDATE)
+            created_ids = {title.pk for title in created}
+            report.extend(
+                {
+                    'index': index,
+                    'id': title.pk,
+                    'status': (
+                        'created' if title.pk in created_ids else 'updated'
+                    ),
+                }
+                for index, title, _ in rows
+            )
+
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            return Response(
+                {'detail': (
+                    'Ожидается объект с ключами '
+                    '`categories`, `genres` и `titles`.'
+                )},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        validated, report = {}, {}
+        for section, serializer_class in self.sections:
+            rows = request.data.get(section, [])
+            if not isinstance(rows, list):
+                return Response(
+                    {section: ['Ожидается список объектов.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if len(rows) > settings.CATALOG_IMPORT_MAX_ITEMS:
+                return Response(
+                    {section: [(
+                        f'За один запрос можно загрузить не более '
+                        f'{settings.CATALOG_IMPORT_MAX_ITEMS} объектов.'
+                    )]},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            validated[section], invalid = validate_rows(
+                serializer_class, rows
+            )
+            report[section] = [
+                {'index': index, 'status': 'error', 'errors': detail}
+                for index, detail in invalid
+            ]
+        try:
+            with transaction.atomic():
+                self.upsert_info(
+                    Category, validated['categories'], report['categories']
+                )
+                self.upsert_info(
+                    Genre, validated['genres'], report['genres']
+                )
+                self.import_titles(validated['titles'], report['titles'])
+        except IntegrityError:
+            return Response(
+                {'detail': (
+                    'Данные изменились во время загрузки, повторите запрос.'
+                )},
+                status=status.HTTP_409_CONFLICT
+            )
+        invalidate_catalog_cache()
+        rows = [row for section in report.values() for row in section]
+        failed = sum(row['status'] == 'error' for row in rows)
+        if not failed:
+            response_status = status.HTTP_201_CREATED
+        elif failed < len(rows):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        for section in report.values():
+            section.sort(key=lambda row: row['index'])
+        return Response(report, status=response_status)
+
+
+class BackgroundJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Состояние фоновых задач, например очистки после удаления.
+    Доступно только администраторам.
+    """
+    queryset = BackgroundJob.objects.all()
+    serializer_class = BackgroundJobSerializer
+    permission_classes = (IsAuthenticatedAdminOrStaff,)
+
+
+class ChangeFeedView(APIView):
+    """
+    Лента изменений каталога, отзывов и комментариев.
+    Клиент передаёт в `since` курсор из предыдущего ответа
+    и получает следующие записи журнала, не более `limit` за раз.
+    Записи добавляются в транзакциях изменений, а SQLite пропускает
+    писателей по одному, поэтому порядок номеров совпадает
+    с порядком фиксации и записи не появляются позади курсора.
+    """
+    permission_classes = (AllowAny,)
+
+    def get(self, request):
+        try:
+            since = int(request.query_params.get('since', 0))
+            limit = int(
+                request.query_params.get('limit', settings.CHANGES_PAGE_SIZE)
+            )
+        except ValueError:
+            return Response(
+                {'detail': 'Параметры `since` и `limit` должны быть числами.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = min(max(limit, 1), settings.CHANGES_MAX_PAGE_SIZE)
+        entries = list(
+            ChangeLogEntry.objects.filter(pk__gt=since)[:limit + 1]
+        )
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        return Response({
+            'results': ChangeLogEntrySerializer(entries, many=True).data,
+            'next_cursor': entries[-1].pk if entries else since,
+            'has_more': has_more,
+        })
@@ -0,0 +1,96 @@
+import re
+import sys
+import time
+from collections import Counter
+from io import BytesIO
+
+from django.conf import settings
+from django.db.models import Count
+
+from reviews.models import Category, Genre, Title
+from reviews.slugs import get_slug_map
+
+ACCESS_LOG_REQUEST = re.compile(r'"GET (?P<url>/api/\S*) HTTP/[\d.]+" 200 ')
+
+
+def popular_title_urls(limit):
+    """Страницы самых обсуждаемых произведений и их отзывов."""
+    prefix = f'/api/{settings.API_VERSION}/titles'
+    title_ids = (
+        Title.objects.annotate(review_count=Count('reviews'))
+        .order_by('-review_count', 'pk')
+        .values_list('pk', flat=True)[:limit]
+    )
+    return [
+        url
+        for pk in title_ids
+        for url in (f'{prefix}/{pk}/', f'{prefix}/{pk}/reviews/')
+    ]
+
+
+def top_logged_urls(path, limit):
+    """
+    Самые частые успешные GET-запросы к API
+    из журнала доступа в формате common/combined.
+    """
+    counter = Counter()
+    with open(path, encoding='utf-8', errors='replace') as log:
+        for line in log:
+            match = ACCESS_LOG_REQUEST.search(line)
+            if match:
+                counter[match['url']] += 1
+    return [url for url, _ in counter.most_common(limit)]
+
+
+def default_urls():
+    return [
+        *settings.WARMUP_URLS,
+        *popular_title_urls(settings.WARMUP_POPULAR_TITLES),
+    ]
+
+
+def replay(application, url):
+    """Выполняет GET-запрос через WSGI-приложение текущего процесса."""
+    path, _, query = url.partition('?')
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SERVER_NAME': settings.WARMUP_HOST,
+        'SERVER_PORT': '80',
+        'HTTP_HOST': settings.WARMUP_HOST,
+        'HTTP_ACCEPT': 'application/json',
+        'wsgi.input': BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.url_scheme': 'http',
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+        'wsgi.version': (1, 0),
+    }
+    status = []
+    response = application(
+        environ, lambda code, headers, exc_info=None: status.append(code)
+    )
+    try:
+        for _ in response:
+            pass
+    finally:
+        response.close()
+    return int(status[0].split()[0])
+
+
+def warm_up(application, urls):
+    """
+    Прогревает кеши процесса: словари слагов, кеши ответов
+    и агрегатов, а также страничный кеш SQLite, прогоняя запросы
+    к указанным адресам. Возвращает статус и время каждого запроса.
+    """
+    get_slug_map(Category)
+    get_slug_map(Genre)
+    results = []
+    for url in urls:
+        started = time.perf_counter()
+        status = replay(application, url)
+        results.append((url, status, time.perf_counter() - started))
+    return results
@@ -1,5 +1,7 @@
-from pathlib import Path
 from datetime import timedelta
+from importlib.util import find_spec
+from pathlib import Path
+from tempfile import gettempdir
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -30,6 +32,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Трассировка стоит первой, чтобы охватить все остальные middleware.
+    "api.tracing.TracingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -67,9 +71,47 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Сколько писатель ждёт, пока SQLite освободит блокировку, с.
+        "OPTIONS": {"timeout": 20},
     }
 }
 
+# Отзывы и комментарии можно записывать через единственный поток
+# записи, который фиксирует накопившиеся запросы одной транзакцией.
+WRITE_QUEUE_ENABLED = False
+WRITE_QUEUE_BATCH_SIZE = 100
+WRITE_QUEUE_TIMEOUT = 30
+
+
+# Cache
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+FACETS_CACHE_TIMEOUT = 60 * 15
+
+# Кеш чтения произведений, жанров и категорий, с: сколько ответ
+# свежий, сколько ещё отдаётся устаревшим во время фонового
+# пересчёта и сколько ждать пересчёта, занятого другим запросом.
+READ_CACHE_TIMEOUT = 60
+READ_CACHE_STALE_TIMEOUT = 60 * 5
+READ_CACHE_LOCK_TIMEOUT = 10
+READ_CACHE_POLL_INTERVAL = 0.02
+
+# Прогрев кешей после деплоя (команда warm_cache).
+WARMUP_ON_STARTUP = False
+WARMUP_HOST = "localhost"
+WARMUP_URLS = (
+    "/api/v1/titles/",
+    "/api/v1/titles/facets/",
+    "/api/v1/genres/",
+    "/api/v1/categories/",
+)
+WARMUP_POPULAR_TITLES = 10
+
 
 # Password validation
 
@@ -116,8 +158,62 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 5,
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.FastJSONRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "api.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # Ставка задаёт ёмкость корзины жетонов и скорость её пополнения.
+    "DEFAULT_THROTTLE_CLASSES": (
+        "api.throttles.AnonReadThrottle",
+        "api.throttles.UserThrottle",
+    ),
+    "DEFAULT_THROTTLE_RATES": {
+        "auth": "10/min",
+        "anon_read": "120/min",
+        "user": "600/min",
+    },
 }
 
+# Индекс подсказок названий: бюджет ключей в памяти процесса
+# (около 130 байт на ключ) и как часто догонять журнал изменений, с.
+AUTOCOMPLETE_MAX_KEYS = 500_000
+AUTOCOMPLETE_REFRESH_INTERVAL = 5
+
+# Трассировка запросов: доля трассируемых запросов, трассировать ли
+# запросы с заголовком X-Trace-Id всегда (его может прислать любой
+# клиент, поэтому только для внутренних сетей) и файл для Perfetto
+# или chrome://tracing. Файл больше TRACING_MAX_FILE_SIZE байт
+# переименовывается в `.1`, прежняя копия удаляется.
+TRACING_ENABLED = False
+TRACING_SAMPLE_RATE = 0.01
+TRACING_ACCEPT_TRACE_ID = False
+TRACING_OUTPUT_PATH = Path(gettempdir()) / "api_yamdb_traces.json"
+TRACING_MAX_FILE_SIZE = 50 * 1024 * 1024
+
+# Корзины жетонов общие для всех рабочих процессов на машине.
+THROTTLE_STORE_PATH = Path(gettempdir()) / "api_yamdb_throttle.sqlite3"
+# Как часто удалять корзины, к которым давно не обращались, с.
+THROTTLE_PURGE_INTERVAL = 24 * 60 * 60
+
+# MessagePack доступен, только если установлен пакет msgpack.
+if find_spec("msgpack") is not None:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] += (
+        "api.renderers.MessagePackRenderer",
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] += (
+        "api.parsers.MessagePackParser",
+    )
+
+# Браузерная версия API нужна только при разработке.
+if DEBUG:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] += (
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+
 EMAIL_BACKEND = "django.core.mail.backends.filebased.EmailBackend"
 EMAIL_FILE_PATH = BASE_DIR / "sent_emails"
 
@@ -128,5 +224,26 @@ SIMPLE_JWT = {
 
 NOT_ALLOWED_USERNAME = "me"
 CUSTOM_PAGE_SIZE = 10
+BULK_MAX_ITEMS = 10000
+BULK_BATCH_SIZE = 500
+CATALOG_IMPORT_MAX_ITEMS = 200000
+PURGE_BATCH_SIZE = 1000
+
+# Лента изменений: размер страницы по умолчанию и максимальный.
+CHANGES_PAGE_SIZE = 100
+CHANGES_MAX_PAGE_SIZE = 1000
+
+# Ключи идемпотентности: срок хранения ответа и ожидание
+# параллельного запроса с тем же ключом, с.
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60
+IDEMPOTENCY_WAIT_TIMEOUT = 10
+IDEMPOTENCY_POLL_INTERVAL = 0.05
 
 API_VERSION = 'v1'
+
+# Целевое время холодного старта рабочего процесса, с: медиана
+# замеров profile_startup на одном ядре (0.88–1.06 с) с запасом
+# около 15 %, чтобы команда ловила регрессии импорта.
+STARTUP_TIME_TARGET = 1.2
+
+RECOMMENDATIONS_MODEL_PATH = BASE_DIR / "recommendations.npz"
@@ -1,27 +1,65 @@
 from django.contrib import admin
 
-from reviews.models import Category, Genre, Title
+from reviews.constants import SELF_DESCRIPTION_LENGTH
+from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.paginators import EstimatedCountPaginator
 
 
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ('pk', 'name', 'slug')
     search_fields = ('name',)
-    empty_value_diplay = '-пусто-'
+    empty_value_display = '-пусто-'
 
 
 class GenreAdmin(admin.ModelAdmin):
     list_display = ('pk', 'name', 'slug')
     search_fields = ('name',)
-    empty_value_diplay = '-пусто-'
+    empty_value_display = '-пусто-'
 
 
 class TitleAdmin(admin.ModelAdmin):
-    list_display = ('pk', 'name', 'description', 'year', 'category')
-    search_fields = ('name',)
-    list_filter = ('year', 'category')
-    empty_value_diplay = '-пусто-'
+    list_display = ('pk', 'name', 'year', 'category', 'rating')
+    list_select_related = ('category',)
+    search_fields = ('^name', '=pk')
+    autocomplete_fields = ('category', 'genre')
+    readonly_fields = ('rating',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    empty_value_display = '-пусто-'
+
+
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ('pk', 'title', 'author', 'score', 'short_text', 'pub_date')
+    list_select_related = ('title', 'author')
+    search_fields = ('=pk', '=author__username', '=title__pk')
+    raw_id_fields = ('title', 'author')
+    ordering = ('-pk',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    empty_value_display = '-пусто-'
+
+    @admin.display(description='Текст')
+    def short_text(self, obj):
+        return obj.text[:SELF_DESCRIPTION_LENGTH]
+
+
+class CommentAdmin(admin.ModelAdmin):
+    list_display = ('pk', 'review', 'author', 'short_text', 'pub_date')
+    list_select_related = ('review', 'author')
+    search_fields = ('=pk', '=author__username', '=review__pk')
+    raw_id_fields = ('review', 'author')
+    ordering = ('-pk',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    empty_value_display = '-пусто-'
+
+    @admin.display(description='Текст')
+    def short_text(self, obj):
+        return obj.text[:SELF_DESCRIPTION_LENGTH]
 
 
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(Genre, GenreAdmin)
 admin.site.register(Title, TitleAdmin)
+admin.site.register(Review, ReviewAdmin)
+admin.site.register(Comment, CommentAdmin)
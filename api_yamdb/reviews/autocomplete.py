@@ -0,0 +1,198 @@
+import heapq
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db.models import Count, Max, Q
+
+from reviews.constants import (AUTOCOMPLETE_MAX_INCREMENTAL,
+                               AUTOCOMPLETE_SCAN_LIMIT)
+from reviews.models import ChangeLogEntry, Title
+from users.fields import fold
+
+# Наибольший символ Unicode: все строки с префиксом `p` лежат
+# в диапазоне [p, p + MAX_CHAR), который ищется бинарным поиском
+# в отсортированных ключах или по индексу СУБД.
+MAX_CHAR = chr(0x10FFFF)
+
+
+def name_keys(name):
+    """
+    Ключи названия: свёрнутое название целиком и его окончания
+    с начала каждого следующего слова, чтобы подсказка находилась
+    и по слову из середины названия.
+    """
+    folded = fold(name)
+    keys = [folded]
+    for position, char in enumerate(folded):
+        if char == ' ':
+            keys.append(folded[position + 1:])
+    return keys
+
+
+def load_titles(queryset):
+    """Название и популярность (число отзывов) произведений выборки."""
+    return queryset.annotate(
+        weight=Count('reviews', filter=Q(reviews__is_deleted=False))
+    ).values_list('pk', 'name', 'weight')
+
+
+class PrefixIndex:
+    """
+    Отсортированный список ключей названий с параллельным массивом
+    идентификаторов произведений. Поиск по префиксу — двоичный поиск
+    границ диапазона и выбор самых популярных произведений в нём.
+    """
+
+    def __init__(self, max_keys):
+        self.max_keys = max_keys
+        self.keys = []
+        self.ids = array('q')
+        self.titles = {}
+        self.top = {}
+
+    def build(self, rows):
+        """
+        Строит индекс заново. Если ключей больше бюджета,
+        в индекс попадают самые популярные произведения.
+        """
+        entries = []
+        self.titles = {}
+        for title_id, name, weight in sorted(rows, key=lambda row: -row[2]):
+            keys = name_keys(name)
+            if len(entries) + len(keys) > self.max_keys:
+                break
+            self.titles[title_id] = (name, weight)
+            entries.extend((key, title_id) for key in keys)
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.ids = array('q', (title_id for _, title_id in entries))
+        self.top = {}
+
+    def _position(self, key, title_id):
+        position = bisect_left(self.keys, key)
+        while (
+            position < len(self.keys) and self.keys[position] == key
+            and self.ids[position] < title_id
+        ):
+            position += 1
+        return position
+
+    def remove(self, title_id):
+        entry = self.titles.pop(title_id, None)
+        if entry is None:
+            return
+        for key in name_keys(entry[0]):
+            position = self._position(key, title_id)
+            del self.keys[position]
+            del self.ids[position]
+
+    def add(self, title_id, name, weight):
+        self.titles[title_id] = (name, weight)
+        for key in name_keys(name):
+            position = self._position(key, title_id)
+            self.keys.insert(position, key)
+            self.ids.insert(position, title_id)
+
+    def update(self, rows, removed):
+        """Заменяет записи изменённых произведений и удаляет удалённые."""
+        for title_id in removed:
+            self.remove(title_id)
+        for title_id, name, weight in rows:
+            self.remove(title_id)
+            self.add(title_id, name, weight)
+        self.top = {}
+
+    def lookup(self, prefix, limit):
+        """
+        Идентификаторы самых популярных произведений, название
+        или слово названия которых начинается с префикса.
+        Для коротких префиксов с большим диапазоном результат
+        запоминается до следующего изменения индекса.
+        """
+        low = bisect_left(self.keys, prefix)
+        high = bisect_left(self.keys, prefix + MAX_CHAR, low)
+        wide = high - low > AUTOCOMPLETE_SCAN_LIMIT
+        if wide:
+            cached = self.top.get(prefix)
+            if cached is not None and cached[0] >= limit:
+                return cached[1][:limit]
+        best = heapq.nsmallest(
+            limit, set(self.ids[low:high]),
+            key=lambda title_id: (-self.titles[title_id][1], title_id)
+        )
+        if wide:
+            self.top[prefix] = (limit, best)
+        return best
+
+
+class Autocomplete:
+    """
+    Индекс подсказок процесса. Строится при первом обращении
+    и догоняет изменения произведений и отзывов по журналу
+    изменений не чаще раза в `AUTOCOMPLETE_REFRESH_INTERVAL` секунд.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index = None
+        self.cursor = 0
+        self.checked = 0
+
+    def rebuild(self):
+        self.cursor = ChangeLogEntry.objects.aggregate(
+            cursor=Max('pk')
+        )['cursor'] or 0
+        self.index = PrefixIndex(settings.AUTOCOMPLETE_MAX_KEYS)
+        self.index.build(load_titles(Title.objects.all()))
+
+    def catch_up(self):
+        """Применяет к индексу изменения из журнала после курсора."""
+        changes = list(
+            ChangeLogEntry.objects.filter(
+                pk__gt=self.cursor, model__in=('title', 'review')
+            ).values_list('pk', 'model', 'object_id', 'title_id')[
+                :AUTOCOMPLETE_MAX_INCREMENTAL + 1
+            ]
+        )
+        if len(changes) > AUTOCOMPLETE_MAX_INCREMENTAL:
+            self.rebuild()
+            return
+        if not changes:
+            return
+        affected = {
+            object_id if model == 'title' else title_id
+            for _, model, object_id, title_id in changes
+        }
+        rows = list(load_titles(Title.objects.filter(pk__in=affected)))
+        self.index.update(rows, affected - {row[0] for row in rows})
+        self.cursor = changes[-1][0]
+        if len(self.index.keys) > self.index.max_keys:
+            self.rebuild()
+
+    def suggest(self, query, limit):
+        """Подсказки для строки поиска: список `id` и `name`."""
+        prefix = fold(query)
+        with self.lock:
+            now = time.monotonic()
+            if self.index is None:
+                self.rebuild()
+                self.checked = now
+            elif now - self.checked >= settings.AUTOCOMPLETE_REFRESH_INTERVAL:
+                self.catch_up()
+                self.checked = now
+            if not prefix:
+                return []
+            return [
+                {'id': title_id, 'name': self.index.titles[title_id][0]}
+                for title_id in self.index.lookup(prefix, limit)
+            ]
+
+    def reset(self):
+        with self.lock:
+            self.index = None
+
+
+autocomplete = Autocomplete()
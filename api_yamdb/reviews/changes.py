@@ -0,0 +1,58 @@
+from reviews.constants import CHANGE_UPDATE
+from reviews.models import ChangeLogEntry, Comment, Review
+
+
+def _comment_title_ids(comments):
+    """
+    Идентификаторы произведений комментариев: из закешированного
+    отзыва или одним запросом для остальных.
+    """
+    missing = {
+        comment.review_id for comment in comments
+        if not Comment.review.is_cached(comment)
+    }
+    title_ids = dict(
+        Review.all_objects.filter(pk__in=missing).values_list('pk', 'title_id')
+    ) if missing else {}
+    return [
+        comment.review.title_id if Comment.review.is_cached(comment)
+        else title_ids.get(comment.review_id)
+        for comment in comments
+    ]
+
+
+def record_changes(model, objs, action):
+    """
+    Добавляет в журнал изменений записи об объектах одной модели.
+    Для отзывов и комментариев сохраняются идентификаторы родителей,
+    чтобы клиент мог построить адрес объекта в API.
+    Пересчёт рейтинга отдельной записью не отмечается: о нём
+    говорит запись об изменении отзыва с `title_id` произведения.
+    """
+    objs = list(objs)
+    if not objs:
+        return
+    name = model._meta.model_name
+    if model is Comment:
+        title_ids = _comment_title_ids(objs)
+    else:
+        title_ids = [getattr(obj, 'title_id', None) for obj in objs]
+    ChangeLogEntry.objects.bulk_create(
+        ChangeLogEntry(
+            model=name,
+            object_id=obj.pk,
+            action=action,
+            slug=getattr(obj, 'slug', ''),
+            title_id=title_id,
+            review_id=getattr(obj, 'review_id', None),
+        )
+        for obj, title_id in zip(objs, title_ids)
+    )
+
+
+def record_title_updates(title_ids):
+    """Записывает изменение произведений, известных только по ID."""
+    ChangeLogEntry.objects.bulk_create(
+        ChangeLogEntry(model='title', object_id=pk, action=CHANGE_UPDATE)
+        for pk in title_ids
+    )
@@ -3,3 +3,69 @@ MAX_SLUG_LENGTH = 50
 SELF_DESCRIPTION_LENGTH = 20
 MIN_SCORE = 1
 MAX_SCORE = 10
+YEAR_BUCKET_SIZE = 10
+FACETS_CACHE_KEY = 'titles:facets'
+CATALOG_CACHE_VERSION_KEY = 'catalog:version'
+CATALOG_CACHE_KEY = 'catalog:{version}:{digest}'
+CATALOG_MODELS = ('category', 'genre', 'title')
+RATED_CATALOG_MODELS = CATALOG_MODELS + ('review',)
+ADMIN_EXACT_COUNT_LIMIT = 10000
+SIMILAR_TITLES_TOP_K = 10
+SIMILAR_TITLES_SCORE_CELLS = 1_000_000
+SIMILAR_TITLES_GENRE_WEIGHT = 0.3
+SIMILAR_TITLES_SHRINKAGE = 5
+RECOMMENDATIONS_TOP_N = 20
+RECOMMENDATIONS_FACTORS = 20
+RECOMMENDATIONS_REGULARIZATION = 0.1
+RECOMMENDATIONS_ITERATIONS = 10
+RECOMMENDATIONS_CHUNK_SIZE = 10000
+RECOMMENDATIONS_SCORE_CELLS = 10_000_000
+TRENDING_WINDOW_DAYS = 7
+TRENDING_HOURLY_HOURS = 48
+TRENDING_TOP_N = 50
+TRIGRAM_LENGTH = 3
+FUZZY_SEARCH_TOP_K = 20
+FUZZY_SEARCH_CANDIDATES = 200
+FUZZY_SEARCH_MIN_SIMILARITY = 0.3
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 50
+AUTOCOMPLETE_SCAN_LIMIT = 1000
+AUTOCOMPLETE_MAX_INCREMENTAL = 1000
+
+JOB_PENDING = 'pending'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_STATUS_CHOICES = (
+    (JOB_PENDING, 'В очереди'),
+    (JOB_RUNNING, 'Выполняется'),
+    (JOB_DONE, 'Завершена'),
+    (JOB_FAILED, 'Ошибка'),
+)
+MAX_JOB_STATUS_LENGTH = 16
+
+PURGE_TITLE = 'purge_title'
+PURGE_REVIEW = 'purge_review'
+PURGE_USER = 'purge_user'
+PURGE_CATEGORY = 'purge_category'
+JOB_KIND_CHOICES = (
+    (PURGE_TITLE, 'Очистка удалённого произведения'),
+    (PURGE_REVIEW, 'Очистка удалённого отзыва'),
+    (PURGE_USER, 'Очистка удалённого пользователя'),
+    (PURGE_CATEGORY, 'Отвязка произведений от удалённой категории'),
+)
+MAX_JOB_KIND_LENGTH = 32
+
+CHANGE_CREATE = 'create'
+CHANGE_UPDATE = 'update'
+CHANGE_DELETE = 'delete'
+CHANGE_ACTION_CHOICES = (
+    (CHANGE_CREATE, 'Создание'),
+    (CHANGE_UPDATE, 'Изменение'),
+    (CHANGE_DELETE, 'Удаление'),
+)
+MAX_CHANGE_ACTION_LENGTH = 8
+MAX_CHANGE_MODEL_LENGTH = 16
+
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+MAX_CONTENT_TYPE_LENGTH = 128
@@ -0,0 +1,79 @@
+import re
+
+from django.db import transaction
+from django.db.models import Count
+
+from reviews.constants import (FUZZY_SEARCH_CANDIDATES,
+                               FUZZY_SEARCH_MIN_SIMILARITY, FUZZY_SEARCH_TOP_K,
+                               TRIGRAM_LENGTH)
+from reviews.models import TitleTrigram
+from users.fields import fold
+
+WORDS = re.compile(r'\w+')
+
+
+def trigrams(text):
+    """
+    Триграммы строки, как в pg_trgm: строка сворачивается по регистру,
+    каждое слово дополняется двумя пробелами в начале и одним в конце.
+    """
+    result = set()
+    for word in WORDS.findall(fold(text)):
+        padded = f'  {word} '
+        result.update(
+            padded[start:start + TRIGRAM_LENGTH]
+            for start in range(len(padded) - TRIGRAM_LENGTH + 1)
+        )
+    return result
+
+
+def index_titles(titles):
+    """Перестраивает триграммы названий переданных произведений."""
+    titles = list(titles)
+    if not titles:
+        return
+    with transaction.atomic():
+        TitleTrigram.objects.filter(
+            title_id__in=[title.pk for title in titles]
+        ).delete()
+        TitleTrigram.objects.bulk_create(
+            TitleTrigram(trigram=trigram, title_id=title.pk)
+            for title in titles
+            for trigram in trigrams(title.name)
+        )
+
+
+def fuzzy_search(query, limit=FUZZY_SEARCH_TOP_K):
+    """
+    Возвращает идентификаторы произведений, похожих по названию
+    на запрос, в порядке убывания сходства: доли общих триграмм
+    среди всех триграмм запроса и названия.
+
+    Рассматриваются только произведения, у которых есть общие
+    с запросом триграммы, и из них не больше
+    `FUZZY_SEARCH_CANDIDATES` с наибольшим числом совпадений.
+    """
+    query_trigrams = trigrams(query)
+    if not query_trigrams:
+        return []
+    shared = dict(
+        TitleTrigram.objects.filter(trigram__in=query_trigrams)
+        .values('title_id')
+        .annotate(shared=Count('pk'))
+        .order_by('-shared')
+        .values_list('title_id', 'shared')[:FUZZY_SEARCH_CANDIDATES]
+    )
+    totals = (
+        TitleTrigram.objects.filter(title_id__in=list(shared))
+        .values('title_id')
+        .annotate(total=Count('pk'))
+        .values_list('title_id', 'total')
+    )
+    ranked = []
+    for title_id, total in totals:
+        common = shared[title_id]
+        similarity = common / (len(query_trigrams) + total - common)
+        if similarity >= FUZZY_SEARCH_MIN_SIMILARITY:
+            ranked.append((-similarity, title_id))
+    ranked.sort()
+    return [title_id for _, title_id in ranked[:limit]]
@@ -0,0 +1,173 @@
+from django.conf import settings
+from django.db import transaction
+
+from reviews.changes import record_title_updates
+from reviews.constants import (
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_PENDING,
+    JOB_RUNNING,
+    PURGE_CATEGORY,
+    PURGE_REVIEW,
+    PURGE_TITLE,
+    PURGE_USER
+)
+from reviews.models import (
+    BackgroundJob,
+    Category,
+    Comment,
+    Review,
+    SimilarTitle,
+    Title,
+    UserRecommendation
+)
+from reviews.ratings import deferred_rating_updates
+from reviews.readcache import invalidate_catalog_cache
+from users.models import UserProfile
+
+JOB_HANDLERS = {}
+
+
+def job_handler(kind):
+    """Регистрирует обработчик фоновых задач указанного типа."""
+    def decorator(func):
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+def enqueue_job(kind, object_id):
+    return BackgroundJob.objects.create(kind=kind, object_id=object_id)
+
+
+def tombstone(instance, kind):
+    """
+    Помечает объект удалённым, после чего он сразу пропадает из выдачи,
+    и ставит в очередь задачу фоновой очистки связанных данных.
+    """
+    with transaction.atomic():
+        instance.is_deleted = True
+        instance.save(update_fields=['is_deleted'])
+        return enqueue_job(kind, instance.pk)
+
+
+def delete_in_batches(job, queryset):
+    """
+    Удаляет записи выборки небольшими пачками, каждую в своей
+    транзакции, чтобы не держать блокировку на запись надолго.
+    """
+    model = queryset.model
+    while True:
+        ids = list(
+            queryset.order_by().values_list('pk', flat=True)[
+                :settings.PURGE_BATCH_SIZE
+            ]
+        )
+        if not ids:
+            return
+        with transaction.atomic(), deferred_rating_updates():
+            model._base_manager.filter(pk__in=ids).delete()
+        job.processed += len(ids)
+        job.save(update_fields=['processed', 'updated'])
+
+
+def detach_titles_in_batches(job, titles, **values):
+    """
+    Обновляет поля произведений выборки пачками без вызова сигналов.
+    После каждой пачки сбрасываются производные данные каталога,
+    чтобы выдача не расходилась с базой до конца задачи,
+    а изменения произведений записываются в журнал.
+    """
+    while True:
+        ids = list(
+            titles.order_by().values_list('pk', flat=True)[
+                :settings.PURGE_BATCH_SIZE
+            ]
+        )
+        if not ids:
+            return
+        with transaction.atomic():
+            Title.all_objects.filter(pk__in=ids).update(**values)
+            record_title_updates(ids)
+        invalidate_catalog_cache()
+        job.processed += len(ids)
+        job.save(update_fields=['processed', 'updated'])
+
+
+def purge(job, querysets):
+    """Удаляет по очереди все выборки, обновляя прогресс задачи."""
+    job.total = sum(queryset.count() for queryset in querysets)
+    job.save(update_fields=['total', 'updated'])
+    for queryset in querysets:
+        delete_in_batches(job, queryset)
+
+
+@job_handler(PURGE_TITLE)
+def purge_title(job):
+    purge(job, [
+        Comment.objects.filter(review__title_id=job.object_id),
+        Review.all_objects.filter(title_id=job.object_id),
+        UserRecommendation.objects.filter(title_id=job.object_id),
+        SimilarTitle.objects.filter(similar_id=job.object_id),
+        SimilarTitle.objects.filter(title_id=job.object_id),
+        Title.all_objects.filter(pk=job.object_id, is_deleted=True),
+    ])
+
+
+@job_handler(PURGE_REVIEW)
+def purge_review(job):
+    purge(job, [
+        Comment.objects.filter(review_id=job.object_id),
+        Review.all_objects.filter(pk=job.object_id, is_deleted=True),
+    ])
+
+
+@job_handler(PURGE_USER)
+def purge_user(job):
+    purge(job, [
+        Comment.objects.filter(review__author_id=job.object_id),
+        Comment.objects.filter(author_id=job.object_id),
+        Review.all_objects.filter(author_id=job.object_id),
+        UserRecommendation.objects.filter(user_id=job.object_id),
+        UserProfile.all_objects.filter(pk=job.object_id, is_deleted=True),
+    ])
+
+
+@job_handler(PURGE_CATEGORY)
+def purge_category(job):
+    titles = Title.all_objects.filter(category_id=job.object_id)
+    category = Category.all_objects.filter(pk=job.object_id, is_deleted=True)
+    job.total = titles.count() + category.count()
+    job.save(update_fields=['total', 'updated'])
+    detach_titles_in_batches(job, titles, category=None)
+    delete_in_batches(job, category)
+
+
+def run_job(job):
+    """
+    Выполняет задачу, если её ещё не забрал другой процесс.
+    Возвращает True, если задача была выполнена этим процессом.
+    """
+    claimed = BackgroundJob.objects.filter(
+        pk=job.pk, status=JOB_PENDING
+    ).update(status=JOB_RUNNING)
+    if not claimed:
+        return False
+    job.refresh_from_db()
+    try:
+        JOB_HANDLERS[job.kind](job)
+    except Exception as error:
+        job.status = JOB_FAILED
+        job.error = repr(error)
+    else:
+        job.status = JOB_DONE
+    job.save(update_fields=['status', 'error', 'updated'])
+    return True
+
+
+def run_pending_jobs(limit=None):
+    """Выполняет задачи из очереди в порядке поступления."""
+    done = 0
+    for job in BackgroundJob.objects.filter(status=JOB_PENDING)[:limit]:
+        done += run_job(job)
+    return done
@@ -0,0 +1,224 @@
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F, OuterRef, Q, Subquery
+from scipy import sparse
+
+from reviews.constants import (
+    MAX_SCORE,
+    MIN_SCORE,
+    RECOMMENDATIONS_CHUNK_SIZE,
+    RECOMMENDATIONS_FACTORS,
+    RECOMMENDATIONS_ITERATIONS,
+    RECOMMENDATIONS_REGULARIZATION,
+    RECOMMENDATIONS_SCORE_CELLS,
+    RECOMMENDATIONS_TOP_N
+)
+from reviews.models import Review, Title, UserRecommendation
+from reviews.recommendations import (
+    build_user_matrix,
+    factorize,
+    iter_top_unseen,
+    load_scores,
+    solve_factors
+)
+from users.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = (
+        'Расчёт персональных рекомендаций произведений '
+        'разложением матрицы оценок методом ALS.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--incremental', action='store_true',
+            help=(
+                'Пересчитать рекомендации только для пользователей '
+                'с новыми отзывами, используя сохранённые факторы.'
+            )
+        )
+        parser.add_argument(
+            '--top-n', type=int, default=RECOMMENDATIONS_TOP_N,
+            help='Сколько рекомендаций хранить для каждого пользователя.'
+        )
+        parser.add_argument(
+            '--factors', type=int, default=RECOMMENDATIONS_FACTORS,
+            help='Размерность скрытых факторов.'
+        )
+        parser.add_argument(
+            '--iterations', type=int, default=RECOMMENDATIONS_ITERATIONS,
+            help='Количество итераций ALS.'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=RECOMMENDATIONS_CHUNK_SIZE,
+            help='Сколько строк матрицы обрабатывать за один проход.'
+        )
+        parser.add_argument(
+            '--benchmark-users', type=int,
+            help=(
+                'Замерить время расчёта на синтетических данных '
+                'для указанного числа пользователей, не трогая БД.'
+            )
+        )
+        parser.add_argument(
+            '--benchmark-titles', type=int, default=20000,
+            help='Количество произведений в синтетических данных.'
+        )
+        parser.add_argument(
+            '--benchmark-reviews', type=int, default=20,
+            help='Среднее количество отзывов на пользователя.'
+        )
+
+    def store_batch(self, author_ids, title_ids, mean, rows, best, scores):
+        objs = [
+            UserRecommendation(
+                user_id=author_ids[row],
+                title_id=title_ids[title],
+                rank=rank,
+                score=float(mean + score)
+            )
+            for row, row_best, row_scores in zip(rows, best, scores)
+            for rank, (title, score) in enumerate(zip(row_best, row_scores), 1)
+            if np.isfinite(score)
+        ]
+        with transaction.atomic():
+            UserRecommendation.objects.filter(
+                user_id__in=author_ids[rows].tolist()
+            ).delete()
+            UserRecommendation.objects.bulk_create(objs)
+        return len(objs)
+
+    def store_all(self, matrix, author_ids, title_ids, user_factors,
+                  item_factors, mean, top_n):
+        stored = 0
+        for rows, best, scores in iter_top_unseen(
+            matrix, user_factors, item_factors, top_n,
+            RECOMMENDATIONS_SCORE_CELLS
+        ):
+            stored += self.store_batch(
+                author_ids, title_ids, mean, rows, best, scores
+            )
+        return stored
+
+    def refresh_all(self, options):
+        title_ids = np.array(
+            Title.objects.order_by('id').values_list('id', flat=True),
+            dtype=np.int64
+        )
+        review_titles, authors, scores = load_scores()
+        author_ids = np.unique(authors)
+        matrix, mean = build_user_matrix(
+            title_ids, review_titles, authors, scores, author_ids
+        )
+        user_factors, item_factors = factorize(
+            matrix,
+            factors=options['factors'],
+            regularization=RECOMMENDATIONS_REGULARIZATION,
+            iterations=options['iterations'],
+            chunk_size=options['chunk_size']
+        )
+        np.savez(
+            settings.RECOMMENDATIONS_MODEL_PATH,
+            title_ids=title_ids, item_factors=item_factors, mean=mean
+        )
+        return self.store_all(
+            matrix, author_ids, title_ids, user_factors, item_factors,
+            mean, options['top_n']
+        )
+
+    def refresh_incremental(self, options):
+        try:
+            model = np.load(settings.RECOMMENDATIONS_MODEL_PATH)
+        except FileNotFoundError:
+            raise CommandError(
+                'Нет сохранённой модели, сначала выполните полный расчёт.'
+            )
+        title_ids = model['title_ids']
+        item_factors = model['item_factors']
+        mean = float(model['mean'])
+        stale_users = UserProfile.objects.annotate(
+            last_review=Subquery(
+                Review.objects.filter(author=OuterRef('pk'))
+                .order_by('-pub_date').values('pub_date')[:1]
+            ),
+            refreshed=Subquery(
+                UserRecommendation.objects.filter(user=OuterRef('pk'))
+                .order_by('-created').values('created')[:1]
+            )
+        ).filter(
+            Q(refreshed__isnull=True) | Q(last_review__gt=F('refreshed')),
+            last_review__isnull=False
+        ).order_by('id').values_list('id', flat=True)
+        user_ids = np.fromiter(stale_users.iterator(), dtype=np.int64)
+        stored = 0
+        for start in range(0, len(user_ids), options['chunk_size']):
+            author_ids = user_ids[start:start + options['chunk_size']]
+            review_titles, authors, scores = load_scores(
+                Review.objects.filter(author_id__in=author_ids.tolist())
+            )
+            matrix, _ = build_user_matrix(
+                title_ids, review_titles, authors, scores, author_ids, mean
+            )
+            user_factors = solve_factors(
+                matrix, item_factors, RECOMMENDATIONS_REGULARIZATION,
+                options['chunk_size']
+            )
+            stored += self.store_all(
+                matrix, author_ids, title_ids, user_factors, item_factors,
+                mean, options['top_n']
+            )
+        return stored
+
+    def benchmark(self, options):
+        generator = np.random.default_rng(0)
+        users = options['benchmark_users']
+        titles = options['benchmark_titles']
+        per_user = generator.poisson(options['benchmark_reviews'], users)
+        rows = np.repeat(np.arange(users), per_user)
+        matrix = sparse.csr_matrix(
+            (
+                generator.integers(
+                    MIN_SCORE, MAX_SCORE + 1, len(rows)
+                ).astype(np.float32) - (MIN_SCORE + MAX_SCORE) / 2,
+                (rows, generator.integers(0, titles, len(rows)))
+            ),
+            shape=(users, titles)
+        )
+        started = time.perf_counter()
+        user_factors, item_factors = factorize(
+            matrix,
+            factors=options['factors'],
+            regularization=RECOMMENDATIONS_REGULARIZATION,
+            iterations=options['iterations'],
+            chunk_size=options['chunk_size']
+        )
+        factorized = time.perf_counter()
+        for _ in iter_top_unseen(
+            matrix, user_factors, item_factors, options['top_n'],
+            RECOMMENDATIONS_SCORE_CELLS
+        ):
+            pass
+        finished = time.perf_counter()
+        self.stdout.write(
+            f'Пользователей: {users}, произведений: {titles}, '
+            f'оценок: {matrix.nnz}\n'
+            f'Разложение: {factorized - started:.1f} с\n'
+            f'Подбор top-{options["top_n"]}: {finished - factorized:.1f} с\n'
+            f'Всего: {finished - started:.1f} с'
+        )
+
+    def handle(self, *args, **options):
+        if options['benchmark_users']:
+            return self.benchmark(options)
+        if options['incremental']:
+            stored = self.refresh_incremental(options)
+        else:
+            stored = self.refresh_all(options)
+        self.stdout.write(self.style.SUCCESS(
+            f'Сохранено рекомендаций: {stored}.'
+        ))
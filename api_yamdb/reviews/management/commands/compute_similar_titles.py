@@ -0,0 +1,84 @@
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.constants import (
+    SIMILAR_TITLES_GENRE_WEIGHT,
+    SIMILAR_TITLES_SCORE_CELLS,
+    SIMILAR_TITLES_SHRINKAGE,
+    SIMILAR_TITLES_TOP_K
+)
+from reviews.models import SimilarTitle, Title
+from reviews.recommendations import (
+    build_rating_matrix,
+    iter_similar_titles,
+    load_genre_matrix,
+    load_scores
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Пересчёт списков похожих произведений по совместным оценкам '
+        'и пересечению жанров.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k', type=int, default=SIMILAR_TITLES_TOP_K,
+            help='Сколько похожих произведений хранить для каждого.'
+        )
+        parser.add_argument(
+            '--genre-weight', type=float,
+            default=SIMILAR_TITLES_GENRE_WEIGHT,
+            help='Вес сходства по жанрам (от 0 до 1).'
+        )
+
+    def store_batch(self, title_ids, rows, neighbours, scores):
+        objs = [
+            SimilarTitle(
+                title_id=title_ids[row],
+                similar_id=title_ids[neighbour],
+                rank=rank,
+                score=float(score)
+            )
+            for row, row_neighbours, row_scores in zip(
+                rows, neighbours, scores
+            )
+            for rank, (neighbour, score) in enumerate(
+                zip(row_neighbours, row_scores), 1
+            )
+            if score > 0
+        ]
+        with transaction.atomic():
+            SimilarTitle.objects.filter(
+                title_id__in=title_ids[rows].tolist()
+            ).delete()
+            SimilarTitle.objects.bulk_create(objs)
+        return len(objs)
+
+    def handle(self, *args, **options):
+        title_ids = np.array(
+            Title.objects.order_by('id').values_list('id', flat=True),
+            dtype=np.int64
+        )
+        review_titles, authors, scores = load_scores()
+        ratings, rated = build_rating_matrix(
+            title_ids, review_titles, authors, scores
+        )
+        genres = load_genre_matrix(title_ids)
+        stored = 0
+        for rows, neighbours, similarity in iter_similar_titles(
+            ratings, rated, genres,
+            top_k=options['top_k'],
+            genre_weight=options['genre_weight'],
+            shrinkage=SIMILAR_TITLES_SHRINKAGE,
+            max_cells=SIMILAR_TITLES_SCORE_CELLS
+        ):
+            stored += self.store_batch(title_ids, rows, neighbours, similarity)
+            self.stdout.write(
+                f'Обработано произведений: {rows[-1] + 1} из {len(title_ids)}'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Сохранено пар похожих произведений: {stored}.'
+        ))
@@ -0,0 +1,61 @@
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.constants import MIN_SCORE
+from reviews.models import Title
+from reviews.ratings import SCORES
+from reviews.readcache import invalidate_catalog_cache
+from reviews.recommendations import load_scores
+
+
+class Command(BaseCommand):
+    help = (
+        'Пересчёт распределения оценок и рейтинга всех произведений '
+        'по отзывам за один проход.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Сколько произведений сохранять одним запросом.'
+        )
+
+    def handle(self, *args, **options):
+        title_ids = np.array(
+            Title.objects.order_by('id').values_list('id', flat=True),
+            dtype=np.int64
+        )
+        review_titles, _, scores = load_scores()
+        known = np.isin(review_titles, title_ids)
+        cells = (
+            np.searchsorted(title_ids, review_titles[known]) * len(SCORES)
+            + scores[known].astype(np.int64) - MIN_SCORE
+        )
+        counts = np.bincount(
+            cells, minlength=len(title_ids) * len(SCORES)
+        ).reshape(len(title_ids), len(SCORES))
+        totals = counts.sum(axis=1)
+        sums = counts @ np.array(SCORES, dtype=np.int64)
+        ratings = np.where(totals > 0, sums // np.maximum(totals, 1), -1)
+        histograms = counts.astype('<u4')
+        batch_size = options['batch_size']
+        for start in range(0, len(title_ids), batch_size):
+            titles = [
+                Title(
+                    pk=int(title_ids[row]),
+                    rating=None if ratings[row] < 0 else int(ratings[row]),
+                    score_histogram=histograms[row].tobytes(),
+                )
+                for row in range(start, min(start + batch_size,
+                                            len(title_ids)))
+            ]
+            with transaction.atomic():
+                Title.objects.bulk_update(
+                    titles, ['rating', 'score_histogram']
+                )
+        invalidate_catalog_cache()
+        self.stdout.write(self.style.SUCCESS(
+            f'Пересчитано произведений: {len(title_ids)}, '
+            f'отзывов: {int(totals.sum())}.'
+        ))
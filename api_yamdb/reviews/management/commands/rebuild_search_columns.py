@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.models import Category, Genre, Title
+from users.fields import FoldedCharField, fill_folded_fields
+from users.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = (
+        'Заполняет заново колонки для поиска без учёта регистра '
+        'у категорий, жанров, произведений и пользователей.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Сколько объектов обновлять за один запрос.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        for manager in (
+            Category.all_objects, Genre.objects,
+            Title.all_objects, UserProfile.all_objects,
+        ):
+            fields = [
+                field for field in manager.model._meta.concrete_fields
+                if isinstance(field, FoldedCharField)
+            ]
+            objs = list(manager.only(
+                'pk', *(field.source for field in fields)
+            ))
+            fill_folded_fields(objs)
+            with transaction.atomic():
+                manager.bulk_update(
+                    objs, [field.name for field in fields],
+                    batch_size=batch_size
+                )
+            self.stdout.write(
+                f'{manager.model._meta.verbose_name_plural}: {len(objs)}'
+            )
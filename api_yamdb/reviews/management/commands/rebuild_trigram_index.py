@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from reviews.fuzzy import index_titles
+from reviews.models import Title
+
+
+class Command(BaseCommand):
+    help = (
+        'Перестраивает триграммный индекс названий произведений '
+        'для нечёткого поиска.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Сколько произведений индексировать за одну транзакцию.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id, indexed = 0, 0
+        while True:
+            titles = list(
+                Title.objects.filter(pk__gt=last_id)
+                .order_by('pk').only('pk', 'name')[:batch_size]
+            )
+            if not titles:
+                break
+            index_titles(titles)
+            last_id = titles[-1].pk
+            indexed += len(titles)
+        self.stdout.write(self.style.SUCCESS(
+            f'Проиндексировано произведений: {indexed}.'
+        ))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from reviews.constants import TRENDING_TOP_N
+from reviews.trending import compact_activity, refresh_trending
+
+
+class Command(BaseCommand):
+    help = (
+        'Сжатие счётчиков активности по произведениям и пересчёт '
+        'списка популярных произведений. Запускается периодически.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-n', type=int, default=TRENDING_TOP_N,
+            help='Сколько произведений хранить в списке популярных.'
+        )
+
+    def handle(self, *args, **options):
+        expired, compacted = compact_activity()
+        stored = refresh_trending(top_n=options['top_n'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Удалено устаревших интервалов: {expired}, '
+            f'слито часовых интервалов: {compacted}, '
+            f'популярных произведений: {stored}.'
+        ))
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from reviews.jobs import run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = 'Выполнение фоновых задач из очереди.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Выполнить задачи, которые уже в очереди, и завершиться.'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5,
+            help='Пауза между проверками очереди в секундах.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            done = run_pending_jobs()
+            if done:
+                self.stdout.write(f'Выполнено задач: {done}')
+            if options['once']:
+                return
+            time.sleep(options['interval'])
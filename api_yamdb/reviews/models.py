@@ -2,16 +2,35 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 from reviews.validators import validate_title_year
+from users.fields import FoldedCharField
 from users.models import UserProfile
 from reviews.constants import (
+    CHANGE_ACTION_CHOICES,
+    JOB_KIND_CHOICES,
+    JOB_PENDING,
+    JOB_STATUS_CHOICES,
+    MAX_JOB_KIND_LENGTH,
+    MAX_CHANGE_ACTION_LENGTH,
+    MAX_CHANGE_MODEL_LENGTH,
+    MAX_CONTENT_TYPE_LENGTH,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    MAX_JOB_STATUS_LENGTH,
     MAX_NAME_LENGTH,
     MAX_SCORE,
     MAX_SLUG_LENGTH,
     MIN_SCORE,
-    SELF_DESCRIPTION_LENGTH
+    SELF_DESCRIPTION_LENGTH,
+    TRIGRAM_LENGTH
 )
 
 
+class AliveManager(models.Manager):
+    """Менеджер, скрывающий объекты, помеченные на удаление."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
 class InfoModel(models.Model):
     """Абстрактная модель."""
 
@@ -20,6 +39,11 @@ class InfoModel(models.Model):
         verbose_name='Название',
         help_text='Необходимо названия котегории'
     )
+    name_folded = FoldedCharField(
+        source='name',
+        max_length=MAX_NAME_LENGTH,
+        verbose_name='Название для поиска',
+    )
     slug = models.SlugField(
         max_length=MAX_SLUG_LENGTH,
         unique=True,
@@ -37,6 +61,16 @@ class InfoModel(models.Model):
 class Category(InfoModel):
     """Модель категории."""
 
+    is_deleted = models.BooleanField(
+        default=False,
+        editable=False,
+        db_index=True,
+        verbose_name='Помечена на удаление',
+    )
+
+    objects = AliveManager()
+    all_objects = models.Manager()
+
     class Meta:
         ordering = ('name',)
         verbose_name = 'Категория'
@@ -66,6 +100,11 @@ class Title(models.Model):
         verbose_name='Название',
         help_text='Необходимо названия произведения',
     )
+    name_folded = FoldedCharField(
+        source='name',
+        max_length=MAX_NAME_LENGTH,
+        verbose_name='Название для поиска',
+    )
 
     description = models.TextField(
         null=True,
@@ -95,6 +134,31 @@ class Title(models.Model):
         help_text='Укажите жанр',
     )
 
+    rating = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Рейтинг',
+        help_text='Средняя оценка, пересчитывается по отзывам',
+    )
+    score_histogram = models.BinaryField(
+        null=True,
+        editable=False,
+        verbose_name='Распределение оценок',
+        help_text='Количество отзывов с каждой оценкой, пересчитывается '
+                  'по отзывам',
+    )
+
+    is_deleted = models.BooleanField(
+        default=False,
+        editable=False,
+        db_index=True,
+        verbose_name='Помечено на удаление',
+    )
+
+    objects = AliveManager()
+    all_objects = models.Manager()
+
     class Meta:
         ordering = ('name',)
         verbose_name = 'Произведение'
@@ -138,6 +202,15 @@ class Review(BaseReviewComment):
             MaxValueValidator(MAX_SCORE)
         ]
     )
+    is_deleted = models.BooleanField(
+        default=False,
+        editable=False,
+        db_index=True,
+        verbose_name="Помечен на удаление",
+    )
+
+    objects = AliveManager()
+    all_objects = models.Manager()
 
     class Meta:
         ordering = ("-pub_date",)
@@ -146,10 +219,22 @@ class Review(BaseReviewComment):
         constraints = [
             models.UniqueConstraint(
                 fields=["author", "title"], name="unique_review")]
+        indexes = [
+            models.Index(
+                fields=["author", "-pub_date"],
+                name="review_author_pub_date_idx")]
 
     def __str__(self):
         return self.text[:SELF_DESCRIPTION_LENGTH]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Оценка на момент загрузки нужна, чтобы учесть её изменение
+        # в счётчиках активности.
+        instance._loaded_score = instance.__dict__.get('score')
+        return instance
+
 
 class Comment(BaseReviewComment):
     review = models.ForeignKey(
@@ -163,6 +248,301 @@ class Comment(BaseReviewComment):
         ordering = ("-pub_date",)
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
+        indexes = [
+            models.Index(
+                fields=["author", "-pub_date"],
+                name="comment_author_pub_date_idx")]
 
     def __str__(self):
         return self.text[:SELF_DESCRIPTION_LENGTH]
+
+
+class SimilarTitle(models.Model):
+    """Предрассчитанный список похожих произведений."""
+
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name="similar_titles",
+        verbose_name="Произведение",
+    )
+    similar = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name="similar_to",
+        verbose_name="Похожее произведение",
+    )
+    rank = models.PositiveSmallIntegerField(verbose_name="Позиция")
+    score = models.FloatField(verbose_name="Степень сходства")
+
+    class Meta:
+        ordering = ("title", "rank")
+        verbose_name = "Похожее произведение"
+        verbose_name_plural = "Похожие произведения"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title", "rank"], name="unique_similar_title_rank")]
+
+    def __str__(self):
+        return f"{self.title_id} -> {self.similar_id}"
+
+
+class UserRecommendation(models.Model):
+    """Предрассчитанная персональная рекомендация произведения."""
+
+    user = models.ForeignKey(
+        UserProfile,
+        on_delete=models.CASCADE,
+        related_name="recommendations",
+        verbose_name="Пользователь",
+    )
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name="recommended_to",
+        verbose_name="Произведение",
+    )
+    rank = models.PositiveSmallIntegerField(verbose_name="Позиция")
+    score = models.FloatField(verbose_name="Прогноз оценки")
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Дата расчёта",
+    )
+
+    class Meta:
+        ordering = ("user", "rank")
+        verbose_name = "Рекомендация"
+        verbose_name_plural = "Рекомендации"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "rank"], name="unique_user_recommendation")]
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.title_id}"
+
+
+class TitleTrigram(models.Model):
+    """Триграмма названия произведения для нечёткого поиска."""
+
+    trigram = models.CharField(
+        max_length=TRIGRAM_LENGTH,
+        verbose_name="Триграмма",
+    )
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name="trigrams",
+        verbose_name="Произведение",
+    )
+
+    class Meta:
+        verbose_name = "Триграмма названия"
+        verbose_name_plural = "Триграммы названий"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["trigram", "title"], name="unique_title_trigram")]
+
+    def __str__(self):
+        return f"{self.title_id}: {self.trigram}"
+
+
+class TitleActivity(models.Model):
+    """
+    Количество и сумма оценок отзывов на произведение за интервал:
+    час для недавних отзывов и сутки для более старых.
+    """
+
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name="activity",
+        verbose_name="Произведение",
+    )
+    bucket = models.DateTimeField(verbose_name="Начало интервала")
+    review_count = models.IntegerField(
+        default=0,
+        verbose_name="Количество отзывов",
+    )
+    score_sum = models.IntegerField(
+        default=0,
+        verbose_name="Сумма оценок",
+    )
+
+    class Meta:
+        ordering = ("title", "bucket")
+        verbose_name = "Активность по произведению"
+        verbose_name_plural = "Активность по произведениям"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title", "bucket"], name="unique_title_activity")]
+        indexes = [
+            models.Index(fields=["bucket"], name="title_activity_bucket_idx")]
+
+    def __str__(self):
+        return f"{self.title_id} @ {self.bucket}: {self.review_count}"
+
+
+class TrendingTitle(models.Model):
+    """Предрассчитанная позиция произведения в списке популярных."""
+
+    title = models.OneToOneField(
+        Title,
+        on_delete=models.CASCADE,
+        related_name="trending",
+        verbose_name="Произведение",
+    )
+    rank = models.PositiveSmallIntegerField(
+        unique=True,
+        verbose_name="Позиция",
+    )
+    review_count = models.PositiveIntegerField(
+        verbose_name="Отзывов за период",
+    )
+    score_sum = models.PositiveIntegerField(
+        verbose_name="Сумма оценок за период",
+    )
+
+    class Meta:
+        ordering = ("rank",)
+        verbose_name = "Популярное произведение"
+        verbose_name_plural = "Популярные произведения"
+
+    def __str__(self):
+        return f"{self.rank}. {self.title_id}"
+
+
+class BackgroundJob(models.Model):
+    """Фоновая задача с отслеживанием прогресса."""
+
+    kind = models.CharField(
+        max_length=MAX_JOB_KIND_LENGTH,
+        choices=JOB_KIND_CHOICES,
+        verbose_name="Тип задачи",
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name="ID объекта")
+    status = models.CharField(
+        max_length=MAX_JOB_STATUS_LENGTH,
+        choices=JOB_STATUS_CHOICES,
+        default=JOB_PENDING,
+        db_index=True,
+        verbose_name="Статус",
+    )
+    total = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Всего записей",
+    )
+    processed = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Обработано записей",
+    )
+    error = models.TextField(blank=True, verbose_name="Ошибка")
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Дата создания",
+    )
+    updated = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Дата обновления",
+    )
+
+    class Meta:
+        ordering = ("id",)
+        verbose_name = "Фоновая задача"
+        verbose_name_plural = "Фоновые задачи"
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}: {self.status}"
+
+
+class ChangeLogEntry(models.Model):
+    """
+    Запись журнала изменений каталога, отзывов и комментариев.
+    Журнал только дополняется, первичный ключ служит курсором.
+    """
+
+    model = models.CharField(
+        max_length=MAX_CHANGE_MODEL_LENGTH,
+        verbose_name="Модель",
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name="ID объекта")
+    action = models.CharField(
+        max_length=MAX_CHANGE_ACTION_LENGTH,
+        choices=CHANGE_ACTION_CHOICES,
+        verbose_name="Действие",
+    )
+    slug = models.SlugField(
+        max_length=MAX_SLUG_LENGTH,
+        blank=True,
+        db_index=False,
+        verbose_name="Слаг категории или жанра",
+    )
+    title_id = models.PositiveBigIntegerField(
+        null=True,
+        verbose_name="ID произведения отзыва или комментария",
+    )
+    review_id = models.PositiveBigIntegerField(
+        null=True,
+        verbose_name="ID отзыва комментария",
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Дата изменения",
+    )
+
+    class Meta:
+        ordering = ("id",)
+        verbose_name = "Изменение"
+        verbose_name_plural = "Журнал изменений"
+        indexes = [
+            models.Index(
+                fields=["model", "id"], name="changelog_model_id_idx")]
+
+    def __str__(self):
+        return f"{self.id}: {self.action} {self.model} #{self.object_id}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Ответ на POST-запрос с заголовком `Idempotency-Key`.
+    Пока запрос выполняется, код ответа не заполнен.
+    """
+
+    user_id = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name="ID пользователя, 0 для анонимных запросов",
+    )
+    key = models.CharField(
+        max_length=MAX_IDEMPOTENCY_KEY_LENGTH,
+        verbose_name="Ключ идемпотентности",
+    )
+    fingerprint = models.CharField(
+        max_length=64,
+        verbose_name="Хеш адреса и тела запроса",
+    )
+    status_code = models.PositiveSmallIntegerField(
+        null=True,
+        verbose_name="Код ответа",
+    )
+    content = models.BinaryField(null=True, verbose_name="Тело ответа")
+    content_type = models.CharField(
+        max_length=MAX_CONTENT_TYPE_LENGTH,
+        blank=True,
+        verbose_name="Тип содержимого ответа",
+    )
+    expires = models.DateTimeField(
+        db_index=True,
+        verbose_name="Срок хранения",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("user_id", "key"),
+                name="unique_idempotency_key"
+            )
+        ]
+        verbose_name = "Ключ идемпотентности"
+        verbose_name_plural = "Ключи идемпотентности"
+
+    def __str__(self):
+        return f"{self.user_id}: {self.key}"
@@ -0,0 +1,66 @@
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.utils.functional import cached_property
+
+from reviews.constants import ADMIN_EXACT_COUNT_LIMIT
+
+ESTIMATE_QUERIES = {
+    'postgresql': (
+        'SELECT reltuples::bigint FROM pg_class WHERE relname = %s'
+    ),
+    'sqlite': 'SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1',
+}
+
+
+def estimate_table_rows(model, using):
+    """
+    Возвращает оценку числа строк таблицы по статистике СУБД
+    или None, если статистика недоступна.
+    """
+    connection = connections[using]
+    sql = ESTIMATE_QUERIES.get(connection.vendor)
+    if sql is None:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [model._meta.db_table])
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if row is None:
+        return None
+    return int(str(row[0]).split()[0])
+
+
+def _where_sql(queryset):
+    query = queryset.query
+    compiler = query.get_compiler(queryset.db)
+    return query.where.as_sql(compiler, compiler.connection)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Пагинатор для списков админки по большим таблицам.
+
+    Для нефильтрованной выборки берёт число строк из статистики СУБД
+    вместо COUNT(*). Точный подсчёт выполняется для выборок с поиском
+    или фильтрами, а также для небольших таблиц.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        model = queryset.model
+        try:
+            unfiltered = (
+                _where_sql(queryset)
+                == _where_sql(model._default_manager.all())
+            )
+        except EmptyResultSet:
+            unfiltered = False
+        if unfiltered:
+            estimate = estimate_table_rows(model, queryset.db)
+            if estimate is not None and estimate > ADMIN_EXACT_COUNT_LIMIT:
+                return estimate
+        return super().count
@@ -0,0 +1,114 @@
+import struct
+import threading
+from contextlib import contextmanager
+
+from reviews.constants import MAX_SCORE, MIN_SCORE
+from reviews.models import Title
+from reviews.readcache import invalidate_catalog_cache
+
+SCORES = range(MIN_SCORE, MAX_SCORE + 1)
+# Счётчики отзывов по оценкам: по 4 байта на каждую оценку.
+HISTOGRAM_FORMAT = f'<{len(SCORES)}I'
+
+_deferred = threading.local()
+
+
+def pack_histogram(counts):
+    return struct.pack(HISTOGRAM_FORMAT, *counts)
+
+
+def unpack_histogram(data):
+    if not data:
+        return [0] * len(SCORES)
+    return list(struct.unpack(HISTOGRAM_FORMAT, bytes(data)))
+
+
+def rating_from_histogram(counts):
+    """Средняя оценка, отброшенная до целого, или None без отзывов."""
+    total = sum(counts)
+    if not total:
+        return None
+    return int(sum(
+        score * count for score, count in zip(SCORES, counts)
+    ) / total)
+
+
+def score_deltas(changes):
+    """
+    Складывает изменения оценок `(title_id, оценка, +1 или -1)`
+    в изменения счётчиков каждого произведения.
+    """
+    deltas = {}
+    for title_id, score, delta in changes:
+        slots = deltas.setdefault(title_id, [0] * len(SCORES))
+        slots[score - MIN_SCORE] += delta
+    return {
+        title_id: slots for title_id, slots in deltas.items() if any(slots)
+    }
+
+
+def apply_score_changes(changes):
+    """
+    Прибавляет изменения оценок к сохранённому распределению
+    и выводит из него рейтинг, не перечитывая отзывы.
+    Распределение записывается условным UPDATE по прочитанному
+    значению: если его успел изменить другой процесс, произведение
+    перечитывается и изменение применяется заново.
+    """
+    pending = score_deltas(changes)
+    if not pending:
+        return
+    while pending:
+        stored = dict(
+            Title.all_objects.filter(pk__in=pending)
+            .values_list('pk', 'score_histogram')
+        )
+        conflicts = {}
+        for title_id, slots in pending.items():
+            if title_id not in stored:
+                continue
+            old = stored[title_id]
+            old = None if old is None else bytes(old)
+            counts = [
+                max(count + delta, 0)
+                for count, delta in zip(unpack_histogram(old), slots)
+            ]
+            if not Title.all_objects.filter(
+                pk=title_id, score_histogram=old
+            ).update(
+                rating=rating_from_histogram(counts),
+                score_histogram=pack_histogram(counts)
+            ):
+                conflicts[title_id] = slots
+        pending = conflicts
+    invalidate_catalog_cache()
+
+
+def schedule_score_changes(changes):
+    """
+    Применяет изменения оценок сразу
+    или в конце блока `deferred_rating_updates`.
+    """
+    pending = getattr(_deferred, 'changes', None)
+    if pending is None:
+        apply_score_changes(changes)
+    else:
+        pending.extend(changes)
+
+
+@contextmanager
+def deferred_rating_updates():
+    """
+    Откладывает изменение распределений оценок до выхода из блока,
+    чтобы каждое затронутое произведение обновлялось один раз.
+    """
+    if getattr(_deferred, 'changes', None) is not None:
+        yield
+        return
+    _deferred.changes = []
+    try:
+        yield
+        changes = _deferred.changes
+    finally:
+        _deferred.changes = None
+    apply_score_changes(changes)
@@ -0,0 +1,109 @@
+import threading
+import time
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Max
+
+from reviews.constants import (CATALOG_CACHE_KEY, CATALOG_CACHE_VERSION_KEY,
+                               CATALOG_MODELS)
+from reviews.models import ChangeLogEntry
+
+
+def catalog_version(models=CATALOG_MODELS):
+    """
+    Версия каталога: метка процесса, которую сбрасывает
+    `invalidate_catalog_cache`, и последняя запись журнала изменений
+    моделей `models`. Журнал общий для всех процессов, поэтому изменение
+    каталога в любом из них меняет версию, а записи остальных моделей
+    (например, комментариев) её не трогают. Максимальный ключ читается
+    по индексу `(model, id)`.
+    """
+    version = cache.get(CATALOG_CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_CACHE_VERSION_KEY, uuid4().hex)
+        version = cache.get(CATALOG_CACHE_VERSION_KEY)
+    cursor = ChangeLogEntry.objects.filter(model__in=models).aggregate(
+        cursor=Max('pk')
+    )['cursor']
+    return f'{version}:{cursor or 0}'
+
+
+def catalog_cache_key(url, models=CATALOG_MODELS):
+    """
+    Ключ кеша ответа по адресу запроса и версии каталога
+    по моделям, от которых ответ зависит.
+    """
+    return CATALOG_CACHE_KEY.format(
+        version=catalog_version(models),
+        digest=md5(url.encode()).hexdigest()
+    )
+
+
+def invalidate_catalog_cache():
+    """
+    Сбрасывает закешированные ответы каталога и фасеты процесса сразу
+    и повторно после фиксации транзакции. Другие процессы замечают
+    изменение по новой записи в журнале изменений.
+    """
+    def invalidate():
+        cache.delete(CATALOG_CACHE_VERSION_KEY)
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+def _store(key, value, timeout):
+    cache.set(
+        key, (time.time() + timeout, value),
+        timeout + settings.READ_CACHE_STALE_TIMEOUT
+    )
+
+
+def refresh_in_background(key, compute, timeout, lock):
+    """Пересчитывает значение в отдельном потоке и снимает блокировку."""
+    def run():
+        try:
+            _store(key, compute(), timeout)
+        finally:
+            cache.delete(lock)
+            connections.close_all()
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def coalesced(key, compute, timeout):
+    """
+    Возвращает значение из кеша, вычисляя его не более одного раза
+    на все параллельные запросы: пересчёт выполняет тот, кто занял
+    блокировку ключа, остальные ждут, пока значение появится в кеше.
+
+    Устаревшее значение ещё `READ_CACHE_STALE_TIMEOUT` секунд
+    отдаётся сразу, а пересчёт запускается в фоновом потоке.
+    """
+    lock = f'{key}:lock'
+    entry = cache.get(key)
+    if entry is not None:
+        fresh_until, value = entry
+        if fresh_until <= time.time() and cache.add(
+            lock, True, settings.READ_CACHE_LOCK_TIMEOUT
+        ):
+            refresh_in_background(key, compute, timeout, lock)
+        return value
+    deadline = time.monotonic() + settings.READ_CACHE_LOCK_TIMEOUT
+    while not cache.add(lock, True, settings.READ_CACHE_LOCK_TIMEOUT):
+        time.sleep(settings.READ_CACHE_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[1]
+        if time.monotonic() >= deadline:
+            return compute()
+    try:
+        value = compute()
+        _store(key, value, timeout)
+        return value
+    finally:
+        cache.delete(lock)
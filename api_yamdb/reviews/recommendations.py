@@ -0,0 +1,224 @@
+"""
+Векторизованные расчёты рекомендаций по оценкам из отзывов.
+
+Модуль используется только management-командами и тянет за собой
+NumPy и SciPy, поэтому не импортируется при обработке запросов.
+"""
+from itertools import chain
+
+import numpy as np
+from scipy import sparse
+
+from reviews.models import Review, Title
+
+
+def load_scores(reviews=None, chunk_size=10000):
+    """
+    Загружает оценки (по умолчанию — все) в виде трёх массивов:
+    идентификаторы произведений, авторов и сами оценки.
+    """
+    if reviews is None:
+        reviews = Review.objects.all()
+    rows = reviews.values_list(
+        'title_id', 'author_id', 'score'
+    ).order_by().iterator(chunk_size=chunk_size)
+    flat = np.fromiter(chain.from_iterable(rows), dtype=np.int64)
+    flat = flat.reshape(-1, 3)
+    return flat[:, 0], flat[:, 1], flat[:, 2].astype(np.float32)
+
+
+def load_genre_matrix(title_ids):
+    """Строит разреженную матрицу «произведение × жанр» из нулей и единиц."""
+    links = np.array(
+        list(Title.genre.through.objects.filter(
+            title_id__in=title_ids.tolist()
+        ).values_list('title_id', 'genre_id')),
+        dtype=np.int64
+    ).reshape(-1, 2)
+    genre_ids, genre_index = np.unique(links[:, 1], return_inverse=True)
+    return sparse.csr_matrix(
+        (
+            np.ones(len(links), dtype=np.float32),
+            (np.searchsorted(title_ids, links[:, 0]), genre_index)
+        ),
+        shape=(len(title_ids), len(genre_ids))
+    )
+
+
+def build_rating_matrix(title_ids, review_titles, authors, scores):
+    """
+    Строит разреженную матрицу «произведение × пользователь»
+    с оценками, центрированными по среднему произведения,
+    и бинарную матрицу наличия оценки.
+    """
+    author_ids, author_index = np.unique(authors, return_inverse=True)
+    title_index = np.searchsorted(title_ids, review_titles)
+    sums = np.bincount(title_index, weights=scores, minlength=len(title_ids))
+    counts = np.bincount(title_index, minlength=len(title_ids))
+    centred = scores - (sums / np.maximum(counts, 1))[title_index]
+    shape = (len(title_ids), len(author_ids))
+    ratings = sparse.csr_matrix(
+        (centred.astype(np.float32), (title_index, author_index)),
+        shape=shape
+    )
+    rated = sparse.csr_matrix(
+        (np.ones(len(scores), dtype=np.float32), (title_index, author_index)),
+        shape=shape
+    )
+    return ratings, rated
+
+
+def iter_similar_titles(ratings, rated, genres, top_k, genre_weight,
+                        shrinkage, max_cells):
+    """
+    Для каждого пакета произведений возвращает индексы строк,
+    индексы top-K соседей и их степень сходства. Размер пакета
+    подбирается так, чтобы каждая из плотных матриц пакета
+    не превышала `max_cells` элементов.
+
+    Сходство складывается из косинусной меры по совместным оценкам,
+    штрафуемой при малом числе общих оценивших, и коэффициента
+    Жаккара по жанрам.
+    """
+    norms = np.sqrt(np.asarray(ratings.multiply(ratings).sum(axis=1)))
+    norms = norms.ravel()
+    norms[norms == 0] = 1
+    genre_sizes = np.asarray(genres.sum(axis=1)).ravel()
+    ratings_t = ratings.T.tocsc()
+    rated_t = rated.T.tocsc()
+    genres_t = genres.T.tocsc()
+    total = ratings.shape[0]
+    k = min(top_k, total - 1)
+    batch_size = max(1, max_cells // total)
+    for start in range(0, total, batch_size):
+        stop = min(start + batch_size, total)
+        rows = np.arange(start, stop)
+        dot = (ratings[start:stop] @ ratings_t).toarray()
+        common = (rated[start:stop] @ rated_t).toarray()
+        cosine = dot / np.outer(norms[start:stop], norms)
+        cosine *= common / (common + shrinkage)
+        overlap = (genres[start:stop] @ genres_t).toarray()
+        union = genre_sizes[start:stop, None] + genre_sizes[None, :] - overlap
+        jaccard = np.divide(
+            overlap, union, out=np.zeros_like(overlap), where=union > 0
+        )
+        similarity = (1 - genre_weight) * cosine + genre_weight * jaccard
+        similarity[rows - start, rows] = -np.inf
+        if k <= 0:
+            continue
+        neighbours = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        neighbour_scores = np.take_along_axis(similarity, neighbours, axis=1)
+        order = np.argsort(-neighbour_scores, axis=1)
+        yield (
+            rows,
+            np.take_along_axis(neighbours, order, axis=1),
+            np.take_along_axis(neighbour_scores, order, axis=1),
+        )
+
+
+def build_user_matrix(title_ids, review_titles, authors, scores, author_ids,
+                      mean=None):
+    """
+    Строит разреженную матрицу «пользователь × произведение»
+    с оценками за вычетом общего среднего.
+    Строки соответствуют `author_ids`, столбцы — `title_ids`.
+    """
+    if mean is None:
+        mean = float(scores.mean()) if len(scores) else 0.0
+    known = np.isin(review_titles, title_ids) & np.isin(authors, author_ids)
+    matrix = sparse.csr_matrix(
+        (
+            (scores[known] - mean).astype(np.float32),
+            (
+                np.searchsorted(author_ids, authors[known]),
+                np.searchsorted(title_ids, review_titles[known])
+            )
+        ),
+        shape=(len(author_ids), len(title_ids))
+    )
+    return matrix, mean
+
+
+def _outer_rows(factors):
+    """Построчные внешние произведения, развёрнутые в векторы."""
+    return np.einsum('ij,ik->ijk', factors, factors).reshape(len(factors), -1)
+
+
+def solve_factors(ratings, fixed, regularization, chunk_size):
+    """
+    Один полушаг ALS: при фиксированных факторах столбцов находит
+    факторы строк, решая регуляризованные нормальные уравнения
+    пакетно для `chunk_size` строк за раз.
+    Память ограничена размером пакета, а не размером матрицы.
+    """
+    size = fixed.shape[1]
+    binary = ratings.copy()
+    binary.data[:] = 1
+    counts = np.diff(ratings.indptr)
+    eye = np.eye(size, dtype=np.float32)
+    result = np.zeros((ratings.shape[0], size), dtype=np.float32)
+    for start in range(0, ratings.shape[0], chunk_size):
+        stop = min(start + chunk_size, ratings.shape[0])
+        block = binary[start:stop].tocsc()
+        gram = np.zeros((stop - start, size * size), dtype=np.float32)
+        for fixed_start in range(0, len(fixed), chunk_size):
+            fixed_stop = min(fixed_start + chunk_size, len(fixed))
+            gram += block[:, fixed_start:fixed_stop] @ _outer_rows(
+                fixed[fixed_start:fixed_stop]
+            )
+        gram = gram.reshape(-1, size, size)
+        gram += (
+            regularization
+            * np.maximum(counts[start:stop], 1)[:, None, None]
+            * eye
+        )
+        rhs = ratings[start:stop] @ fixed
+        result[start:stop] = np.linalg.solve(gram, rhs[..., None])[..., 0]
+    return result
+
+
+def factorize(ratings, factors, regularization, iterations, chunk_size,
+              seed=0):
+    """
+    Раскладывает матрицу оценок «пользователь × произведение»
+    методом чередующихся наименьших квадратов.
+    """
+    generator = np.random.default_rng(seed)
+    item_factors = generator.normal(
+        scale=0.1, size=(ratings.shape[1], factors)
+    ).astype(np.float32)
+    by_item = ratings.T.tocsr()
+    for _ in range(iterations):
+        user_factors = solve_factors(
+            ratings, item_factors, regularization, chunk_size
+        )
+        item_factors = solve_factors(
+            by_item, user_factors, regularization, chunk_size
+        )
+    return user_factors, item_factors
+
+
+def iter_top_unseen(ratings, user_factors, item_factors, top_n, max_cells):
+    """
+    Для каждого пакета пользователей возвращает индексы строк,
+    индексы top-N ещё не оценённых произведений и их прогноз.
+    Размер пакета подбирается так, чтобы матрица прогнозов
+    не превышала `max_cells` элементов.
+    """
+    top_n = min(top_n, item_factors.shape[0])
+    if top_n <= 0:
+        return
+    chunk_size = max(1, max_cells // item_factors.shape[0])
+    for start in range(0, ratings.shape[0], chunk_size):
+        stop = min(start + chunk_size, ratings.shape[0])
+        predicted = user_factors[start:stop] @ item_factors.T
+        seen = ratings[start:stop].tocoo()
+        predicted[seen.row, seen.col] = -np.inf
+        best = np.argpartition(-predicted, top_n - 1, axis=1)[:, :top_n]
+        best_scores = np.take_along_axis(predicted, best, axis=1)
+        order = np.argsort(-best_scores, axis=1)
+        yield (
+            np.arange(start, stop),
+            np.take_along_axis(best, order, axis=1),
+            np.take_along_axis(best_scores, order, axis=1),
+        )
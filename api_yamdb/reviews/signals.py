@@ -0,0 +1,167 @@
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+
+from reviews.changes import record_changes, record_title_updates
+from reviews.constants import CHANGE_CREATE, CHANGE_DELETE, CHANGE_UPDATE
+from reviews.fuzzy import index_titles
+from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.ratings import apply_score_changes, schedule_score_changes
+from reviews.readcache import invalidate_catalog_cache
+from reviews.slugs import invalidate_slug_map
+from reviews.trending import record_review_activity
+from users.models import UserProfile
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+@receiver(m2m_changed, sender=Title.genre.through)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_catalog(**kwargs):
+    """Сбрасывает закешированные ответы и фасеты при изменении каталога."""
+    invalidate_catalog_cache()
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_slugs(sender, **kwargs):
+    """Сбрасывает словарь слагов при изменении категорий и жанров."""
+    invalidate_slug_map(sender)
+
+
+@receiver(post_save, sender=Review)
+def count_review_score(instance, created, update_fields=None, **kwargs):
+    """
+    Учитывает создание отзыва, изменение оценки и пометку отзыва
+    удалённым в распределении оценок произведения
+    и в счётчиках активности.
+    """
+    loaded_score = getattr(instance, '_loaded_score', None)
+    if loaded_score is None:
+        loaded_score = instance.score
+    if created:
+        removed, added = None, instance.score
+    elif instance.is_deleted:
+        if not update_fields or 'is_deleted' not in update_fields:
+            return
+        removed, added = loaded_score, None
+    else:
+        removed, added = loaded_score, instance.score
+    instance._loaded_score = instance.score
+    changes = []
+    if removed is not None:
+        changes.append((instance.title_id, removed, -1))
+    if added is not None:
+        changes.append((instance.title_id, added, 1))
+    schedule_score_changes(changes)
+    record_review_activity(((
+        instance.title_id, instance.pub_date,
+        sum(delta for _, _, delta in changes),
+        sum(score * delta for _, score, delta in changes),
+    ),))
+
+
+@receiver(post_delete, sender=Review)
+def uncount_review_score(instance, **kwargs):
+    """Вычитает удалённый отзыв, если он не был помечен удалённым ранее."""
+    if not instance.is_deleted:
+        schedule_score_changes(((instance.title_id, instance.score, -1),))
+        record_review_activity(
+            ((instance.title_id, instance.pub_date, -1, -instance.score),)
+        )
+
+
+@receiver(post_save, sender=UserProfile)
+def hide_deleted_user_reviews(instance, update_fields=None, **kwargs):
+    """
+    Помечает удалёнными отзывы пользователя, помеченного на удаление,
+    чтобы они сразу пропали из выдачи и рейтингов произведений,
+    не дожидаясь фоновой очистки.
+    """
+    if (
+        not instance.is_deleted
+        or not update_fields or 'is_deleted' not in update_fields
+    ):
+        return
+    reviews = list(Review.objects.filter(author=instance))
+    if not reviews:
+        return
+    Review.objects.filter(
+        pk__in=[review.pk for review in reviews]
+    ).update(is_deleted=True)
+    record_changes(Review, reviews, CHANGE_DELETE)
+    record_review_activity(
+        (review.title_id, review.pub_date, -1, -review.score)
+        for review in reviews
+    )
+    apply_score_changes(
+        (review.title_id, review.score, -1) for review in reviews
+    )
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_save, sender=Genre)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Review)
+@receiver(post_save, sender=Comment)
+def log_saved(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Записывает в журнал создание и изменение объекта,
+    а пометку удалённым — как удаление.
+    """
+    if created:
+        action = CHANGE_CREATE
+    elif getattr(instance, 'is_deleted', False):
+        if not update_fields or 'is_deleted' not in update_fields:
+            return
+        action = CHANGE_DELETE
+    else:
+        action = CHANGE_UPDATE
+    record_changes(sender, (instance,), action)
+
+
+@receiver(post_delete, sender=Title)
+@receiver(post_delete, sender=Genre)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Review)
+@receiver(post_delete, sender=Comment)
+def log_deleted(sender, instance, **kwargs):
+    """Записывает удаление, если объект не был помечен удалённым ранее."""
+    if not getattr(instance, 'is_deleted', False):
+        record_changes(sender, (instance,), CHANGE_DELETE)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def log_title_genres(instance, action, reverse, pk_set, **kwargs):
+    """Записывает изменение жанров произведения."""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        record_changes(Title, (instance,), CHANGE_UPDATE)
+    elif pk_set:
+        record_changes(
+            Title, Title.all_objects.filter(pk__in=pk_set), CHANGE_UPDATE
+        )
+
+
+@receiver(pre_delete, sender=Genre)
+def log_genre_titles(instance, **kwargs):
+    """
+    Записывает изменение произведений удаляемого жанра: связи
+    удаляются каскадом, без сигнала `m2m_changed`.
+    """
+    record_title_updates(
+        Title.objects.filter(genre=instance).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_save, sender=Title)
+def index_title_trigrams(instance, update_fields=None, **kwargs):
+    """Перестраивает триграммы названия для нечёткого поиска."""
+    if update_fields is None or 'name' in update_fields:
+        index_titles((instance,))
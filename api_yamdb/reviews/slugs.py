@@ -0,0 +1,63 @@
+import threading
+
+from django.db.models import Max
+
+from reviews.models import ChangeLogEntry
+
+_maps = {}
+_lock = threading.Lock()
+
+
+def _version(model):
+    """
+    Версия словаря: последняя запись журнала изменений о модели.
+    Журнал общий для всех процессов, поэтому изменение слагов
+    в любом из них меняет версию. Запрос идёт по индексу.
+    """
+    return ChangeLogEntry.objects.filter(
+        model=model._meta.model_name
+    ).aggregate(version=Max('pk'))['version']
+
+
+def _load(model, version):
+    mapping = dict(
+        model._default_manager.order_by().values_list('slug', 'pk')
+    )
+    _maps[model] = (version, mapping)
+    return mapping
+
+
+def get_slug_map(model, refresh=False):
+    """
+    Возвращает словарь `slug -> id` для категорий или жанров.
+
+    Словарь хранится в памяти процесса и перечитывается из базы,
+    только если в журнале изменений появилась новая запись о модели
+    или передан `refresh`. Проверка версии — один запрос по индексу.
+    """
+    version = _version(model)
+    cached = _maps.get(model)
+    if cached is not None and cached[0] == version and not refresh:
+        return cached[1]
+    with _lock:
+        return _load(model, version)
+
+
+def resolve_slugs(model, slugs):
+    """
+    Сопоставляет слаги с идентификаторами.
+    Если какого-то слага нет в словаре, он один раз перечитывается:
+    объект мог быть создан в другом процессе.
+    """
+    mapping = get_slug_map(model)
+    if any(slug not in mapping for slug in slugs):
+        mapping = get_slug_map(model, refresh=True)
+    return {slug: mapping[slug] for slug in slugs if slug in mapping}
+
+
+def invalidate_slug_map(model):
+    """
+    Сбрасывает словарь слагов процесса. Другие процессы замечают
+    изменение по записи в журнале изменений.
+    """
+    _maps.pop(model, None)
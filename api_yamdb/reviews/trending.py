@@ -0,0 +1,135 @@
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+from reviews.constants import (TRENDING_HOURLY_HOURS, TRENDING_TOP_N,
+                               TRENDING_WINDOW_DAYS)
+from reviews.models import TitleActivity, TrendingTitle
+
+
+def hourly_cutoff(now):
+    """Граница, раньше которой активность хранится по суткам."""
+    return (now - timedelta(hours=TRENDING_HOURLY_HOURS)).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+def window_start(now):
+    """Начало окна: полночь `TRENDING_WINDOW_DAYS` суток назад."""
+    return (now - timedelta(days=TRENDING_WINDOW_DAYS)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def activity_bucket(moment, now):
+    """
+    Интервал, в который попадает отзыв: час для недавних отзывов
+    и сутки для более старых. Для отзывов вне окна возвращает None.
+    """
+    if moment < window_start(now):
+        return None
+    bucket = moment.replace(minute=0, second=0, microsecond=0)
+    if bucket < hourly_cutoff(now):
+        bucket = bucket.replace(hour=0)
+    return bucket
+
+
+def _add_activity(title_id, bucket, count, score):
+    activity = TitleActivity.objects.filter(title_id=title_id, bucket=bucket)
+    values = {
+        'review_count': F('review_count') + count,
+        'score_sum': F('score_sum') + score,
+    }
+    if activity.update(**values):
+        return
+    try:
+        with transaction.atomic():
+            TitleActivity.objects.create(
+                title_id=title_id, bucket=bucket,
+                review_count=count, score_sum=score
+            )
+    except IntegrityError:
+        activity.update(**values)
+
+
+def record_review_activity(changes):
+    """
+    Учитывает изменения отзывов в счётчиках активности.
+    `changes` — последовательность кортежей
+    `(title_id, pub_date, изменение количества, изменение суммы оценок)`.
+    Изменения одного интервала складываются в одно обновление.
+    """
+    now = timezone.now()
+    totals = {}
+    for title_id, moment, count, score in changes:
+        bucket = activity_bucket(moment, now)
+        if bucket is not None:
+            total = totals.setdefault((title_id, bucket), [0, 0])
+            total[0] += count
+            total[1] += score
+    for (title_id, bucket), (count, score) in totals.items():
+        if count or score:
+            _add_activity(title_id, bucket, count, score)
+
+
+def compact_activity(now=None):
+    """
+    Удаляет интервалы за пределами окна и сливает часовые интервалы
+    старше `TRENDING_HOURLY_HOURS` в суточные.
+    Возвращает количество удалённых и слитых записей.
+    """
+    now = now or timezone.now()
+    cutoff = hourly_cutoff(now)
+    with transaction.atomic():
+        expired, _ = TitleActivity.objects.filter(
+            bucket__lt=window_start(now)
+        ).delete()
+        old = TitleActivity.objects.filter(bucket__lt=cutoff)
+        merged = list(
+            old.annotate(day=TruncDay('bucket'))
+            .order_by()
+            .values('title_id', 'day')
+            .annotate(count=Sum('review_count'), score=Sum('score_sum'))
+        )
+        compacted, _ = old.delete()
+        TitleActivity.objects.bulk_create(
+            TitleActivity(
+                title_id=row['title_id'], bucket=row['day'],
+                review_count=row['count'], score_sum=row['score'],
+            )
+            for row in merged
+        )
+    return expired, compacted - len(merged)
+
+
+def refresh_trending(now=None, top_n=TRENDING_TOP_N):
+    """
+    Пересчитывает список популярных произведений за окно
+    `TRENDING_WINDOW_DAYS`. Произведения упорядочены по сумме оценок
+    за период, то есть по количеству отзывов с учётом их оценок.
+    """
+    now = now or timezone.now()
+    ranking = (
+        TitleActivity.objects.filter(
+            bucket__gte=window_start(now),
+            title__is_deleted=False,
+        )
+        .order_by()
+        .values('title_id')
+        .annotate(count=Sum('review_count'), score=Sum('score_sum'))
+        .filter(count__gt=0)
+        .order_by('-score', '-count', 'title_id')[:top_n]
+    )
+    with transaction.atomic():
+        TrendingTitle.objects.all().delete()
+        TrendingTitle.objects.bulk_create(
+            TrendingTitle(
+                title_id=row['title_id'], rank=rank,
+                review_count=row['count'], score_sum=row['score'],
+            )
+            for rank, row in enumerate(ranking, 1)
+        )
+    return TrendingTitle.objects.count()
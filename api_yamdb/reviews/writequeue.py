@@ -0,0 +1,104 @@
+import queue
+import threading
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from reviews.ratings import deferred_rating_updates
+
+
+class WriteRequest:
+    """Запись, ожидающая выполнения в потоке записи."""
+
+    def __init__(self, func):
+        self.func = func
+        self.value = None
+        self.error = None
+        self.done = threading.Event()
+
+    def result(self):
+        if not self.done.wait(settings.WRITE_QUEUE_TIMEOUT):
+            raise TimeoutError('Поток записи не ответил вовремя.')
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class WriteQueue:
+    """
+    Очередь записей в базу с единственным потоком-писателем.
+
+    Пока писатель фиксирует одну группу, новые записи копятся
+    в очереди и следующей группой попадают в одну транзакцию:
+    SQLite получает одного писателя вместо борьбы за блокировку,
+    а fsync выполняется один раз на группу. Каждая запись идёт
+    в своей точке сохранения, поэтому ошибка одной из них
+    возвращается только её отправителю.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.batches = 0
+        self.writes = 0
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name='write-queue', daemon=True
+                )
+                self.thread.start()
+
+    def submit(self, func, *args, **kwargs):
+        """Выполняет запись в потоке-писателе и возвращает её результат."""
+        self.start()
+        request = WriteRequest(partial(func, *args, **kwargs))
+        self.queue.put(request)
+        return request.result()
+
+    def take_batch(self):
+        batch = [self.queue.get()]
+        while len(batch) < settings.WRITE_QUEUE_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def write_batch(self, batch):
+        close_old_connections()
+        try:
+            with transaction.atomic(), deferred_rating_updates():
+                for request in batch:
+                    try:
+                        with transaction.atomic():
+                            request.value = request.func()
+                    except Exception as error:
+                        request.error = error
+        except Exception as error:
+            for request in batch:
+                request.error = request.error or error
+        self.batches += 1
+        self.writes += len(batch)
+        for request in batch:
+            request.done.set()
+
+    def run(self):
+        while True:
+            self.write_batch(self.take_batch())
+
+
+write_queue = WriteQueue()
+
+
+def queued_write(func, *args, **kwargs):
+    """
+    Выполняет запись через общую очередь, если она включена
+    настройкой `WRITE_QUEUE_ENABLED`, и сразу в текущем потоке иначе.
+    """
+    if settings.WRITE_QUEUE_ENABLED:
+        return write_queue.submit(func, *args, **kwargs)
+    return func(*args, **kwargs)
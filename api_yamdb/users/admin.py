@@ -1,7 +1,17 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
+from reviews.paginators import EstimatedCountPaginator
 from users.models import UserProfile
 
 
-admin.site.register(UserProfile, UserAdmin)
+class UserProfileAdmin(UserAdmin):
+    list_display = ('pk', 'username', 'email', 'role', 'is_staff')
+    list_filter = ('role', 'is_staff', 'is_superuser', 'is_active')
+    search_fields = ('^username', '^email')
+    ordering = ('-pk',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+admin.site.register(UserProfile, UserProfileAdmin)
@@ -0,0 +1,55 @@
+import re
+import unicodedata
+
+from django.db import models
+
+SPACES = re.compile(r'\s+')
+
+
+def fold(value):
+    """
+    Приводит строку к виду для поиска без учёта регистра:
+    нормализует Unicode, сворачивает регистр (в том числе кириллицы),
+    заменяет «ё» на «е» и схлопывает пробелы.
+    """
+    value = unicodedata.normalize('NFKC', value).casefold().replace('ё', 'е')
+    return SPACES.sub(' ', value).strip()
+
+
+class FoldedCharField(models.CharField):
+    """
+    Теневая колонка со свёрнутым по регистру значением поля `source`.
+    Заполняется при каждом сохранении, в том числе через `bulk_create`,
+    и индексируется для поиска по префиксу.
+    """
+
+    def __init__(self, *args, source, **kwargs):
+        self.source = source
+        kwargs.setdefault('editable', False)
+        kwargs.setdefault('db_index', True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['source'] = self.source
+        return name, path, args, kwargs
+
+    def fill(self, model_instance):
+        value = fold(getattr(model_instance, self.source) or '')
+        value = value[:self.max_length]
+        setattr(model_instance, self.attname, value)
+        return value
+
+    def pre_save(self, model_instance, add):
+        return self.fill(model_instance)
+
+
+def fill_folded_fields(objs):
+    """
+    Заполняет теневые колонки объектов перед `bulk_update`,
+    который не вызывает `pre_save` полей.
+    """
+    for obj in objs:
+        for field in obj._meta.concrete_fields:
+            if isinstance(field, FoldedCharField):
+                field.fill(obj)
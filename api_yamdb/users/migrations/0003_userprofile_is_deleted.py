@@ -0,0 +1,27 @@
+# Generated by Django 3.2.14 on 2026-10-19 09:10
+
+import django.contrib.auth.models
+from django.db import migrations, models
+import users.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_userprofile_username'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='userprofile',
+            managers=[
+                ('objects', users.models.UserProfileManager()),
+                ('all_objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='is_deleted',
+            field=models.BooleanField(db_index=True, default=False, editable=False, verbose_name='Помечен на удаление'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.14 on 2026-10-19 09:52
+
+from django.db import migrations
+import users.fields
+
+
+def fill_username_folded(apps, schema_editor):
+    UserProfile = apps.get_model('users', 'UserProfile')
+    profiles = list(UserProfile.objects.only('id', 'username'))
+    for profile in profiles:
+        profile.username_folded = users.fields.fold(profile.username)[:150]
+    UserProfile.objects.bulk_update(
+        profiles, ['username_folded'], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_userprofile_is_deleted'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='username_folded',
+            field=users.fields.FoldedCharField(db_index=True, default='', editable=False, max_length=150, source='username', verbose_name='Имя пользователя для поиска'),
+        ),
+        migrations.RunPython(fill_username_folded, migrations.RunPython.noop),
+    ]
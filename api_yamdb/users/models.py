@@ -1,11 +1,12 @@
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth.validators import UnicodeUsernameValidator
 
+from .fields import FoldedCharField
 from .constants import (
     MAX_USERNAME_LENGTH,
     MAX_EMAIL_LENGTH,
@@ -24,6 +25,13 @@ def validate_username(value):
         )
 
 
+class UserProfileManager(UserManager):
+    """Менеджер, скрывающий пользователей, помеченных на удаление."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
 class UserProfile(AbstractUser):
     """Модель пользователя"""
 
@@ -34,6 +42,12 @@ class UserProfile(AbstractUser):
         help_text="Введите имя пользователя (максимум 150 символов).",
         validators=[UnicodeUsernameValidator(), validate_username],
     )
+    username_folded = FoldedCharField(
+        source="username",
+        max_length=MAX_USERNAME_LENGTH,
+        default="",
+        verbose_name="Имя пользователя для поиска",
+    )
 
     role = models.CharField(
         max_length=MAX_ROLE_LENGTH,
@@ -56,6 +70,16 @@ class UserProfile(AbstractUser):
         max_length=MAX_EMAIL_LENGTH,
     )
 
+    is_deleted = models.BooleanField(
+        default=False,
+        editable=False,
+        db_index=True,
+        verbose_name="Помечен на удаление",
+    )
+
+    objects = UserProfileManager()
+    all_objects = UserManager()
+
     class Meta:
         verbose_name = "Пользователь"
         verbose_name_plural = "Пользователи"
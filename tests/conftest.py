@@ -1,8 +1,12 @@
 import os
 import sys
 
+import pytest
+from django.core.cache import cache
 from django.utils.version import get_version
 
+from api.throttles import get_store
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(BASE_DIR)
 
@@ -33,3 +37,9 @@ assert get_version() < '4.0.0', 'Пожалуйста, используйте в
 pytest_plugins = [
     'tests.fixtures.fixture_user',
 ]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    get_store().clear()
@@ -0,0 +1,68 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleFacetsAPI:
+
+    FACETS_URL = '/api/v1/titles/facets/'
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_facets_not_auth(self, client, admin_client):
+        create_titles(admin_client)
+        response = client.get(self.FACETS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что GET-запрос неавторизованного пользователя к '
+            f'`{self.FACETS_URL}` возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        genres = {item['slug']: item['count'] for item in data['genre']}
+        assert genres == {'horror': 1, 'comedy': 1, 'drama': 1}, (
+            f'Проверьте, что ответ на GET-запрос к `{self.FACETS_URL}` '
+            'содержит количество произведений в каждом жанре.'
+        )
+        categories = {item['slug']: item['count'] for item in data['category']}
+        assert categories == {'films': 1, 'books': 1}, (
+            f'Проверьте, что ответ на GET-запрос к `{self.FACETS_URL}` '
+            'содержит количество произведений в каждой категории.'
+        )
+        assert data['year'] == [
+            {'year_from': 1980, 'year_to': 1989, 'count': 2}
+        ], (
+            f'Проверьте, что ответ на GET-запрос к `{self.FACETS_URL}` '
+            'содержит количество произведений по десятилетиям.'
+        )
+
+    def test_02_facets_filtered(self, client, admin_client):
+        create_titles(admin_client)
+        response = client.get(f'{self.FACETS_URL}?category=books')
+        data = response.json()
+        assert [item['slug'] for item in data['genre']] == ['drama'], (
+            f'Проверьте, что GET-запрос к `{self.FACETS_URL}` учитывает '
+            'фильтры произведений.'
+        )
+
+    def test_03_facets_cache_invalidation(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        client.get(self.FACETS_URL)
+        admin_client.patch(
+            f'{self.TITLES_URL}{titles[0]["id"]}/', data={'genre': ['drama']}
+        )
+        data = client.get(self.FACETS_URL).json()
+        genres = {item['slug']: item['count'] for item in data['genre']}
+        assert genres == {'drama': 2}, (
+            f'Проверьте, что кеш `{self.FACETS_URL}` сбрасывается при '
+            'изменении жанров произведения.'
+        )
+
+    def test_04_facets_fuzzy(self, client, admin_client):
+        create_titles(admin_client)
+        client.get(self.FACETS_URL)
+        data = client.get(self.FACETS_URL, {'fuzzy': 'крепкий арешек'}).json()
+        assert [item['slug'] for item in data['genre']] == ['drama'], (
+            f'Проверьте, что GET-запрос к `{self.FACETS_URL}` учитывает '
+            'нечёткий поиск `?fuzzy=` и не отдаёт общие счётчики из кеша.'
+        )
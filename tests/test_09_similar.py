@@ -0,0 +1,80 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09SimilarTitlesAPI:
+
+    SIMILAR_URL_TEMPLATE = '/api/v1/titles/{title_id}/similar/'
+
+    def test_01_similar_titles(self, client, admin_client, user_client,
+                               moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get(
+            self.SIMILAR_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что GET-запрос неавторизованного пользователя к '
+            f'`{self.SIMILAR_URL_TEMPLATE}` возвращает ответ со статусом 200.'
+        )
+        assert response.json() == [], (
+            'Проверьте, что до расчёта рекомендаций '
+            f'`{self.SIMILAR_URL_TEMPLATE}` возвращает пустой список.'
+        )
+
+        for title, scores in zip(titles, ((9, 2), (8, 3))):
+            create_single_review(user_client, title['id'], 'text', scores[0])
+            create_single_review(
+                moderator_client, title['id'], 'text', scores[1]
+            )
+        call_command('compute_similar_titles', stdout=StringIO())
+
+        response = client.get(
+            self.SIMILAR_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        )
+        assert [title['id'] for title in response.json()] == [
+            titles[1]['id']
+        ], (
+            f'Проверьте, что `{self.SIMILAR_URL_TEMPLATE}` возвращает '
+            'произведения, которые оценили те же пользователи.'
+        )
+
+    def test_02_similar_titles_not_found(self, client):
+        response = client.get(self.SIMILAR_URL_TEMPLATE.format(title_id=1))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            f'Проверьте, что GET-запрос к `{self.SIMILAR_URL_TEMPLATE}` для '
+            'несуществующего произведения возвращает ответ со статусом 404.'
+        )
+
+    def test_03_batches_bounded_by_cells(self, client, admin_client,
+                                         user_client, moderator_client,
+                                         monkeypatch):
+        monkeypatch.setattr(
+            'reviews.management.commands.compute_similar_titles.'
+            'SIMILAR_TITLES_SCORE_CELLS', 1
+        )
+        titles, _, _ = create_titles(admin_client)
+        for title, scores in zip(titles, ((9, 2), (8, 3))):
+            create_single_review(user_client, title['id'], 'text', scores[0])
+            create_single_review(
+                moderator_client, title['id'], 'text', scores[1]
+            )
+        out = StringIO()
+        call_command('compute_similar_titles', stdout=out)
+        assert out.getvalue().count('Обработано произведений') == len(
+            titles
+        ), (
+            'Проверьте, что размер пакета `compute_similar_titles` '
+            'ограничен числом ячеек плотных матриц.'
+        )
+        response = client.get(
+            self.SIMILAR_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        )
+        assert [title['id'] for title in response.json()] == [
+            titles[1]['id']
+        ]
@@ -0,0 +1,52 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10RecommendationsAPI:
+
+    RECOMMENDATIONS_URL = '/api/v1/users/me/recommendations/'
+
+    def test_01_recommendations_not_auth(self, client):
+        response = client.get(self.RECOMMENDATIONS_URL)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что GET-запрос неавторизованного пользователя к '
+            f'`{self.RECOMMENDATIONS_URL}` возвращает ответ со статусом 401.'
+        )
+
+    def test_02_recommendations(self, settings, tmp_path, admin_client,
+                                user_client, moderator_client):
+        settings.RECOMMENDATIONS_MODEL_PATH = tmp_path / 'model.npz'
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'text', 8)
+        for title in titles:
+            create_single_review(moderator_client, title['id'], 'text', 7)
+        call_command('compute_recommendations', stdout=StringIO())
+
+        response = user_client.get(self.RECOMMENDATIONS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что GET-запрос пользователя к '
+            f'`{self.RECOMMENDATIONS_URL}` возвращает ответ со статусом 200.'
+        )
+        assert [title['id'] for title in response.json()] == [
+            titles[1]['id']
+        ], (
+            f'Проверьте, что `{self.RECOMMENDATIONS_URL}` возвращает только '
+            'произведения, на которые пользователь ещё не оставил отзыв.'
+        )
+
+        create_single_review(user_client, titles[1]['id'], 'text', 6)
+        call_command(
+            'compute_recommendations', '--incremental',
+            stdout=StringIO()
+        )
+        response = user_client.get(self.RECOMMENDATIONS_URL)
+        assert response.json() == [], (
+            'Проверьте, что инкрементальный пересчёт обновляет рекомендации '
+            'пользователей с новыми отзывами.'
+        )
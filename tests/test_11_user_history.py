@@ -0,0 +1,74 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11UserHistoryAPI:
+
+    USER_REVIEWS_URL_TEMPLATE = '/api/v1/users/{username}/reviews/'
+    USER_COMMENTS_URL_TEMPLATE = '/api/v1/users/{username}/comments/'
+
+    def test_01_history_permissions(self, client, user_client, user):
+        for template in (self.USER_REVIEWS_URL_TEMPLATE,
+                         self.USER_COMMENTS_URL_TEMPLATE):
+            url = template.format(username=user.username)
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+                'Проверьте, что GET-запрос неавторизованного пользователя к '
+                f'`{template}` возвращает ответ со статусом 401.'
+            )
+            response = user_client.get(url)
+            assert response.status_code == HTTPStatus.FORBIDDEN, (
+                'Проверьте, что GET-запрос пользователя с ролью `user` к '
+                f'`{template}` возвращает ответ со статусом 403.'
+            )
+
+    def test_02_history_admin(self, admin_client, user_client, user,
+                              moderator_client, moderator):
+        author_map = {user: user_client, moderator: moderator_client}
+        comments, reviews, titles = create_comments(admin_client, author_map)
+
+        response = admin_client.get(
+            self.USER_REVIEWS_URL_TEMPLATE.format(username=user.username)
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что GET-запрос администратора к '
+            f'`{self.USER_REVIEWS_URL_TEMPLATE}` возвращает ответ со '
+            'статусом 200.'
+        )
+        data = response.json()
+        assert 'next' in data and 'count' not in data, (
+            f'Проверьте, что для `{self.USER_REVIEWS_URL_TEMPLATE}` '
+            'настроена курсорная пагинация.'
+        )
+        assert [review['id'] for review in data['results']] == [
+            reviews[0]['id']
+        ], (
+            f'Проверьте, что `{self.USER_REVIEWS_URL_TEMPLATE}` возвращает '
+            'только отзывы указанного пользователя.'
+        )
+        assert data['results'][0]['title'] == titles[0]['name'], (
+            f'Проверьте, что `{self.USER_REVIEWS_URL_TEMPLATE}` возвращает '
+            'название произведения.'
+        )
+
+        response = admin_client.get(
+            self.USER_COMMENTS_URL_TEMPLATE.format(username=moderator.username)
+        )
+        data = response.json()
+        assert len(data['results']) == 1, (
+            f'Проверьте, что `{self.USER_COMMENTS_URL_TEMPLATE}` возвращает '
+            'только комментарии указанного пользователя.'
+        )
+        comment = data['results'][0]
+        assert comment['id'] == comments[1]['id'], (
+            f'Проверьте, что `{self.USER_COMMENTS_URL_TEMPLATE}` возвращает '
+            'только комментарии указанного пользователя.'
+        )
+        assert comment['title'] == titles[0]['name'], (
+            f'Проверьте, что `{self.USER_COMMENTS_URL_TEMPLATE}` возвращает '
+            'название произведения.'
+        )
@@ -0,0 +1,105 @@
+from http import HTTPStatus
+
+import pytest
+from django.db.transaction import TransactionManagementError
+
+from api.views import bulk_create_with_ids
+from reviews.models import Genre
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12BulkReviewsAPI:
+
+    BULK_REVIEWS_URL = '/api/v1/bulk/reviews/'
+    BULK_COMMENTS_URL = '/api/v1/bulk/comments/'
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def test_01_bulk_permissions(self, client, user_client):
+        for url in (self.BULK_REVIEWS_URL, self.BULK_COMMENTS_URL):
+            response = client.post(url)
+            assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+                'Проверьте, что POST-запрос неавторизованного пользователя к '
+                f'`{url}` возвращает ответ со статусом 401.'
+            )
+            response = user_client.post(url, data=[], format='json')
+            assert response.status_code == HTTPStatus.FORBIDDEN, (
+                'Проверьте, что POST-запрос пользователя с ролью `user` к '
+                f'`{url}` возвращает ответ со статусом 403.'
+            )
+
+    def test_02_bulk_reviews(self, admin_client, user_client, user,
+                             moderator):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'text', 10)
+        data = [
+            {'title': titles[0]['id'], 'author': moderator.username,
+             'text': 'legacy', 'score': 6},
+            {'title': titles[1]['id'], 'author': moderator.username,
+             'text': 'legacy', 'score': 3},
+            {'title': titles[0]['id'], 'author': user.username,
+             'text': 'duplicate', 'score': 1},
+            {'title': titles[1]['id'], 'author': 'nobody',
+             'text': 'legacy', 'score': 5},
+            {'title': titles[1]['id'], 'author': user.username,
+             'text': 'legacy', 'score': 11},
+        ]
+        response = admin_client.post(
+            self.BULK_REVIEWS_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.MULTI_STATUS, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.BULK_REVIEWS_URL}` с частично некорректными данными '
+            'возвращает ответ со статусом 207.'
+        )
+        report = response.json()
+        assert report['created'] == 2, (
+            f'Проверьте, что `{self.BULK_REVIEWS_URL}` создаёт корректные '
+            'отзывы.'
+        )
+        assert [error['index'] for error in report['errors']] == [3, 4], (
+            f'Проверьте, что `{self.BULK_REVIEWS_URL}` возвращает ошибки '
+            'для каждого некорректного элемента.'
+        )
+        assert [conflict['index'] for conflict in report['conflicts']] == [
+            2
+        ], (
+            f'Проверьте, что `{self.BULK_REVIEWS_URL}` сообщает о повторных '
+            'отзывах пользователя на произведение.'
+        )
+        title = admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        ).json()
+        assert title['rating'] == 8, (
+            f'Проверьте, что после загрузки через `{self.BULK_REVIEWS_URL}` '
+            'рейтинг произведения пересчитывается.'
+        )
+
+    def test_03_bulk_comments(self, admin_client, user_client, user):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'text', 10
+        ).json()
+        data = [
+            {'review': review['id'], 'author': user.username, 'text': 'a'},
+            {'review': review['id'], 'author': user.username, 'text': 'b'},
+        ]
+        response = admin_client.post(
+            self.BULK_COMMENTS_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.BULK_COMMENTS_URL}` с корректными данными возвращает '
+            'ответ со статусом 201.'
+        )
+        response = admin_client.get(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+            'comments/'
+        )
+        assert response.json()['count'] == 2, (
+            f'Проверьте, что `{self.BULK_COMMENTS_URL}` создаёт комментарии.'
+        )
+
+    def test_04_bulk_create_with_ids_requires_transaction(self):
+        with pytest.raises(TransactionManagementError):
+            bulk_create_with_ids(Genre, [Genre(name='Драма', slug='drama')])
@@ -0,0 +1,94 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13CatalogImportAPI:
+
+    CATALOG_URL = '/api/v1/bulk/catalog/'
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_catalog_import_permissions(self, client, user_client):
+        response = client.post(self.CATALOG_URL)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что POST-запрос неавторизованного пользователя к '
+            f'`{self.CATALOG_URL}` возвращает ответ со статусом 401.'
+        )
+        response = user_client.post(self.CATALOG_URL, data={}, format='json')
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что POST-запрос пользователя с ролью `user` к '
+            f'`{self.CATALOG_URL}` возвращает ответ со статусом 403.'
+        )
+
+    def test_02_catalog_import(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        data = {
+            'categories': [
+                {'name': 'Музыка', 'slug': 'music'},
+                {'name': 'Фильм', 'slug': 'films'},
+            ],
+            'genres': [
+                {'name': 'Рок', 'slug': 'rock'},
+                {'name': 'Драма', 'slug': 'drama'},
+                {'name': 'Без slug'},
+            ],
+            'titles': [
+                {'name': 'Back in Black', 'year': 1980, 'category': 'music',
+                 'genre': ['rock']},
+                {'id': titles[0]['id'], 'name': 'Терминатор 2', 'year': 1991,
+                 'category': 'films', 'genre': ['drama', 'rock']},
+                {'name': 'Неизвестный жанр', 'year': 2000,
+                 'genre': ['unknown']},
+            ],
+        }
+        response = admin_client.post(
+            self.CATALOG_URL, data=data, format='json'
+        )
+        assert response.status_code == HTTPStatus.MULTI_STATUS, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.CATALOG_URL}` с частично некорректными данными '
+            'возвращает ответ со статусом 207.'
+        )
+        report = response.json()
+        assert [row['status'] for row in report['categories']] == [
+            'created', 'unchanged'
+        ], (
+            f'Проверьте, что `{self.CATALOG_URL}` создаёт новые категории '
+            'и не изменяет существующие без необходимости.'
+        )
+        assert [row['status'] for row in report['genres']] == [
+            'created', 'unchanged', 'error'
+        ], (
+            f'Проверьте, что `{self.CATALOG_URL}` возвращает результат '
+            'по каждому жанру.'
+        )
+        assert [row['status'] for row in report['titles']] == [
+            'created', 'updated', 'error'
+        ], (
+            f'Проверьте, что `{self.CATALOG_URL}` возвращает результат '
+            'по каждому произведению.'
+        )
+
+        created = admin_client.get(
+            f'{self.TITLES_URL}{report["titles"][0]["id"]}/'
+        ).json()
+        assert created['name'] == 'Back in Black', (
+            f'Проверьте, что `{self.CATALOG_URL}` возвращает идентификаторы '
+            'созданных произведений.'
+        )
+        assert created['category']['slug'] == 'music', (
+            f'Проверьте, что `{self.CATALOG_URL}` сохраняет категорию '
+            'произведения.'
+        )
+        updated = admin_client.get(
+            f'{self.TITLES_URL}{titles[0]["id"]}/'
+        ).json()
+        assert updated['year'] == 1991 and sorted(
+            genre['slug'] for genre in updated['genre']
+        ) == ['drama', 'rock'], (
+            f'Проверьте, что `{self.CATALOG_URL}` обновляет существующие '
+            'произведения и их жанры.'
+        )
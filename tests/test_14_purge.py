@@ -0,0 +1,237 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.jobs import run_pending_jobs
+from reviews.models import Comment, Review, Title
+from tests.utils import (create_single_comment, create_single_review,
+                         create_titles)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14PurgeAPI:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+    JOB_DETAIL_URL_TEMPLATE = '/api/v1/jobs/{job_id}/'
+
+    def test_01_title_purge(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(user_client, title_id, 'text', 7).json()
+        create_single_comment(user_client, title_id, review['id'], 'text')
+
+        response = admin_client.delete(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT, (
+            'Проверьте, что DELETE-запрос администратора к произведению '
+            'возвращает ответ со статусом 204.'
+        )
+        job_id = response.headers.get('X-Job-Id')
+        assert job_id, (
+            'Проверьте, что ответ на удаление произведения содержит '
+            'заголовок `X-Job-Id` с номером фоновой задачи.'
+        )
+        response = admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что удалённое произведение сразу пропадает из выдачи.'
+        )
+        assert Review.all_objects.filter(title_id=title_id).exists()
+
+        job_url = self.JOB_DETAIL_URL_TEMPLATE.format(job_id=job_id)
+        response = user_client.get(job_url)
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            f'Проверьте, что `{job_url}` недоступен пользователю с ролью '
+            '`user`.'
+        )
+        assert admin_client.get(job_url).json()['status'] == 'pending'
+
+        assert run_pending_jobs() == 1
+        assert not Title.all_objects.filter(pk=title_id).exists()
+        assert not Review.all_objects.filter(title_id=title_id).exists()
+        assert not Comment.objects.filter(review_id=review['id']).exists()
+        job = admin_client.get(job_url).json()
+        assert job['status'] == 'done', (
+            'Проверьте, что после выполнения очистки задача '
+            'получает статус `done`.'
+        )
+        assert job['processed'] == job['total'] == 3, (
+            'Проверьте, что задача очистки отражает прогресс удаления.'
+        )
+
+    def test_02_review_purge_updates_rating(self, admin_client, user_client,
+                                            moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(user_client, title_id, 'text', 2).json()
+        create_single_review(moderator_client, title_id, 'text', 8)
+
+        response = admin_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert 'X-Job-Id' in response.headers
+        title = admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        ).json()
+        assert title['rating'] == 8, (
+            'Проверьте, что рейтинг произведения пересчитывается '
+            'сразу после удаления отзыва.'
+        )
+        run_pending_jobs()
+        assert not Review.all_objects.filter(pk=review['id']).exists()
+
+    def test_03_category_detach(self, admin_client, settings):
+        settings.PURGE_BATCH_SIZE = 1
+        titles, _, _ = create_titles(admin_client)
+        slug = titles[0]['category']
+        sequel = dict(titles[0], name='Терминатор 2', year=1991)
+        del sequel['id']
+        attached = [
+            titles[0]['id'],
+            admin_client.post('/api/v1/titles/', data=sequel).json()['id'],
+        ]
+        response = admin_client.delete(f'/api/v1/categories/{slug}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        job_url = self.JOB_DETAIL_URL_TEMPLATE.format(
+            job_id=response.headers['X-Job-Id']
+        )
+        response = admin_client.post(
+            '/api/v1/categories/', data={'name': 'Новая', 'slug': slug}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что слаг удаляемой категории нельзя занять, '
+            'пока фоновая задача её не очистила.'
+        )
+        response = admin_client.post('/api/v1/bulk/catalog/', data={
+            'categories': [{'name': 'Новая', 'slug': slug}]
+        }, format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'slug' in response.json()['categories'][0]['errors'], (
+            'Проверьте, что импорт не занимает слаг удаляемой категории.'
+        )
+        title = admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=attached[0])
+        ).json()
+        assert title['category'] is None, (
+            'Проверьте, что удалённая категория сразу пропадает '
+            'из выдачи произведений.'
+        )
+        response = admin_client.get(f'/api/v1/titles/?category={slug}')
+        assert response.json()['count'] == 0, (
+            'Проверьте, что фильтр по категории не находит произведения '
+            'удалённой категории.'
+        )
+
+        run_pending_jobs()
+        for title_id in attached:
+            title = admin_client.get(
+                self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+            ).json()
+            assert title['category'] is None, (
+                'Проверьте, что после удаления категории произведения '
+                'отвязываются от неё.'
+            )
+        job = admin_client.get(job_url).json()
+        assert job['status'] == 'done'
+        assert job['processed'] == job['total'] == len(attached) + 1, (
+            'Проверьте, что отвязка произведений выполняется пачками '
+            'с учётом прогресса.'
+        )
+
+    def test_04_user_delete_hides_reviews(self, admin_client, user_client,
+                                          user, moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(user_client, title_id, 'text', 2).json()
+        other = create_single_review(
+            moderator_client, title_id, 'text', 8
+        ).json()
+        create_single_comment(user_client, title_id, other['id'], 'text')
+
+        response = admin_client.delete(f'/api/v1/users/{user.username}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        reviews_url = f'/api/v1/titles/{title_id}/reviews/'
+        assert [
+            item['id'] for item in admin_client.get(reviews_url).json()[
+                'results'
+            ]
+        ] == [other['id']], (
+            'Проверьте, что отзывы удалённого пользователя сразу '
+            'пропадают из выдачи.'
+        )
+        assert admin_client.get(
+            f'{reviews_url}{other["id"]}/comments/'
+        ).json()['count'] == 0, (
+            'Проверьте, что комментарии удалённого пользователя сразу '
+            'пропадают из выдачи.'
+        )
+        title = admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        ).json()
+        assert title['rating'] == 8, (
+            'Проверьте, что отзывы удалённого пользователя сразу '
+            'перестают учитываться в рейтинге.'
+        )
+
+        response = admin_client.post('/api/v1/users/', data={
+            'username': user.username, 'email': 'new@yamdb.fake'
+        })
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что имя удалённого пользователя нельзя занять, '
+            'пока фоновая задача его не очистила.'
+        )
+        response = admin_client.post('/api/v1/users/', data={
+            'username': 'new_user', 'email': user.email
+        })
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+        run_pending_jobs()
+        assert not Review.all_objects.filter(pk=review['id']).exists()
+        assert admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        ).json()['rating'] == 8
+
+    def test_05_review_again_after_delete(self, admin_client, user_client,
+                                          user):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        reviews_url = f'/api/v1/titles/{title_id}/reviews/'
+        review = create_single_review(user_client, title_id, 'text', 2).json()
+        response = user_client.delete(f'{reviews_url}{review["id"]}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+
+        response = user_client.post(
+            reviews_url, data={'text': 'again', 'score': 9}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что новый отзыв на произведение, удалённый отзыв '
+            'на которое ещё не очищен, отклоняется со статусом 400.'
+        )
+        response = admin_client.post('/api/v1/bulk/reviews/', data=[
+            {'title': title_id, 'author': user.username,
+             'text': 'again', 'score': 9},
+        ], format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что массовая загрузка возвращает конфликт для '
+            'отзыва, удалённый предшественник которого ещё не очищен.'
+        )
+        assert [
+            conflict['constraint'] for conflict in response.json()['conflicts']
+        ] == ['unique_review']
+
+        run_pending_jobs()
+        response = user_client.post(
+            reviews_url, data={'text': 'again', 'score': 9}
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что после очистки удалённого отзыва можно '
+            'оставить новый.'
+        )
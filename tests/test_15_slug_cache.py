@@ -0,0 +1,94 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Category, Genre
+from reviews.slugs import _maps, get_slug_map
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15SlugCache:
+
+    TITLES_URL = '/api/v1/titles/'
+    GENRES_URL = '/api/v1/genres/'
+
+    def post_title(self, admin_client, category, genres):
+        data = {
+            'name': 'Поле чудес', 'year': 1990,
+            'category': category, 'genre': genres,
+        }
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.post(
+                self.TITLES_URL, data=data, format='json'
+            )
+        return response, len(context.captured_queries)
+
+    def test_01_queries_do_not_depend_on_genres(self, admin_client):
+        categories = create_categories(admin_client)
+        genres = [genre['slug'] for genre in create_genre(admin_client)]
+        self.post_title(admin_client, categories[0]['slug'], genres[:1])
+        response, one_genre = self.post_title(
+            admin_client, categories[0]['slug'], genres[:1]
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response, all_genres = self.post_title(
+            admin_client, categories[0]['slug'], genres
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert all_genres == one_genre, (
+            'Проверьте, что количество запросов при создании произведения '
+            'не зависит от количества переданных жанров.'
+        )
+
+    def test_02_map_follows_changes(self, admin_client):
+        categories = create_categories(admin_client)
+        create_genre(admin_client)
+        category = categories[0]['slug']
+        admin_client.post(
+            self.GENRES_URL, data={'name': 'Вестерн', 'slug': 'western'}
+        )
+        response, _ = self.post_title(admin_client, category, ['western'])
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что только что созданный жанр можно сразу '
+            'использовать при создании произведения.'
+        )
+        admin_client.delete(f'{self.GENRES_URL}western/')
+        response, _ = self.post_title(admin_client, category, ['western'])
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что удалённый жанр нельзя указать '
+            'при создании произведения.'
+        )
+
+    def test_03_map_follows_other_processes(self, admin_client):
+        categories = create_categories(admin_client)
+        create_genre(admin_client)
+        category = categories[0]['slug']
+        admin_client.post(
+            self.GENRES_URL, data={'name': 'Вестерн', 'slug': 'western'}
+        )
+        response, _ = self.post_title(admin_client, category, ['western'])
+        assert response.status_code == HTTPStatus.CREATED
+        stale = _maps[Genre]
+        admin_client.delete(f'{self.GENRES_URL}western/')
+        # Словарь другого процесса, который не получил сброс.
+        _maps[Genre] = stale
+        response, _ = self.post_title(admin_client, category, ['western'])
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что словарь слагов перечитывается после изменения '
+            'жанров в другом процессе.'
+        )
+        admin_client.post('/api/v1/categories/', data={
+            'name': 'Архив', 'slug': 'archive'
+        })
+        get_slug_map(Category)
+        stale = _maps[Category]
+        admin_client.delete('/api/v1/categories/archive/')
+        _maps[Category] = stale
+        response, _ = self.post_title(admin_client, 'archive', ['western'])
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что удалённую категорию нельзя указать '
+            'при создании произведения.'
+        )
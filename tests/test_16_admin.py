@@ -0,0 +1,55 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+
+from reviews import paginators
+from reviews.models import Title
+from reviews.paginators import EstimatedCountPaginator
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16Admin:
+
+    CHANGELIST_URLS = (
+        '/admin/reviews/title/',
+        '/admin/reviews/review/',
+        '/admin/reviews/comment/',
+        '/admin/users/userprofile/',
+    )
+
+    def test_01_changelists(self, client, admin_client, user_superuser,
+                            user, user_client):
+        create_reviews(admin_client, {user: user_client})
+        client.force_login(user_superuser)
+        for url in self.CHANGELIST_URLS:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что страница `{url}` админки открывается.'
+            )
+            response = client.get(url, {'q': user.username})
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что поиск на странице `{url}` работает.'
+            )
+
+    def test_02_estimated_count(self, admin_client, monkeypatch):
+        create_reviews(admin_client, {})
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+            cursor.execute(
+                'UPDATE sqlite_stat1 SET stat = %s WHERE tbl = %s',
+                ['1000000 1', Title._meta.db_table]
+            )
+        monkeypatch.setattr(paginators, 'ADMIN_EXACT_COUNT_LIMIT', 10)
+        assert EstimatedCountPaginator(Title.objects.all(), 10).count == (
+            1000000
+        ), (
+            'Проверьте, что для нефильтрованного списка количество '
+            'берётся из статистики СУБД.'
+        )
+        filtered = Title.objects.filter(year=1984)
+        assert EstimatedCountPaginator(filtered, 10).count == 1, (
+            'Проверьте, что для отфильтрованного списка выполняется '
+            'точный подсчёт.'
+        )
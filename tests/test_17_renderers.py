@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from http import HTTPStatus
+from io import BytesIO
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+from tests.utils import create_titles
+
+
+class Test17Renderers:
+
+    DATA = {
+        'name': 'Жизнь и судьба',
+        'detail': gettext_lazy('Not found.'),
+        'pub_date': datetime(2020, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        'score': Decimal('7.5'),
+        'genre': ['drama', 'novel'],
+        1: None,
+    }
+
+    def test_01_same_output_as_json_renderer(self):
+        assert FastJSONRenderer().render(self.DATA) == (
+            JSONRenderer().render(self.DATA)
+        ), (
+            'Проверьте, что `FastJSONRenderer` выдаёт тот же JSON, '
+            'что и стандартный `JSONRenderer`.'
+        )
+
+    def test_02_parser(self):
+        body = JSONRenderer().render({'name': 'Тест', 'genre': [1, 2]})
+        assert FastJSONParser().parse(BytesIO(body)) == {
+            'name': 'Тест', 'genre': [1, 2]
+        }
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(BytesIO(b'{"name": NaN}'))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17MessagePack:
+
+    TITLES_URL = '/api/v1/titles/'
+    BULK_REVIEWS_URL = '/api/v1/bulk/reviews/'
+
+    def test_01_same_data_as_json(self, admin_client):
+        msgpack = pytest.importorskip('msgpack')
+        create_titles(admin_client)
+        response = admin_client.get(
+            self.TITLES_URL, HTTP_ACCEPT='application/msgpack'
+        )
+        assert response['Content-Type'] == 'application/msgpack', (
+            'Проверьте, что заголовок `Accept: application/msgpack` '
+            'переключает ответ на формат MessagePack.'
+        )
+        assert msgpack.unpackb(response.content) == (
+            admin_client.get(self.TITLES_URL).json()
+        ), (
+            'Проверьте, что ответ в формате MessagePack содержит '
+            'те же данные, что и JSON.'
+        )
+
+    def test_02_msgpack_request(self, admin_client, user):
+        msgpack = pytest.importorskip('msgpack')
+        titles, _, _ = create_titles(admin_client)
+        body = msgpack.packb([
+            {'title': titles[0]['id'], 'author': user.username,
+             'text': 'Отзыв', 'score': 9},
+        ])
+        response = admin_client.post(
+            self.BULK_REVIEWS_URL, data=body,
+            content_type='application/msgpack'
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что массовая загрузка принимает тело запроса '
+            'в формате MessagePack.'
+        )
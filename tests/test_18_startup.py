@@ -0,0 +1,19 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+
+class Test18Startup:
+
+    def test_01_profile_startup(self):
+        out = StringIO()
+        call_command(
+            'profile_startup', settings_module='api_yamdb.settings',
+            repeat=1, top=100, target=60, stdout=out
+        )
+        report = out.getvalue()
+        assert 'Запуск с api_yamdb.settings' in report, (
+            'Проверьте, что команда `profile_startup` сообщает '
+            'время запуска рабочего процесса.'
+        )
+        assert 'rest_framework' in report
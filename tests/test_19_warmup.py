@@ -0,0 +1,51 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from reviews.constants import FACETS_CACHE_KEY
+from reviews.readcache import catalog_cache_key
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19WarmUp:
+
+    def test_01_default_urls(self, admin_client, user, user_client):
+        _, titles = create_reviews(admin_client, {user: user_client})
+        cache.clear()
+        out = StringIO()
+        call_command('warm_cache', stdout=out)
+        report = out.getvalue()
+        for url in ('/api/v1/titles/', '/api/v1/genres/',
+                    f'/api/v1/titles/{titles[0]["id"]}/reviews/'):
+            assert '200 ' in report and url in report, (
+                f'Проверьте, что команда `warm_cache` прогревает `{url}`.'
+            )
+        assert cache.get(catalog_cache_key(FACETS_CACHE_KEY)) is not None, (
+            'Проверьте, что после прогрева счётчики фасетов '
+            'лежат в кеше.'
+        )
+
+    def test_02_access_log(self, tmp_path):
+        log = tmp_path / 'access.log'
+        log.write_text(
+            '1.2.3.4 - - [19/Oct/2026:10:00:00 +0000] '
+            '"GET /api/v1/genres/ HTTP/1.1" 200 512 "-" "curl"\n' * 2
+            + '1.2.3.4 - - [19/Oct/2026:10:00:01 +0000] '
+            '"GET /api/v1/categories/?search=a HTTP/1.1" 200 64 "-" "curl"\n'
+            + '1.2.3.4 - - [19/Oct/2026:10:00:02 +0000] '
+            '"POST /api/v1/titles/ HTTP/1.1" 201 64 "-" "curl"\n'
+        )
+        out = StringIO()
+        call_command(
+            'warm_cache', access_log=str(log), popular_titles=0, stdout=out
+        )
+        lines = out.getvalue().splitlines()
+        assert lines[0].endswith('/api/v1/genres/')
+        assert lines[1].endswith('/api/v1/categories/?search=a')
+        assert len(lines) == 3, (
+            'Проверьте, что из журнала доступа берутся только '
+            'успешные GET-запросы к API.'
+        )
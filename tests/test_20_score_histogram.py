@@ -0,0 +1,106 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Title
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20ScoreHistogram:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_histogram(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id),
+            {'include': 'score_histogram'}
+        )
+        return response.json()['score_histogram']
+
+    def expected(self, **counts):
+        return {str(score): counts.get(f's{score}', 0)
+                for score in range(1, 11)}
+
+    def test_01_histogram_follows_reviews(self, admin_client, user_client,
+                                          moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        detail = admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        ).json()
+        assert 'score_histogram' not in detail, (
+            'Проверьте, что распределение оценок возвращается только '
+            'по запросу `?include=score_histogram`.'
+        )
+        review = create_single_review(user_client, title_id, 'text', 3)
+        create_single_review(moderator_client, title_id, 'text', 9)
+        assert self.get_histogram(admin_client, title_id) == self.expected(
+            s3=1, s9=1
+        ), (
+            'Проверьте, что распределение оценок обновляется '
+            'при создании отзыва.'
+        )
+        review_url = self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=title_id, review_id=review.json()['id']
+        )
+        user_client.patch(review_url, data={'score': 9})
+        assert self.get_histogram(admin_client, title_id) == self.expected(
+            s9=2
+        ), (
+            'Проверьте, что распределение оценок обновляется '
+            'при изменении оценки.'
+        )
+        user_client.delete(review_url)
+        assert self.get_histogram(admin_client, title_id) == self.expected(
+            s9=1
+        ), (
+            'Проверьте, что распределение оценок обновляется '
+            'при удалении отзыва.'
+        )
+
+    def test_02_rebuild_command(self, admin_client, user_client,
+                                moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'text', 4)
+        create_single_review(moderator_client, titles[0]['id'], 'text', 7)
+        create_single_review(user_client, titles[1]['id'], 'text', 10)
+        Title.objects.update(rating=None, score_histogram=None)
+        call_command('rebuild_score_histograms', stdout=StringIO())
+        assert self.get_histogram(admin_client, titles[0]['id']) == (
+            self.expected(s4=1, s7=1)
+        )
+        assert self.get_histogram(admin_client, titles[1]['id']) == (
+            self.expected(s10=1)
+        )
+        ratings = dict(Title.objects.values_list('id', 'rating'))
+        assert ratings[titles[0]['id']] == 5
+        assert ratings[titles[1]['id']] == 10, (
+            'Проверьте, что команда `rebuild_score_histograms` '
+            'пересчитывает и рейтинг произведений.'
+        )
+
+    def test_03_write_does_not_regroup_reviews(self, admin_client,
+                                               user_client,
+                                               moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(moderator_client, title_id, 'text', 2)
+        with CaptureQueriesContext(connection) as context:
+            create_single_review(user_client, title_id, 'text', 5)
+        assert not any(
+            'GROUP BY' in query['sql'] for query in context.captured_queries
+        ), (
+            'Проверьте, что распределение оценок изменяется на разницу, '
+            'а не пересчитывается по всем отзывам произведения.'
+        )
+        assert self.get_histogram(admin_client, title_id) == self.expected(
+            s2=1, s5=1
+        )
+        assert Title.objects.get(pk=title_id).rating == 3
@@ -0,0 +1,109 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from reviews.models import TitleActivity
+from reviews.trending import compact_activity, record_review_activity
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21Trending:
+
+    TRENDING_URL = '/api/v1/titles/trending/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def totals(self, title_id):
+        activity = TitleActivity.objects.filter(title_id=title_id)
+        return (
+            sum(row.review_count for row in activity),
+            sum(row.score_sum for row in activity),
+        )
+
+    def test_01_counters_follow_reviews(self, admin_client, user_client,
+                                        moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(user_client, title_id, 'text', 4)
+        create_single_review(moderator_client, title_id, 'text', 8)
+        assert self.totals(title_id) == (2, 12), (
+            'Проверьте, что новые отзывы учитываются в счётчиках '
+            'активности произведения.'
+        )
+        review_url = self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=title_id, review_id=review.json()['id']
+        )
+        user_client.patch(review_url, data={'score': 10})
+        assert self.totals(title_id) == (2, 18), (
+            'Проверьте, что изменение оценки учитывается в счётчиках.'
+        )
+        user_client.delete(review_url)
+        assert self.totals(title_id) == (1, 8), (
+            'Проверьте, что удалённый отзыв вычитается из счётчиков.'
+        )
+
+    def test_02_trending_endpoint(self, client, admin_client, user_client,
+                                  moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'text', 3)
+        create_single_review(user_client, titles[1]['id'], 'text', 9)
+        create_single_review(moderator_client, titles[1]['id'], 'text', 7)
+        assert client.get(self.TRENDING_URL).json() == []
+        call_command('refresh_trending', stdout=StringIO())
+        response = client.get(self.TRENDING_URL)
+        assert [title['id'] for title in response.json()] == [
+            titles[1]['id'], titles[0]['id']
+        ], (
+            f'Проверьте, что `{self.TRENDING_URL}` возвращает произведения '
+            'в порядке предрассчитанного рейтинга популярности.'
+        )
+
+    def test_03_compaction(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        now = timezone.now().replace(hour=12, minute=0, second=0,
+                                     microsecond=0)
+        TitleActivity.objects.bulk_create(
+            TitleActivity(
+                title_id=title_id, bucket=now - timedelta(hours=hours),
+                review_count=1, score_sum=5
+            )
+            for hours in (1, 72, 73, 74, 24 * 30)
+        )
+        expired, compacted = compact_activity(now)
+        assert expired == 1, (
+            'Проверьте, что интервалы за пределами окна удаляются.'
+        )
+        assert compacted == 2, (
+            'Проверьте, что старые часовые интервалы одних суток '
+            'сливаются в один суточный.'
+        )
+        buckets = dict(
+            TitleActivity.objects.filter(title_id=title_id)
+            .values_list('bucket', 'review_count')
+        )
+        day = (now - timedelta(hours=72)).replace(hour=0)
+        assert buckets == {now - timedelta(hours=1): 1, day: 3}
+
+    def test_04_decrement_before_compaction(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        now = timezone.now()
+        moment = now - timedelta(hours=50)
+        hour = moment.replace(minute=0, second=0, microsecond=0)
+        # Часовой интервал уже старше границы, но ещё не слит.
+        TitleActivity.objects.create(
+            title_id=title_id, bucket=hour, review_count=1, score_sum=5
+        )
+        record_review_activity(((title_id, moment, -1, -5),))
+        assert self.totals(title_id) == (0, 0), (
+            'Проверьте, что вычитание отзыва не теряется, если его '
+            'часовой интервал ещё не слит в суточный.'
+        )
+        compact_activity(now)
+        assert self.totals(title_id) == (0, 0)
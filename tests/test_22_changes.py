@@ -0,0 +1,141 @@
+from http import HTTPStatus
+
+import pytest
+
+from reviews.jobs import run_pending_jobs
+from tests.utils import (create_single_comment, create_single_review,
+                         create_titles)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22Changes:
+
+    CHANGES_URL = '/api/v1/changes/'
+
+    def read_feed(self, client, since=0, limit=None):
+        params = {'since': since}
+        if limit:
+            params['limit'] = limit
+        response = client.get(self.CHANGES_URL, params)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что `{self.CHANGES_URL}` доступен без авторизации.'
+        )
+        return response.json()
+
+    def read_all(self, client, since=0, limit=None):
+        entries = []
+        while True:
+            page = self.read_feed(client, since, limit)
+            entries.extend(page['results'])
+            since = page['next_cursor']
+            if not page['has_more']:
+                return entries, since
+
+    def test_01_feed_records_changes(self, client, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        entries, cursor = self.read_all(client)
+        assert ('title', title_id, 'create') in {
+            (entry['model'], entry['object_id'], entry['action'])
+            for entry in entries
+        }, 'Проверьте, что создание произведения попадает в ленту изменений.'
+
+        review = create_single_review(user_client, title_id, 'text', 5).json()
+        comment = create_single_comment(
+            user_client, title_id, review['id'], 'text'
+        ).json()
+        admin_client.patch(
+            f'/api/v1/titles/{title_id}/', data={'name': 'Новое название'}
+        )
+        admin_client.delete(f'/api/v1/titles/{title_id}/')
+        entries, _ = self.read_all(client, cursor)
+        actions = [
+            (entry['model'], entry['object_id'], entry['action'])
+            for entry in entries
+        ]
+        assert actions[:2] == [
+            ('review', review['id'], 'create'),
+            ('comment', comment['id'], 'create'),
+        ], 'Проверьте, что записи ленты идут в порядке изменений.'
+        assert entries[1]['title_id'] == title_id
+        assert entries[1]['review_id'] == review['id'], (
+            'Проверьте, что запись о комментарии содержит идентификаторы '
+            'отзыва и произведения.'
+        )
+        assert ('title', title_id, 'update') in actions
+        assert actions[-1] == ('title', title_id, 'delete'), (
+            'Проверьте, что пометка произведения удалённым попадает '
+            'в ленту как удаление.'
+        )
+
+        _, cursor = self.read_all(client)
+        run_pending_jobs()
+        entries, _ = self.read_all(client, cursor)
+        assert {
+            (entry['model'], entry['action']) for entry in entries
+        } == {('review', 'delete'), ('comment', 'delete')}, (
+            'Проверьте, что фоновая очистка записывает удаление отзывов '
+            'и комментариев, а произведение повторно не отмечается.'
+        )
+
+    def test_02_bounded_batches(self, client, admin_client):
+        create_titles(admin_client)
+        everything, last = self.read_all(client)
+        page = self.read_feed(client, limit=2)
+        assert len(page['results']) == 2 and page['has_more'], (
+            'Проверьте, что лента отдаёт не больше `limit` записей.'
+        )
+        entries, cursor = self.read_all(client, limit=2)
+        assert entries == everything and cursor == last, (
+            'Проверьте, что постраничное чтение по курсору '
+            'возвращает все записи ровно по одному разу.'
+        )
+        page = self.read_feed(client, since=last)
+        assert page['results'] == [] and page['next_cursor'] == last
+        response = client.get(self.CHANGES_URL, {'since': 'abc'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_03_bulk_loads_are_recorded(self, client, admin_client):
+        _, cursor = self.read_all(client)
+        response = admin_client.post(
+            '/api/v1/bulk/catalog/',
+            data={
+                'categories': [{'name': 'Кино', 'slug': 'kino'}],
+                'genres': [{'name': 'Драма', 'slug': 'drama'}],
+                'titles': [{
+                    'name': 'Сталкер', 'year': 1979,
+                    'category': 'kino', 'genre': ['drama'],
+                }],
+            },
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        title_id = response.json()['titles'][0]['id']
+        entries, _ = self.read_all(client, cursor)
+        assert [
+            (entry['model'], entry['action'], entry['slug'])
+            for entry in entries
+        ] == [
+            ('category', 'create', 'kino'),
+            ('genre', 'create', 'drama'),
+            ('title', 'create', ''),
+        ], 'Проверьте, что импорт каталога записывается в ленту изменений.'
+        assert entries[-1]['object_id'] == title_id
+
+    def test_04_genre_delete_updates_titles(self, client, admin_client):
+        titles, _, genres = create_titles(admin_client)
+        _, cursor = self.read_all(client)
+        admin_client.delete(f'/api/v1/genres/{genres[0]["slug"]}/')
+        entries, _ = self.read_all(client, cursor)
+        actions = {
+            (entry['model'], entry['object_id'], entry['action'])
+            for entry in entries
+        }
+        assert ('title', titles[0]['id'], 'update') in actions, (
+            'Проверьте, что удаление жанра отмечает в ленте изменение '
+            'его произведений.'
+        )
+        assert ('title', titles[1]['id'], 'update') not in actions
+        assert ('genre', 'delete') in {
+            (entry['model'], entry['action']) for entry in entries
+        }
@@ -0,0 +1,89 @@
+import threading
+import time
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+from django.db import connection
+
+from reviews.models import IdempotencyKey, Review
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23Idempotency:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    SIGNUP_URL = '/api/v1/auth/signup/'
+
+    def post_review(self, client, title_id, key, score=5):
+        return client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title_id),
+            data={'text': 'text', 'score': score},
+            HTTP_IDEMPOTENCY_KEY=key
+        )
+
+    def test_01_retry_replays_response(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        first = self.post_review(user_client, title_id, 'review-1')
+        assert first.status_code == HTTPStatus.CREATED
+        retry = self.post_review(user_client, title_id, 'review-1')
+        assert retry.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что повтор запроса с тем же `Idempotency-Key` '
+            'возвращает сохранённый ответ, а не ошибку `unique_review`.'
+        )
+        assert retry.json() == first.json()
+        assert retry.headers.get('Idempotent-Replayed') == 'true'
+        assert Review.objects.filter(title_id=title_id).count() == 1
+
+        response = self.post_review(user_client, title_id, 'review-1', 9)
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, (
+            'Проверьте, что ключ идемпотентности нельзя использовать '
+            'для запроса с другим телом.'
+        )
+
+    def test_02_signup_sends_one_email(self, client):
+        data = {'email': 'new@yamdb.fake', 'username': 'new_user'}
+        for _ in range(2):
+            response = client.post(
+                self.SIGNUP_URL, data=data, HTTP_IDEMPOTENCY_KEY='signup-1'
+            )
+            assert response.status_code == HTTPStatus.OK
+        assert len(mail.outbox) == 1, (
+            'Проверьте, что повтор регистрации с тем же ключом '
+            'не отправляет письмо повторно.'
+        )
+
+    def test_03_concurrent_retry_waits(self, admin_client, user_client,
+                                       settings):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        first = self.post_review(user_client, title_id, 'review-2')
+        record = IdempotencyKey.objects.get(key='review-2')
+        IdempotencyKey.objects.filter(pk=record.pk).update(status_code=None)
+
+        settings.IDEMPOTENCY_WAIT_TIMEOUT = 0.2
+        response = self.post_review(user_client, title_id, 'review-2')
+        assert response.status_code == HTTPStatus.CONFLICT, (
+            'Проверьте, что повтор выполняющегося запроса после ожидания '
+            'возвращает ответ со статусом 409.'
+        )
+
+        def finish():
+            time.sleep(0.3)
+            IdempotencyKey.objects.filter(pk=record.pk).update(
+                status_code=HTTPStatus.CREATED
+            )
+            connection.close()
+
+        settings.IDEMPOTENCY_WAIT_TIMEOUT = 5
+        worker = threading.Thread(target=finish)
+        worker.start()
+        response = self.post_review(user_client, title_id, 'review-2')
+        worker.join()
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что параллельный повтор дожидается завершения '
+            'первого запроса и получает его ответ.'
+        )
+        assert response.json() == first.json()
@@ -0,0 +1,111 @@
+import threading
+import time
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+
+from reviews.changes import record_changes
+from reviews.constants import CHANGE_UPDATE
+from reviews.models import Title
+from reviews.readcache import coalesced
+from tests.utils import (create_single_comment, create_single_review,
+                         create_titles)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24ReadCache:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_single_flight(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'value'
+
+        results = []
+        workers = [
+            threading.Thread(
+                target=lambda: results.append(
+                    coalesced('test:single', compute, 60)
+                )
+            )
+            for _ in range(5)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert results == ['value'] * 5
+        assert len(calls) == 1, (
+            'Проверьте, что при одновременных промахах кеша значение '
+            'вычисляется один раз, а остальные запросы ждут результата.'
+        )
+
+    def test_02_stale_while_revalidate(self):
+        assert coalesced('test:stale', lambda: 'old', 0) == 'old'
+        assert coalesced('test:stale', lambda: 'new', 60) == 'old', (
+            'Проверьте, что устаревшее значение отдаётся сразу, '
+            'пока идёт фоновый пересчёт.'
+        )
+        for _ in range(50):
+            if cache.get('test:stale')[1] == 'new':
+                break
+            time.sleep(0.02)
+        assert coalesced('test:stale', lambda: 'newer', 60) == 'new', (
+            'Проверьте, что фоновый пересчёт обновляет значение в кеше.'
+        )
+
+    def test_03_title_list_is_cached(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        client.get(self.TITLES_URL)
+        Title.objects.filter(pk=title_id).update(name='Без сигналов')
+        response = client.get(self.TITLES_URL)
+        assert response.json()['results'][0]['name'] == titles[0]['name'], (
+            'Проверьте, что список произведений отдаётся из кеша.'
+        )
+        response = admin_client.patch(
+            f'{self.TITLES_URL}{title_id}/', data={'name': 'Новое название'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = client.get(self.TITLES_URL)
+        assert response.json()['results'][0]['name'] == 'Новое название', (
+            'Проверьте, что кеш сбрасывается при изменении каталога.'
+        )
+
+    def test_04_other_process_changes(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        client.get(self.TITLES_URL)
+        title = Title.objects.get(pk=titles[0]['id'])
+        # Изменение в другом процессе: локальный кеш не сбрасывается,
+        # но в общем журнале появляется запись.
+        Title.objects.filter(pk=title.pk).update(name='Из другого процесса')
+        record_changes(Title, (title,), CHANGE_UPDATE)
+        response = client.get(self.TITLES_URL)
+        assert response.json()['results'][0]['name'] == (
+            'Из другого процесса'
+        ), (
+            'Проверьте, что кеш каталога сбрасывается при изменениях, '
+            'сделанных другими процессами.'
+        )
+
+    def test_05_comment_keeps_catalog_cached(self, client, admin_client,
+                                             user_client,
+                                             django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(user_client, title_id, 'text', 7).json()
+        client.get('/api/v1/genres/')
+        create_single_comment(user_client, title_id, review['id'], 'text')
+        with django_assert_num_queries(1):
+            client.get('/api/v1/genres/')
+        create_single_review(admin_client, title_id, 'text', 3)
+        response = client.get(f'{self.TITLES_URL}{title_id}/')
+        assert response.json()['rating'] == 5, (
+            'Проверьте, что кеш произведений сбрасывается при изменении '
+            'отзывов, от которых зависит рейтинг.'
+        )
@@ -0,0 +1,86 @@
+import sqlite3
+from http import HTTPStatus
+
+import pytest
+
+from api.throttles import get_store
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Throttling:
+
+    SIGNUP_URL = '/api/v1/auth/signup/'
+    GENRES_URL = '/api/v1/genres/'
+
+    def set_rates(self, settings, **rates):
+        settings.REST_FRAMEWORK = dict(
+            settings.REST_FRAMEWORK,
+            DEFAULT_THROTTLE_RATES=dict(
+                settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], **rates
+            )
+        )
+
+    def test_01_auth_endpoints_limited_by_ip(self, client, settings):
+        self.set_rates(settings, auth='3/min')
+        statuses = [
+            client.post(self.SIGNUP_URL, data={}).status_code
+            for _ in range(4)
+        ]
+        assert statuses == [HTTPStatus.BAD_REQUEST] * 3 + [
+            HTTPStatus.TOO_MANY_REQUESTS
+        ], (
+            'Проверьте, что регистрация ограничена по IP-адресу '
+            'и при исчерпании лимита возвращает статус 429.'
+        )
+        response = client.post(self.SIGNUP_URL, data={})
+        assert int(response.headers['Retry-After']) > 0
+        response = client.post(
+            self.SIGNUP_URL, data={}, REMOTE_ADDR='10.0.0.2'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что лимит считается отдельно для каждого IP-адреса.'
+        )
+
+    def test_02_anonymous_reads_and_users(self, client, user_client,
+                                          settings):
+        self.set_rates(settings, anon_read='2/min', user='3/min')
+        for _ in range(2):
+            assert client.get(self.GENRES_URL).status_code == HTTPStatus.OK
+        assert client.get(self.GENRES_URL).status_code == (
+            HTTPStatus.TOO_MANY_REQUESTS
+        ), 'Проверьте, что чтение без авторизации ограничено по IP-адресу.'
+        statuses = [
+            user_client.get(self.GENRES_URL).status_code for _ in range(4)
+        ]
+        assert statuses == [HTTPStatus.OK] * 3 + [
+            HTTPStatus.TOO_MANY_REQUESTS
+        ], (
+            'Проверьте, что запросы пользователя ограничены отдельной '
+            'корзиной, не связанной с анонимными запросами.'
+        )
+
+    def test_03_bucket_refills(self):
+        store = get_store()
+        assert store.consume('test', 1, 1000)[0]
+        assert not store.consume('test', 1, 0.001)[0]
+        allowed, tokens = store.consume('test', 1, 1e9)
+        assert allowed and tokens == 0, (
+            'Проверьте, что корзина пополняется со временем, '
+            'но не больше своей ёмкости.'
+        )
+
+    def test_04_fails_open_when_store_locked(self, client, settings):
+        get_store().clear()
+        blocker = sqlite3.connect(
+            str(settings.THROTTLE_STORE_PATH), isolation_level=None
+        )
+        blocker.execute('BEGIN IMMEDIATE')
+        try:
+            response = client.get(self.GENRES_URL)
+        finally:
+            blocker.execute('ROLLBACK')
+            blocker.close()
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что при недоступном хранилище ограничений '
+            'запрос пропускается, а не завершается ошибкой.'
+        )
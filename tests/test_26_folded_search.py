@@ -0,0 +1,108 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.filters import FoldedPrefixSearchFilter
+from reviews.models import Category, Genre, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26FoldedSearch:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    GENRES_URL = '/api/v1/genres/'
+    USERS_URL = '/api/v1/users/'
+
+    def search(self, client, url, query):
+        response = client.get(url, {'search': query})
+        return [
+            row.get('slug') or row.get('username')
+            for row in response.json()['results']
+        ]
+
+    def test_01_cyrillic_prefix_ignores_case(self, client, admin_client):
+        admin_client.post(
+            self.CATEGORIES_URL, data={'name': 'Фантастика', 'slug': 'sf'}
+        )
+        admin_client.post(
+            self.CATEGORIES_URL, data={'name': 'Фэнтези', 'slug': 'fantasy'}
+        )
+        admin_client.post(
+            self.GENRES_URL, data={'name': 'Ёлочные сказки', 'slug': 'tree'}
+        )
+        assert self.search(client, self.CATEGORIES_URL, 'фАНТ') == ['sf'], (
+            'Проверьте, что поиск категорий не зависит от регистра '
+            'кириллических букв.'
+        )
+        assert self.search(client, self.CATEGORIES_URL, 'ф') == [
+            'sf', 'fantasy'
+        ]
+        assert self.search(client, self.CATEGORIES_URL, 'тастика') == [], (
+            'Проверьте, что поиск ищет по началу названия.'
+        )
+        assert self.search(client, self.GENRES_URL, 'ЕЛОЧНЫЕ  с') == [
+            'tree'
+        ], (
+            'Проверьте, что при поиске «ё» не отличается от «е», '
+            'а лишние пробелы игнорируются.'
+        )
+
+    def test_02_users_search(self, admin_client, admin):
+        assert self.search(
+            admin_client, self.USERS_URL, admin.username.upper()
+        ) == [admin.username], (
+            'Проверьте, что поиск пользователей не зависит от регистра.'
+        )
+
+    def test_03_prefix_search_uses_index(self):
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {number}', slug=f'genre-{number}')
+            for number in range(500)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        request = Request(APIRequestFactory().get('/', {'search': 'Драма'}))
+        view = type('View', (), {'search_fields': ('name_folded',)})
+        queryset = FoldedPrefixSearchFilter().filter_queryset(
+            request, Genre.objects.all(), view
+        )
+        assert 'INDEX' in queryset.explain(), (
+            'Проверьте, что поиск по префиксу использует индекс.'
+        )
+
+    def test_04_bulk_writes_and_rebuild(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/bulk/catalog/',
+            data={
+                'categories': [{'name': 'КИНО', 'slug': 'movie'}],
+                'genres': [], 'titles': [],
+            },
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert Category.objects.get(slug='movie').name_folded == 'кино'
+        admin_client.post(
+            '/api/v1/bulk/catalog/',
+            data={
+                'categories': [{'name': 'Фильмы', 'slug': 'movie'}],
+                'genres': [], 'titles': [],
+            },
+            format='json'
+        )
+        assert Category.objects.get(slug='movie').name_folded == 'фильмы', (
+            'Проверьте, что импорт каталога обновляет колонку для поиска.'
+        )
+        Category.objects.update(name_folded='')
+        Title.objects.create(name='Старое', year=2000)
+        Title.objects.update(name_folded='')
+        call_command('rebuild_search_columns', stdout=StringIO())
+        assert Category.objects.get(slug='movie').name_folded == 'фильмы'
+        assert Title.objects.get().name_folded == 'старое', (
+            'Проверьте, что команда `rebuild_search_columns` '
+            'заполняет колонки для поиска заново.'
+        )
@@ -0,0 +1,65 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from reviews.fuzzy import fuzzy_search, trigrams
+from reviews.models import Title, TitleTrigram
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27FuzzySearch:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def fuzzy(self, client, query):
+        response = client.get(self.TITLES_URL, {'fuzzy': query})
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_typos_are_tolerated(self, client, admin_client):
+        for name in ('Властелин колец', 'Гарри Поттер',
+                     'The Lord of the Rings', 'Колесо времени'):
+            Title.objects.create(name=name, year=2000)
+        assert self.fuzzy(client, 'властилин калец')[:1] == [
+            'Властелин колец'
+        ], (
+            'Проверьте, что нечёткий поиск находит русское название '
+            'с опечатками.'
+        )
+        assert self.fuzzy(client, 'lord of rngs')[:1] == [
+            'The Lord of the Rings'
+        ], 'Проверьте, что нечёткий поиск находит английское название.'
+        assert self.fuzzy(client, 'zzzz') == [], (
+            'Проверьте, что непохожие названия не попадают в выдачу.'
+        )
+
+    def test_02_index_follows_writes(self, client, admin_client):
+        title = Title.objects.create(name='Мастер и Маргарита', year=1967)
+        assert TitleTrigram.objects.filter(title=title).count() == len(
+            trigrams(title.name)
+        ), 'Проверьте, что триграммы создаются при сохранении произведения.'
+        title.name = 'Собачье сердце'
+        title.save()
+        assert fuzzy_search('Маргарита') == []
+        assert fuzzy_search('собачье сердце') == [title.pk], (
+            'Проверьте, что индекс обновляется при изменении названия.'
+        )
+        response = admin_client.post(
+            '/api/v1/bulk/catalog/',
+            data={
+                'categories': [], 'genres': [],
+                'titles': [{'name': 'Белая гвардия', 'year': 1925,
+                            'genre': []}],
+            },
+            format='json'
+        )
+        title_id = response.json()['titles'][0]['id']
+        assert fuzzy_search('белая гвардея') == [title_id], (
+            'Проверьте, что импорт каталога обновляет триграммный индекс.'
+        )
+
+    def test_03_rebuild_command(self):
+        title = Title.objects.create(name='Тихий Дон', year=1928)
+        TitleTrigram.objects.all().delete()
+        call_command('rebuild_trigram_index', stdout=StringIO())
+        assert fuzzy_search('тихий дон') == [title.pk]
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from reviews.autocomplete import PrefixIndex, autocomplete
+from reviews.models import Title
+from tests.utils import create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28Autocomplete:
+
+    URL = '/api/v1/titles/autocomplete/'
+
+    @pytest.fixture(autouse=True)
+    def fresh_index(self, settings):
+        settings.AUTOCOMPLETE_REFRESH_INTERVAL = 0
+        autocomplete.reset()
+
+    def suggest(self, client, query, **params):
+        response = client.get(self.URL, {'q': query, **params})
+        return [title['name'] for title in response.json()]
+
+    def test_01_prefix_and_popularity(self, client, user_client,
+                                      moderator_client):
+        for name in ('Властелин колец', 'Влюблённый шекспир',
+                     'Колесо времени'):
+            Title.objects.create(name=name, year=2000)
+        popular = Title.objects.get(name='Влюблённый шекспир')
+        create_single_review(user_client, popular.pk, 'text', 8)
+        assert self.suggest(client, 'вЛ') == [
+            'Влюблённый шекспир', 'Властелин колец'
+        ], (
+            'Проверьте, что подсказки ищутся по началу названия без учёта '
+            'регистра, а популярные произведения идут первыми.'
+        )
+        assert self.suggest(client, 'кол') == [
+            'Властелин колец', 'Колесо времени'
+        ], 'Проверьте, что подсказки находятся и по слову в названии.'
+        assert self.suggest(client, 'влюбленный') == ['Влюблённый шекспир']
+        assert self.suggest(client, 'в', limit=1) == ['Влюблённый шекспир']
+        assert self.suggest(client, '') == []
+
+    def test_02_follows_changes(self, client, admin_client):
+        title = Title.objects.create(name='Дюна', year=1965)
+        assert self.suggest(client, 'дю') == ['Дюна']
+        created = Title.objects.create(name='Дюймовочка', year=1835)
+        assert self.suggest(client, 'дю') == ['Дюна', 'Дюймовочка'], (
+            'Проверьте, что новые произведения попадают в подсказки.'
+        )
+        admin_client.patch(
+            f'/api/v1/titles/{title.pk}/', data={'name': 'Солярис'}
+        )
+        admin_client.delete(f'/api/v1/titles/{created.pk}/')
+        assert self.suggest(client, 'дю') == [], (
+            'Проверьте, что переименованные и удалённые произведения '
+            'пропадают из подсказок.'
+        )
+        assert self.suggest(client, 'сол') == ['Солярис']
+
+    def test_03_memory_budget_and_speed(self):
+        index = PrefixIndex(max_keys=3)
+        index.build([(1, 'Редкое', 0), (2, 'Популярное название', 10),
+                     (3, 'Среднее', 5)])
+        assert sorted(index.titles) == [2, 3], (
+            'Проверьте, что при нехватке бюджета в индекс попадают '
+            'самые популярные произведения.'
+        )
+        index = PrefixIndex(max_keys=10 ** 6)
+        index.build(
+            (pk, f'Произведение {pk} том {pk % 7}', pk % 100)
+            for pk in range(50000)
+        )
+        index.lookup('произведение 4', 10)
+        started = time.perf_counter()
+        for prefix in ('произведение 4', 'том 3', 'произведение 1234'):
+            index.lookup(prefix, 10)
+        assert (time.perf_counter() - started) / 3 < 0.005
@@ -0,0 +1,110 @@
+import threading
+import time
+from http import HTTPStatus
+
+import pytest
+
+from reviews.models import Comment, Review
+from reviews.writequeue import write_queue
+from tests.utils import create_single_comment, create_titles
+
+
+WAIT_TIMEOUT = 5
+
+
+def wait_until(condition, message):
+    """Ждёт выполнения условия не дольше `WAIT_TIMEOUT` секунд."""
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, message
+        time.sleep(0.005)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29WriteQueue:
+
+    def test_01_api_writes_through_queue(self, admin_client, user_client,
+                                         settings):
+        settings.WRITE_QUEUE_ENABLED = True
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        writes = write_queue.writes
+        response = user_client.post(
+            f'/api/v1/titles/{title_id}/reviews/',
+            data={'text': 'text', 'score': 7}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        create_single_comment(
+            user_client, title_id, response.json()['id'], 'text'
+        )
+        assert write_queue.writes == writes + 2, (
+            'Проверьте, что при `WRITE_QUEUE_ENABLED` отзывы и комментарии '
+            'записываются через поток записи.'
+        )
+        title = admin_client.get(f'/api/v1/titles/{title_id}/').json()
+        assert title['rating'] == 7, (
+            'Проверьте, что рейтинг пересчитывается после записи '
+            'через очередь.'
+        )
+
+    def test_02_group_commit(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        review = user_client.post(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+            data={'text': 'text', 'score': 5}
+        ).json()
+        author = Review.objects.get(pk=review['id']).author
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait(WAIT_TIMEOUT)
+
+        blocker = threading.Thread(target=write_queue.submit, args=(block,))
+        blocker.start()
+        assert started.wait(WAIT_TIMEOUT), (
+            'Проверьте, что поток записи выполняет записи из очереди.'
+        )
+        results, batches = [], write_queue.batches
+
+        def fail():
+            raise ValueError('Ошибка записи')
+
+        def write(func, **kwargs):
+            try:
+                results.append(write_queue.submit(func, **kwargs))
+            except ValueError as error:
+                results.append(error)
+
+        writers = [
+            threading.Thread(target=write, args=(Comment.objects.create,),
+                             kwargs={'review_id': review['id'],
+                                     'author': author,
+                                     'text': f'Комментарий {number}'})
+            for number in range(5)
+        ]
+        writers.append(threading.Thread(target=write, args=(fail,)))
+        for writer in writers:
+            writer.start()
+        wait_until(
+            lambda: write_queue.queue.qsize() == len(writers),
+            'Проверьте, что записи ставятся в очередь.'
+        )
+        release.set()
+        blocker.join(WAIT_TIMEOUT)
+        for writer in writers:
+            writer.join(WAIT_TIMEOUT)
+        assert not any(
+            thread.is_alive() for thread in (blocker, *writers)
+        ), 'Проверьте, что поток записи отвечает всем отправителям.'
+        assert write_queue.batches - batches == 2, (
+            'Проверьте, что записи, накопившиеся за время фиксации, '
+            'выполняются одной группой.'
+        )
+        assert sum(isinstance(item, ValueError) for item in results) == 1, (
+            'Проверьте, что ошибка записи возвращается её отправителю.'
+        )
+        assert Comment.objects.filter(review_id=review['id']).count() == 5, (
+            'Проверьте, что ошибка одной записи в группе '
+            'не отменяет остальные.'
+        )
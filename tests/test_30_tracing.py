@@ -0,0 +1,140 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews
+
+
+def read_events(path):
+    text = path.read_text(encoding='utf-8')
+    assert text.startswith('[\n'), (
+        'Проверьте, что файл трассировок — JSON-массив формата '
+        'Chrome Trace Event.'
+    )
+    return json.loads(text.rstrip().rstrip(',') + ']')
+
+
+@pytest.mark.django_db(transaction=True)
+class Test30Tracing:
+
+    TRACE_ID = '0123456789abcdef0123456789abcdef'
+
+    @pytest.fixture
+    def trace_path(self, settings, tmp_path):
+        settings.TRACING_ENABLED = True
+        settings.TRACING_SAMPLE_RATE = 0
+        settings.TRACING_ACCEPT_TRACE_ID = True
+        settings.TRACING_OUTPUT_PATH = tmp_path / 'traces.json'
+        return settings.TRACING_OUTPUT_PATH
+
+    def test_01_spans_of_reviews_request(self, admin_client, admin,
+                                         user_client, user, moderator_client,
+                                         trace_path):
+        _, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        assert not trace_path.exists(), (
+            'Проверьте, что при нулевой доле запросы без заголовка '
+            '`X-Trace-Id` не трассируются.'
+        )
+        response = moderator_client.post(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+            data={'text': 'text', 'score': 7},
+            HTTP_X_TRACE_ID=self.TRACE_ID
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert response.headers['X-Trace-Id'] == self.TRACE_ID, (
+            'Проверьте, что идентификатор трассировки возвращается '
+            'в заголовке `X-Trace-Id`.'
+        )
+        events = read_events(trace_path)
+        assert {event['args']['trace_id'] for event in events} == {
+            self.TRACE_ID
+        }
+        assert {event['ph'] for event in events} == {'X'}
+        categories = {event['cat'] for event in events}
+        assert {
+            'request', 'middleware', 'view', 'render',
+            'permission', 'serializer', 'sql'
+        } <= categories, (
+            'Проверьте, что записываются спаны middleware, проверок прав, '
+            'сериализаторов, отрисовки ответа и SQL-запросов.'
+        )
+        names = {event['name'] for event in events}
+        assert {
+            'IsAuthAdminModeratorAuthorOrReadOnly.has_permission',
+            'ReviewSerializer.is_valid',
+            'ReviewSerializer.to_representation',
+            'SELECT', 'INSERT',
+        } <= names
+        request, = (event for event in events if event['cat'] == 'request')
+        for event in events:
+            assert request['ts'] <= event['ts'] and (
+                event['ts'] + event['dur']
+                <= request['ts'] + request['dur'] + 1
+            ), 'Проверьте, что все спаны лежат внутри спана запроса.'
+        sql = [event for event in events if event['cat'] == 'sql']
+        assert all(
+            event['args']['sql'].upper().startswith(event['name'])
+            for event in sql
+        ), 'Проверьте, что в спан SQL-запроса попадает его текст.'
+
+    def test_02_sampling(self, client, trace_path, settings):
+        response = client.get('/api/v1/genres/')
+        assert 'X-Trace-Id' not in response.headers
+        settings.TRACING_SAMPLE_RATE = 1
+        first = client.get('/api/v1/genres/').headers['X-Trace-Id']
+        second = client.get('/api/v1/genres/').headers['X-Trace-Id']
+        assert first != second, (
+            'Проверьте, что каждый трассируемый запрос получает '
+            'свой идентификатор.'
+        )
+        assert {
+            event['args']['trace_id'] for event in read_events(trace_path)
+        } == {first, second}, (
+            'Проверьте, что трассировки дописываются в один файл.'
+        )
+        settings.TRACING_ENABLED = False
+        response = client.get(
+            '/api/v1/genres/', HTTP_X_TRACE_ID=self.TRACE_ID
+        )
+        assert 'X-Trace-Id' not in response.headers, (
+            'Проверьте, что при `TRACING_ENABLED = False` '
+            'запросы не трассируются.'
+        )
+
+    def test_03_trace_id_header_ignored_by_default(self, client, trace_path,
+                                                   settings):
+        settings.TRACING_ACCEPT_TRACE_ID = False
+        response = client.get(
+            '/api/v1/genres/', HTTP_X_TRACE_ID=self.TRACE_ID
+        )
+        assert 'X-Trace-Id' not in response.headers, (
+            'Проверьте, что без `TRACING_ACCEPT_TRACE_ID` заголовок '
+            '`X-Trace-Id` не включает трассировку.'
+        )
+        assert not trace_path.exists()
+
+    def test_04_file_rotation(self, client, trace_path, settings):
+        settings.TRACING_SAMPLE_RATE = 1
+        settings.TRACING_MAX_FILE_SIZE = 1
+        first = client.get('/api/v1/genres/').headers['X-Trace-Id']
+        second = client.get('/api/v1/genres/').headers['X-Trace-Id']
+        backup = trace_path.with_name(trace_path.name + '.1')
+        assert {
+            event['args']['trace_id'] for event in read_events(trace_path)
+        } == {second}, (
+            'Проверьте, что файл больше `TRACING_MAX_FILE_SIZE` '
+            'начинается заново.'
+        )
+        assert {
+            event['args']['trace_id'] for event in read_events(backup)
+        } == {first}, (
+            'Проверьте, что прежний файл трассировок сохраняется '
+            'с суффиксом `.1`.'
+        )
+        client.get('/api/v1/genres/')
+        assert sorted(trace_path.parent.iterdir()) == [
+            trace_path, backup
+        ], 'Проверьте, что на диске не больше двух файлов трассировок.'